@@ -200,7 +200,8 @@ def add_comparison_filter_functions_to_class(cls):
             
             if hasattr(self, 'merged_df') and self.merged_df is not None:
                 # 파라미터별로 그룹화하여 비교
-                grouped = self.merged_df.groupby(["Module", "Part", "ItemName"])
+                # 키 컬럼이 범주형이므로 실제 존재하는 조합만 그룹화 (observed=True)
+                grouped = self.merged_df.groupby(["Module", "Part", "ItemName"], observed=True)
                 
                 comparison_data = []
                 for (module, part, item_name), group in grouped:
@@ -219,14 +220,10 @@ def add_comparison_filter_functions_to_class(cls):
                     if part_filter and part_filter != "All" and part_filter != part:
                         continue
                     
-                    # 각 파일별 값 수집
-                    values = []
-                    for model in getattr(self, 'file_names', []):
-                        model_data = group[group["Model"] == model]
-                        if not model_data.empty:
-                            values.append(str(model_data["ItemValue"].iloc[0]))
-                        else:
-                            values.append("-")
+                    # 각 파일별 값 수집 - 그룹당 한 번 dict로 변환 (역순으로 만들어 파일별 첫 번째 값 유지)
+                    lookup = dict(zip(group["Model"].to_numpy()[::-1], group["ItemValue"].to_numpy()[::-1]))
+                    values = [str(lookup[model]) if model in lookup else "-"
+                              for model in getattr(self, 'file_names', [])]
                     
                     # 값 차이 확인
                     non_empty_values = [v for v in values if v != "-"]
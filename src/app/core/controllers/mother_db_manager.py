@@ -345,6 +345,8 @@ class MotherDBManager:
             
             conn.commit()
             conn.close()
+            # 직접 연결로 쓴 변경도 Default DB 조회 캐시에 반영
+            self.db_schema._mark_modified()
             
         except Exception as e:
             print(f"Mother DB 저장 중 오류: {e}")
@@ -3,6 +3,7 @@
 기본 QC와 향상된 QC 기능을 통합하여 효율적인 검수 시스템 제공
 """
 
+import re
 import pandas as pd
 import numpy as np
 from typing import List, Dict, Tuple, Optional, Any
@@ -11,6 +12,11 @@ from enum import Enum
 import sqlite3
 from datetime import datetime
 
+# 파라미터명의 숫자 구간 추출 패턴 (호출마다 컴파일하지 않도록 모듈 상수로 유지)
+_DIGIT_RUN_RE = re.compile(r'\d+')
+# 파라미터명 허용 문자(문자/숫자/밑줄 및 -.:/ 공백) 이외의 문자 검출 패턴
+_INVALID_PARAM_CHAR_RE = re.compile(r'[^\w\-.:/ ]')
+
 class QCMode(Enum):
     """QC 검수 모드"""
     BASIC = "기본"
@@ -215,12 +221,12 @@ class QCValidator:
         
         # 파라미터 이름 형식 검사
         if 'parameter_name' in df.columns:
-            invalid_params = []
-            for param in df['parameter_name'].unique():
-                if pd.notna(param):
-                    # 특수문자 검사 (일부 허용)
-                    if not all(c.isalnum() or c in '_-.:/ ' for c in str(param)):
-                        invalid_params.append(param)
+            # 특수문자 검사 (일부 허용) - 미리 컴파일한 패턴으로 문자 단위 파이썬 루프 대체
+            has_invalid_char = _INVALID_PARAM_CHAR_RE.search
+            invalid_params = [
+                param for param in df['parameter_name'].unique()
+                if pd.notna(param) and has_invalid_char(str(param))
+            ]
             
             if invalid_params:
                 issues.append(QCIssue(
@@ -356,31 +362,24 @@ class AdvancedQCAnalyzer:
         if 'parameter_name' in df.columns:
             # 연속된 번호 패턴 검사 (예: PARAM_001, PARAM_002, ...)
             params = df['parameter_name'].unique()
-            numbered_params = [p for p in params if any(c.isdigit() for c in str(p))]
             
-            if numbered_params:
-                # 번호 추출 및 누락 검사
-                import re
-                numbers = []
-                for param in numbered_params:
-                    matches = re.findall(r'\d+', str(param))
-                    if matches:
-                        numbers.extend([int(m) for m in matches])
+            # 번호 추출 및 누락 검사 (숫자가 없는 파라미터는 findall 결과가 비어 자동 제외)
+            findall = _DIGIT_RUN_RE.findall
+            numbers = {int(m) for param in params for m in findall(str(param))}
+            
+            if numbers:
+                expected = set(range(min(numbers), max(numbers) + 1))
+                missing = expected - numbers
                 
-                if numbers:
-                    numbers = sorted(set(numbers))
-                    expected = set(range(min(numbers), max(numbers) + 1))
-                    missing = expected - set(numbers)
-                    
-                    if missing:
-                        issues.append(QCIssue(
-                            parameter_name="[패턴] 누락",
-                            issue_type="순서누락",
-                            description=f"번호 시퀀스에서 {len(missing)}개 누락",
-                            severity=SeverityLevel.LOW,
-                            current_value=f"누락된 번호: {sorted(missing)[:5]}",
-                            recommendation="누락된 파라미터를 확인하세요"
-                        ))
+                if missing:
+                    issues.append(QCIssue(
+                        parameter_name="[패턴] 누락",
+                        issue_type="순서누락",
+                        description=f"번호 시퀀스에서 {len(missing)}개 누락",
+                        severity=SeverityLevel.LOW,
+                        current_value=f"누락된 번호: {sorted(missing)[:5]}",
+                        recommendation="누락된 파라미터를 확인하세요"
+                    ))
         
         return issues
     
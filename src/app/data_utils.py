@@ -1,6 +1,8 @@
 # 데이터 처리 유틸리티 함수들
 # manager.py에서 추출된 순수 유틸리티 함수들
 
+import threading
+
 def numeric_sort_key(value):
     """
     숫자 정렬을 위한 키 함수
@@ -165,4 +167,125 @@ def clean_numeric_value(value):
         else:
             return f"{num_val:.4f}".rstrip('0').rstrip('.')
     except (ValueError, TypeError):
-        return str(value) if value is not None else 'N/A'
\ No newline at end of file
+        return str(value) if value is not None else 'N/A'
+
+
+# 비교 뷰에서 항목을 구분하는 키 컬럼
+ITEM_KEY_COLUMNS = ["Module", "Part", "ItemName"]
+
+
+def pivot_item_values(merged_df, file_names, missing="-"):
+    """
+    항목(Module, Part, ItemName)별로 파일(Model)마다 첫 번째 ItemValue를 모은 표를 만듭니다.
+    groupby 후 그룹마다 파일별로 다시 필터링하던 작업을 pandas pivot 한 번으로 처리합니다.
+    
+    Args:
+        merged_df: Module, Part, ItemName, Model, ItemValue 컬럼을 가진 DataFrame
+        file_names: 컬럼 순서로 사용할 파일(Model) 이름 목록
+        missing: 해당 파일에 값이 없을 때 채울 문자열
+        
+    Returns:
+        DataFrame: 인덱스는 정렬된 (Module, Part, ItemName), 컬럼은 file_names, 값은 문자열
+    """
+    df = merged_df.dropna(subset=ITEM_KEY_COLUMNS).drop_duplicates(subset=ITEM_KEY_COLUMNS + ["Model"])
+    df = df.assign(ItemValue=df["ItemValue"].map(str))
+    pivot = df.pivot(index=ITEM_KEY_COLUMNS, columns="Model", values="ItemValue")
+    pivot = pivot.reindex(columns=list(file_names)).fillna(missing)
+    pivot.columns.name = None
+    return pivot
+
+
+def item_value_diff_mask(pivot, missing="-"):
+    """
+    pivot_item_values 결과에서 빈 값(missing)을 제외한 값이 두 종류 이상인 행을 찾습니다.
+    
+    Returns:
+        Series: 인덱스별 차이 여부 (bool)
+    """
+    import numpy as np
+    import pandas as pd
+    
+    if pivot.shape[1] < 2:
+        return pd.Series(False, index=pivot.index)
+    
+    # 문자열 대신 정수 코드끼리 비교 (빈 값은 -1)
+    codes, uniques = pd.factorize(pivot.to_numpy(dtype=object).ravel())
+    codes = codes.astype(np.int32).reshape(pivot.shape)
+    for missing_code in np.flatnonzero(np.asarray(uniques, dtype=object) == missing):
+        codes[codes == missing_code] = -1
+    
+    kernel = _get_diff_kernel()
+    if kernel is not None:
+        diff = np.zeros(codes.shape[0], dtype=np.bool_)
+        kernel(codes, diff)
+        return pd.Series(diff, index=pivot.index)
+    
+    # 행마다 첫 번째 유효 값과 다른 값이 하나라도 있으면 차이 있음
+    present = codes >= 0
+    first = codes[np.arange(codes.shape[0]), present.argmax(axis=1)]
+    return pd.Series((present & (codes != first[:, None])).any(axis=1), index=pivot.index)
+
+
+def _any_value_diff(codes, out):
+    """
+    행마다 첫 번째 유효 코드(0 이상)와 다른 유효 코드가 있으면 out[i]를 True로 설정합니다.
+    numba가 있으면 컴파일해서 사용하며, 그대로 Python 함수로도 동작합니다.
+    """
+    for i in range(codes.shape[0]):
+        first = -1
+        for j in range(codes.shape[1]):
+            code = codes[i, j]
+            if code < 0:
+                continue
+            if first < 0:
+                first = code
+            elif code != first:
+                out[i] = True
+                break
+
+
+# numba 차이 비교 커널 - None: 아직 준비 시작 전, False: 컴파일 중이거나 사용 불가, 함수: 사용 가능
+_diff_kernel = None
+_diff_kernel_lock = threading.Lock()
+
+
+def _get_diff_kernel():
+    """
+    컴파일이 끝난 numba 차이 비교 커널을 반환합니다 (준비 전이거나 numba가 없으면 None).
+    처음 호출될 때 백그라운드 스레드에서 컴파일을 시작하므로 호출한 UI 스레드는 기다리지 않고,
+    그동안은 NumPy 경로로 계산합니다.
+    """
+    global _diff_kernel
+    with _diff_kernel_lock:
+        if _diff_kernel is None:
+            _diff_kernel = False
+            threading.Thread(target=_warm_diff_kernel, name='diff-kernel-jit', daemon=True).start()
+    return _diff_kernel or None
+
+
+def _warm_diff_kernel():
+    """백그라운드 스레드에서 커널을 컴파일하고, 성공하면 이후 호출부터 사용"""
+    global _diff_kernel
+    kernel = _compile_diff_kernel()
+    if kernel is not None:
+        _diff_kernel = kernel
+
+
+def _compile_diff_kernel():
+    """
+    _any_value_diff를 numba로 컴파일해 반환합니다 (numba가 없거나 컴파일에 실패하면 None).
+    행마다 짧은 루프이므로 parallel 없이 컴파일하고, cache=True로 다음 실행부터는 디스크 캐시를 사용합니다.
+    """
+    try:
+        import numpy as np
+        from numba import njit
+    except ImportError:
+        return None
+    
+    kernel = njit(cache=True)(_any_value_diff)
+    try:
+        # 작은 배열로 한 번 호출해 실제 컴파일까지 마침
+        kernel(np.zeros((1, 2), dtype=np.int32), np.zeros(1, dtype=np.bool_))
+    except Exception:
+        return None
+    return kernel
\ No newline at end of file
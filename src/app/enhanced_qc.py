@@ -1,25 +1,164 @@
 # Enhanced QC 기능 - Check list 모드 및 파일 선택 지원
 
 import os
+import sys
 import tkinter as tk
+from collections import Counter, namedtuple
 from tkinter import ttk, messagebox, filedialog
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+import time
+import atexit
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from .loading import LoadingDialog
-from .utils import create_treeview_with_scrollbar
+from .utils import create_treeview_with_scrollbar, insert_treeview_rows, detached_widget
 from .schema import DBSchema
 
+# 심각도 라벨 - 결과 dict 생성/집계/표시에서 같은 문자열 객체를 공유하도록 intern
+SEV_HIGH = sys.intern('높음')
+SEV_MEDIUM = sys.intern('중간')
+SEV_LOW = sys.intern('낮음')
+
+# 심각도 정렬 순위
+_SEVERITY_RANKS = {SEV_HIGH: 3, SEV_MEDIUM: 2, SEV_LOW: 1}
+
+# 배치 검수 진행 상황 UI 갱신 최소 간격 (초, 약 30Hz)
+_UI_UPDATE_INTERVAL = 0.033
+# 대화형 QC 검수 작업 완료 확인 간격 (밀리초)
+_QC_POLL_INTERVAL_MS = 50
+# 백그라운드 차트 렌더링 완료 확인 간격 (밀리초)
+_CHART_POLL_INTERVAL_MS = 30
+# 차트 영역 크기 변경 후 다시 그리기까지 기다리는 시간 (밀리초, 연속 변경은 한 번만 처리)
+_CHART_RESIZE_DELAY_MS = 200
+# 차트 래스터 해상도와 크기를 알 수 없을 때의 기본 픽셀 크기 (12x8인치)
+_CHART_DPI = 100
+_CHART_DEFAULT_SIZE = (1200, 800)
+
+# QC 차트 고정 요소 (호출마다 다시 만들지 않도록 모듈 상수로 유지)
+# 심각도 표시 순서와 색상: (심각도, 요약 텍스트 색상, 차트 색상)
+_SEVERITY_ORDER = (
+    (SEV_HIGH, '#c62828', '#f44336'),
+    (SEV_MEDIUM, '#ef6c00', '#ff9800'),
+    (SEV_LOW, '#7b1fa2', '#9c27b0')
+)
+_SEVERITY_COLORS = tuple(chart_color for _, _, chart_color in _SEVERITY_ORDER)
+# Pass/Fail 결과 행 태그 색상: 태그 -> (배경색, 글자색)
+_STATUS_TAG_STYLES = {
+    "status_pass": ("#e8f5e8", "#2e7d32"),   # 녹색
+    "status_fail": ("#ffebee", "#c62828"),   # 빨간색
+    "status_check": ("#fff3e0", "#ef6c00")   # 주황색
+}
+# QC 점수 구간: (최소 점수, 색상, 등급) - 높은 구간부터
+_SCORE_GRADES = (
+    (80, 'green', '우수'),
+    (60, 'orange', '보통'),
+    (0, 'red', '개선 필요')
+)
+_BAR_PALETTE = ('#2196f3', '#4caf50', '#ff9800', '#9c27b0', '#f44336')
+_INFO_TEXT_TEMPLATE = (
+    "검수 모드: {mode}\n"
+    "총 이슈 수: {total}개\n"
+    "높은 심각도: {high}개\n"
+    "중간 심각도: {medium}개\n"
+    "낮은 심각도: {low}개\n"
+    "\n"
+    "품질 등급: {grade}"
+)
+
+# matplotlib은 import 비용이 크므로 차트를 처음 그릴 때 로드
+_MplModules = namedtuple('_MplModules', ['Figure', 'FigureCanvasAgg'])
+_mpl_modules = None
+
+
+def _score_grade(score):
+    """QC 점수에 해당하는 (색상, 등급) 반환"""
+    for threshold, color, grade in _SCORE_GRADES:
+        if score >= threshold:
+            return color, grade
+    return _SCORE_GRADES[-1][1:]
+
+
+def _get_mpl():
+    """matplotlib 지연 로드 (최초 1회만 import 및 한글 폰트 설정)"""
+    global _mpl_modules
+    if _mpl_modules is None:
+        import matplotlib
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        # matplotlib 한글 폰트 설정
+        matplotlib.rcParams['font.family'] = ['Malgun Gothic', 'DejaVu Sans']
+        matplotlib.rcParams['axes.unicode_minus'] = False
+        _mpl_modules = _MplModules(Figure, FigureCanvasAgg)
+    return _mpl_modules
+
+
+# QC 통계 요약 카드 위젯 (한 번 만들고 검수마다 내용만 갱신)
+_QCStatsCards = namedtuple('_QCStatsCards', [
+    'frame', 'score_frame', 'score_label', 'score_desc_label',
+    'issues_frame', 'total_label', 'severity_text',
+    'category_frame', 'category_label',
+    'recommendations_frame', 'recommendations_label'
+])
+
+# 검사들이 공통으로 쓰는 컬럼 파생 배열 (DataFrame당 한 번만 계산)
+_QCContext = namedtuple('_QCContext', ['columns', 'names', 'defaults', 'checklist_mask', 'confidence'])
+# 마지막으로 만든 컨텍스트 - 캐시된 같은 DataFrame을 다시 검사할 때 재사용
+_last_qc_context = (None, None)
+
+
+def _get_qc_context(df, columns=None):
+    """DataFrame의 검사용 파생 배열 반환 (직전과 같은 DataFrame이면 재사용)"""
+    global _last_qc_context
+    df_ref, context = _last_qc_context
+    if df_ref is not None and df_ref() is df:
+        return context
+    
+    columns = columns if columns is not None else set(df.columns)
+    context = _QCContext(
+        columns=columns,
+        names=df['parameter_name'].to_numpy() if 'parameter_name' in columns else None,
+        defaults=df['default_value'].to_numpy() if 'default_value' in columns else None,
+        checklist_mask=(
+            (pd.to_numeric(df['is_checklist'], errors='coerce') == 1).to_numpy()
+            if 'is_checklist' in columns else None
+        ),
+        confidence=(
+            pd.to_numeric(df['confidence_score'], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+            if 'confidence_score' in columns else None
+        )
+    )
+    _last_qc_context = (weakref.ref(df), context)
+    return context
+
+
+# 값 종류가 적은 분류용 컬럼 - category로 변환하면 value_counts 등이 정수 코드로 처리됨
+_CATEGORY_COLUMNS = ('type_name', 'module_name', 'part_name', 'item_type')
+
+
+def _categorize_columns(df):
+    """분류용 컬럼을 category dtype으로 변환 (카테고리 순서는 처음 나온 순서 유지)"""
+    for column in _CATEGORY_COLUMNS:
+        if column in df.columns and not isinstance(df[column].dtype, pd.CategoricalDtype):
+            values = df[column]
+            df[column] = pd.Categorical(values, categories=pd.unique(values.dropna()))
+    return df
+
+
+def _parse_spec_number(value):
+    """사양/파일 값을 숫자로 변환 (천 단위 쉼표 허용, 변환할 수 없으면 None)"""
+    try:
+        return float(str(value).replace(',', ''))
+    except ValueError:
+        return None
+
+
 class EnhancedQCValidator:
     """향상된 QC 검증 클래스 - Check list 모드 지원"""
 
-    SEVERITY_LEVELS = {
-        "높음": 3,
-        "중간": 2,
-        "낮음": 1
-    }
+    SEVERITY_LEVELS = _SEVERITY_RANKS
 
     ISSUE_TYPES = {
         "data_quality": "데이터 품질",
@@ -30,58 +169,86 @@ class EnhancedQCValidator:
     }
 
     @staticmethod
-    def check_checklist_parameters(df, equipment_type):
+    def check_checklist_parameters(df, equipment_type, columns=None, context=None):
         """Check list 파라미터 특별 검사 - 개선된 버전"""
         results = []
         
-        if 'is_checklist' in df.columns:
+        try:
+            # is_checklist/confidence_score 숫자 변환 및 결과용 컬럼 배열은 컨텍스트에서 공유
+            context = context or _get_qc_context(df, columns)
+        except Exception as e:
+            print(f"Check list 파라미터 검사 중 오류: {e}")
+            return results
+        columns = context.columns
+        
+        if 'is_checklist' in columns:
             try:
-                # is_checklist를 안전하게 숫자로 변환
-                df_copy = df.copy()
-                df_copy['is_checklist_numeric'] = pd.to_numeric(df_copy['is_checklist'], errors='coerce')
-                checklist_params = df_copy[df_copy['is_checklist_numeric'] == 1]
+                checklist_mask = context.checklist_mask
+                # Check list 파라미터가 하나도 없으면 이후 검사 생략
+                if not checklist_mask.any():
+                    return results
+                
+                # 각 검사는 행 번호 배열로 결과용 컬럼을 조회
+                names = context.names
+                defaults = context.defaults
                 
                 # Check list 파라미터의 신뢰도 검사 (더 엄격한 기준)
-                if 'confidence_score' in df.columns and len(checklist_params) > 0:
+                if 'confidence_score' in columns:
                     try:
-                        # confidence_score를 안전하게 숫자로 변환
-                        checklist_params['confidence_score_numeric'] = pd.to_numeric(checklist_params['confidence_score'], errors='coerce')
-                        low_checklist_confidence = checklist_params[checklist_params['confidence_score_numeric'] < 0.8]
+                        # Check list 조건과 한 번에 결합 (NaN은 비교 결과가 False이므로 자동 제외)
+                        confidence = context.confidence
+                        low_idx = np.flatnonzero(checklist_mask & (confidence < 0.8))
+                        
+                        # 설명 문자열은 해당 행의 점수만 파이썬 float로 꺼내 포맷
+                        descriptions = [
+                            f"Check list 중요 파라미터의 신뢰도가 {score:.1f}%로 낮습니다 (권장: 80% 이상)"
+                            for score in (confidence[low_idx] * 100).tolist()
+                        ]
+                        if defaults is not None:
+                            default_values = defaults[low_idx].tolist()
+                        else:
+                            default_values = ['N/A'] * len(low_idx)
                         
-                        for _, row in low_checklist_confidence.iterrows():
-                            confidence_val = row.get('confidence_score_numeric', 0)
-                            if pd.notna(confidence_val):
-                                results.append({
-                                    "parameter": row['parameter_name'],
-                                    "issue_type": "Check list 신뢰도 부족",
-                                    "description": f"Check list 중요 파라미터의 신뢰도가 {confidence_val*100:.1f}%로 낮습니다 (권장: 80% 이상)",
-                                    "severity": "높음",
-                                    "category": "checklist",
-                                    "recommendation": "더 많은 소스 파일에서 확인하거나 수동 검증이 필요합니다.",
-                                    "default_value": row.get('default_value', 'N/A'),
-                                    "file_value": "N/A",
-                                    "pass_fail": "FAIL"
-                                })
+                        results.extend({
+                            "parameter": parameter,
+                            "issue_type": "Check list 신뢰도 부족",
+                            "description": description,
+                            "severity": SEV_HIGH,
+                            "category": "checklist",
+                            "recommendation": "더 많은 소스 파일에서 확인하거나 수동 검증이 필요합니다.",
+                            "default_value": default_value,
+                            "file_value": "N/A",
+                            "pass_fail": "FAIL"
+                        } for parameter, description, default_value in zip(
+                            names[low_idx].tolist(),
+                            descriptions,
+                            default_values
+                        ))
                     except Exception as confidence_error:
                         print(f"신뢰도 검사 중 오류: {confidence_error}")
                 
-                # Check list 파라미터의 사양 범위 누락 검사
-                missing_specs = checklist_params[
-                    (checklist_params['min_spec'].isna() | (checklist_params['min_spec'] == '')) |
-                    (checklist_params['max_spec'].isna() | (checklist_params['max_spec'] == ''))
-                ]
-                for _, row in missing_specs.iterrows():
-                    results.append({
-                        "parameter": row['parameter_name'],
-                        "issue_type": "Check list 사양 누락",
-                        "description": f"Check list 중요 파라미터에 사양 범위(min/max)가 누락되었습니다",
-                        "severity": "높음",
-                        "category": "completeness",
-                        "recommendation": "장비 매뉴얼을 참조하여 사양 범위를 추가하세요.",
-                        "default_value": row.get('default_value', 'N/A'),
-                        "file_value": "N/A",
-                        "pass_fail": "FAIL"
-                    })
+                # Check list 파라미터의 사양 범위 누락 검사 (Check list 조건과 한 번에 결합)
+                min_specs = df['min_spec'].to_numpy()
+                max_specs = df['max_spec'].to_numpy()
+                missing_idx = np.flatnonzero(checklist_mask & (
+                    pd.isna(min_specs) | (min_specs == '') | pd.isna(max_specs) | (max_specs == '')
+                ))
+                if defaults is not None:
+                    default_values = defaults[missing_idx].tolist()
+                else:
+                    default_values = ['N/A'] * len(missing_idx)
+                
+                results.extend({
+                    "parameter": parameter,
+                    "issue_type": "Check list 사양 누락",
+                    "description": "Check list 중요 파라미터에 사양 범위(min/max)가 누락되었습니다",
+                    "severity": SEV_HIGH,
+                    "category": "completeness",
+                    "recommendation": "장비 매뉴얼을 참조하여 사양 범위를 추가하세요.",
+                    "default_value": default_value,
+                    "file_value": "N/A",
+                    "pass_fail": "FAIL"
+                } for parameter, default_value in zip(names[missing_idx].tolist(), default_values))
             except Exception as e:
                 print(f"Check list 파라미터 검사 중 오류: {e}")
         
@@ -98,37 +265,38 @@ class EnhancedQCValidator:
         # Check list 파라미터만 필터링
         if 'is_checklist' in checklist_df.columns:
             try:
-                checklist_df_copy = checklist_df.copy()
-                checklist_df_copy['is_checklist_numeric'] = pd.to_numeric(checklist_df_copy['is_checklist'], errors='coerce')
-                checklist_params = checklist_df_copy[checklist_df_copy['is_checklist_numeric'] == 1]
+                checklist_mask = (pd.to_numeric(checklist_df['is_checklist'], errors='coerce') == 1).to_numpy()
+                checklist_params = checklist_df[checklist_mask]
             except:
                 checklist_params = checklist_df
         else:
             checklist_params = checklist_df
         
-        for _, checklist_row in checklist_params.iterrows():
-            param_name = checklist_row['parameter_name']
-            default_value = str(checklist_row['default_value']).strip()
-            min_spec = checklist_row.get('min_spec', '')
-            max_spec = checklist_row.get('max_spec', '')
-            
+        # 파일의 파라미터 컬럼은 행과 무관하므로 한 번만 찾음
+        param_columns = ['Parameter', 'parameter', 'Item', 'item', 'Name', 'name', 'ItemName', 'Item Name']
+        param_column = next((col for col in param_columns if col in file_df.columns), None)
+        file_param_values = file_df[param_column] if param_column else None
+        # 값 컬럼 후보 중 파일에 실제로 있는 컬럼만 미리 추림 (우선순위 유지)
+        value_columns = ['Value', 'value', 'Data', 'data', 'Setting', 'setting', 'Val', 'ItemValue']
+        file_value_arrays = [file_df[col].to_numpy() for col in value_columns if col in file_df.columns]
+        
+        # 행마다 Series를 만들지 않도록 필요한 컬럼을 리스트로 한 번만 꺼내 위치로 접근
+        checklist_columns = checklist_params.columns
+        param_names = checklist_params['parameter_name'].tolist()
+        default_values = [str(value).strip() for value in checklist_params['default_value'].tolist()]
+        no_spec = [''] * len(param_names)
+        min_specs = checklist_params['min_spec'].tolist() if 'min_spec' in checklist_columns else no_spec
+        max_specs = checklist_params['max_spec'].tolist() if 'max_spec' in checklist_columns else no_spec
+        
+        for param_name, default_value, min_spec, max_spec in zip(param_names, default_values, min_specs, max_specs):
             # 파일에서 동일한 파라미터 찾기
-            matching_params = pd.DataFrame()
-            param_columns = ['Parameter', 'parameter', 'Item', 'item', 'Name', 'name', 'ItemName', 'Item Name']
-            param_column = None
-            
-            for col in param_columns:
-                if col in file_df.columns:
-                    param_column = col
-                    break
-            
             if not param_column:
                 # 파라미터 컬럼을 찾을 수 없음 - 누락
                 results.append({
                     "parameter": param_name,
                     "issue_type": "누락",
                     "description": f"파일에서 파라미터 컬럼을 찾을 수 없습니다",
-                    "severity": "높음",
+                    "severity": SEV_HIGH,
                     "category": "completeness",
                     "recommendation": "파일 형식을 확인하세요",
                     "default_value": default_value,
@@ -137,19 +305,19 @@ class EnhancedQCValidator:
                 })
                 continue
             
-            # 파라미터명으로 매칭 시도
+            # 파라미터명으로 매칭 시도 (일치하는 파일 행 번호만 사용)
             try:
-                matching_params = file_df[file_df[param_column].str.contains(param_name, case=False, na=False)]
+                matching_rows = np.flatnonzero(file_param_values.str.contains(param_name, case=False, na=False).to_numpy())
             except:
-                matching_params = file_df[file_df[param_column] == param_name]
+                matching_rows = np.flatnonzero((file_param_values == param_name).to_numpy())
             
-            if matching_params.empty:
+            if not len(matching_rows):
                 # 파라미터가 파일에 없음 - 누락
                 results.append({
                     "parameter": param_name,
                     "issue_type": "누락",
                     "description": f"파일에서 '{param_name}' 파라미터를 찾을 수 없습니다",
-                    "severity": "높음",
+                    "severity": SEV_HIGH,
                     "category": "completeness",
                     "recommendation": "파라미터가 파일에 포함되어 있는지 확인하세요",
                     "default_value": default_value,
@@ -158,15 +326,21 @@ class EnhancedQCValidator:
                 })
                 continue
             
+            # 사양 범위 유무와 숫자 변환은 파일 행과 무관하므로 파라미터당 한 번만 계산
+            has_spec_range = (min_spec and str(min_spec).strip() and min_spec != 'N/A' and 
+                            max_spec and str(max_spec).strip() and max_spec != 'N/A')
+            if has_spec_range:
+                min_num = _parse_spec_number(min_spec)
+                max_num = _parse_spec_number(max_spec)
+            
             # 파라미터가 발견된 경우 값 비교
-            for _, file_row in matching_params.iterrows():
-                # 파일 값 추출
-                value_columns = ['Value', 'value', 'Data', 'data', 'Setting', 'setting', 'Val', 'ItemValue']
+            for row in matching_rows.tolist():
+                # 파일 값 추출 (값 컬럼 우선순위대로 첫 번째 유효 값)
                 file_value = 'N/A'
                 
-                for val_col in value_columns:
-                    if val_col in file_row.index and pd.notna(file_row[val_col]):
-                        file_value = str(file_row[val_col]).strip()
+                for value_array in file_value_arrays:
+                    if pd.notna(value_array[row]):
+                        file_value = str(value_array[row]).strip()
                         break
                 
                 if file_value == 'N/A':
@@ -175,7 +349,7 @@ class EnhancedQCValidator:
                         "parameter": param_name,
                         "issue_type": "누락",
                         "description": f"파라미터는 있지만 값이 없습니다",
-                        "severity": "높음",
+                        "severity": SEV_HIGH,
                         "category": "completeness",
                         "recommendation": "파라미터 값을 확인하세요",
                         "default_value": default_value,
@@ -188,24 +362,18 @@ class EnhancedQCValidator:
                 issue_type = ""
                 pass_fail = "PASS"
                 description = ""
-                severity = "낮음"
+                severity = SEV_LOW
                 
                 # 1. Min/Max 범위 검사 (있는 경우)
-                has_spec_range = (min_spec and str(min_spec).strip() and min_spec != 'N/A' and 
-                                max_spec and str(max_spec).strip() and max_spec != 'N/A')
-                
                 if has_spec_range:
-                    try:
-                        file_num = float(str(file_value).replace(',', ''))
-                        min_num = float(str(min_spec).replace(',', ''))
-                        max_num = float(str(max_spec).replace(',', ''))
-                        
+                    file_num = _parse_spec_number(file_value)
+                    if file_num is not None and min_num is not None and max_num is not None:
                         if not (min_num <= file_num <= max_num):
                             # 범위를 벗어남 - Spec Out
                             issue_type = "Spec Out"
                             pass_fail = "FAIL"
                             description = f"파일 값이 허용 범위를 벗어났습니다 (허용: {min_spec}~{max_spec})"
-                            severity = "높음"
+                            severity = SEV_HIGH
                         else:
                             # 범위 내에 있음 - Default Value와 비교
                             if default_value == file_value:
@@ -213,38 +381,38 @@ class EnhancedQCValidator:
                                 issue_type = ""
                                 pass_fail = "PASS"
                                 description = f"✅ 기준값과 일치하며 범위 내에 있습니다"
-                                severity = "낮음"
+                                severity = SEV_LOW
                             else:
                                 # 범위 내이지만 기준값과 다름 - 기준값 Out
                                 issue_type = "기준값 Out"
                                 pass_fail = "FAIL"
                                 description = f"범위 내이지만 기준값과 다릅니다"
-                                severity = "중간"
+                                severity = SEV_MEDIUM
                         
-                    except (ValueError, TypeError):
+                    else:
                         # 숫자 변환 실패 - 문자열로 비교
                         if default_value == file_value:
                             issue_type = ""
                             pass_fail = "PASS"
                             description = f"✅ 기준값과 일치합니다"
-                            severity = "낮음"
+                            severity = SEV_LOW
                         else:
                             issue_type = "기준값 Out"
                             pass_fail = "FAIL"
                             description = f"기준값과 다릅니다"
-                            severity = "중간"
+                            severity = SEV_MEDIUM
                 else:
                     # Min/Max 범위가 없는 경우 - Default Value와만 비교
                     if default_value == file_value:
                         issue_type = ""
                         pass_fail = "PASS"
                         description = f"✅ 기준값과 일치합니다"
-                        severity = "낮음"
+                        severity = SEV_LOW
                     else:
                         issue_type = "기준값 Out"
                         pass_fail = "FAIL"
                         description = f"기준값과 다릅니다"
-                        severity = "중간"
+                        severity = SEV_MEDIUM
                 
                 # 결과 추가
                 results.append({
@@ -262,92 +430,119 @@ class EnhancedQCValidator:
         return results
 
     @staticmethod
-    def check_data_trends(df, equipment_type):
+    def check_data_trends(df, equipment_type, columns=None):
         """데이터 트렌드 분석 - 새로운 고급 검사"""
         results = []
+        columns = columns if columns is not None else set(df.columns)
         
         # 모듈별 파라미터 분포 분석
-        if 'module_name' in df.columns and 'parameter_name' in df.columns:
+        if 'module_name' in columns and 'parameter_name' in columns:
             module_counts = df['module_name'].value_counts()
             
-            # 파라미터가 너무 적은 모듈 찾기
+            # 파라미터가 너무 적은 모듈 찾기 (인덱스/개수는 리스트로 한 번에 꺼내 결과 생성)
             low_param_modules = module_counts[module_counts < 3]
-            for module, count in low_param_modules.items():
-                results.append({
-                    "parameter": f"모듈: {module}",
-                    "issue_type": "모듈 파라미터 부족",
-                    "description": f"'{module}' 모듈에 파라미터가 {count}개만 있습니다 (권장: 3개 이상)",
-                    "severity": "낮음",
-                    "category": "completeness",
-                    "recommendation": "해당 모듈의 추가 파라미터를 확인하세요.",
-                    "default_value": "N/A",
-                    "file_value": "N/A",
-                    "pass_fail": "CHECK"
-                })
+            results.extend([{
+                "parameter": f"모듈: {module}",
+                "issue_type": "모듈 파라미터 부족",
+                "description": f"'{module}' 모듈에 파라미터가 {count}개만 있습니다 (권장: 3개 이상)",
+                "severity": SEV_LOW,
+                "category": "completeness",
+                "recommendation": "해당 모듈의 추가 파라미터를 확인하세요.",
+                "default_value": "N/A",
+                "file_value": "N/A",
+                "pass_fail": "CHECK"
+            } for module, count in zip(low_param_modules.index.tolist(), low_param_modules.tolist())])
         
         # 파트별 분석
-        if 'part_name' in df.columns:
+        if 'part_name' in columns:
             part_counts = df['part_name'].value_counts()
             
             # 파라미터가 너무 많은 파트 찾기 (잠재적 중복)
             high_param_parts = part_counts[part_counts > 20]
-            for part, count in high_param_parts.items():
-                results.append({
-                    "parameter": f"파트: {part}",
-                    "issue_type": "파트 파라미터 과다",
-                    "description": f"'{part}' 파트에 파라미터가 {count}개로 많습니다 (검토 권장: 20개 초과)",
-                    "severity": "낮음",
-                    "category": "consistency",
-                    "recommendation": "중복되거나 불필요한 파라미터가 있는지 검토하세요.",
-                    "default_value": "N/A",
-                    "file_value": "N/A",
-                    "pass_fail": "CHECK"
-                })
+            results.extend([{
+                "parameter": f"파트: {part}",
+                "issue_type": "파트 파라미터 과다",
+                "description": f"'{part}' 파트에 파라미터가 {count}개로 많습니다 (검토 권장: 20개 초과)",
+                "severity": SEV_LOW,
+                "category": "consistency",
+                "recommendation": "중복되거나 불필요한 파라미터가 있는지 검토하세요.",
+                "default_value": "N/A",
+                "file_value": "N/A",
+                "pass_fail": "CHECK"
+            } for part, count in zip(high_param_parts.index.tolist(), high_param_parts.tolist())])
         
         return results
 
 
     @staticmethod
-    def check_value_ranges(df, equipment_type):
+    def check_value_ranges(df, equipment_type, columns=None):
         """값 범위 고급 분석 - 새로운 검사"""
         results = []
-        
-        if all(col in df.columns for col in ['min_spec', 'max_spec', 'default_value']):
-            for _, row in df.iterrows():
-                try:
-                    if pd.notna(row['min_spec']) and pd.notna(row['max_spec']) and pd.notna(row['default_value']):
-                        min_val = float(row['min_spec'])
-                        max_val = float(row['max_spec'])
-                        default_val = float(row['default_value'])
-                        
-                        # 범위가 너무 넓은 경우
-                        range_ratio = (max_val - min_val) / abs(default_val) if default_val != 0 else float('inf')
-                        if range_ratio > 10:  # 기본값 대비 범위가 10배 이상
-                            results.append({
-                                "parameter": row['parameter_name'],
-                                "issue_type": "범위 과도",
-                                "description": f"사양 범위가 기본값 대비 너무 넓습니다 (범위: {min_val}~{max_val}, 기본값: {default_val})",
-                                "severity": "낮음",
-                                "category": "accuracy",
-                                "recommendation": "사양 범위가 적절한지 검토하세요."
-                            })
-                        
-                        # 기본값이 범위의 중앙에서 너무 치우친 경우
-                        if max_val != min_val:
-                            center_position = (default_val - min_val) / (max_val - min_val)
-                            if center_position < 0.1 or center_position > 0.9:
-                                results.append({
-                                    "parameter": row['parameter_name'],
-                                    "issue_type": "기본값 위치 부적절",
-                                    "description": f"기본값이 사양 범위의 {'하한' if center_position < 0.1 else '상한'}에 치우쳐 있습니다",
-                                    "severity": "낮음",
-                                    "category": "accuracy",
-                                    "recommendation": "기본값을 범위의 중앙 근처로 조정하는 것을 고려하세요."
-                                })
-                        
-                except (ValueError, TypeError, ZeroDivisionError):
-                    continue
-        
+        columns = columns if columns is not None else set(df.columns)
+
+        if not {'min_spec', 'max_spec', 'default_value'} <= columns:
+            return results
+
+        # 숫자로 변환할 수 없는 값은 NaN 처리 (기존 float() 실패 시 건너뛰기와 동일)
+        min_arr = pd.to_numeric(df['min_spec'], errors='coerce').to_numpy(dtype=float)
+        max_arr = pd.to_numeric(df['max_spec'], errors='coerce').to_numpy(dtype=float)
+
+        # 사양이 아직 등록되지 않은 장비 유형은 검사할 대상이 없음
+        if not np.isfinite(min_arr).any() or not np.isfinite(max_arr).any():
+            return results
+
+        default_arr = pd.to_numeric(df['default_value'], errors='coerce').to_numpy(dtype=float)
+        valid = ~(np.isnan(min_arr) | np.isnan(max_arr) | np.isnan(default_arr))
+        param_names = df['parameter_name'].to_numpy()
+
+        # 범위 비율과 기본값 위치를 배열 단위로 계산 (0으로 나누는 경우는 np.where로 대체)
+        span = max_arr - min_arr
+        with np.errstate(divide='ignore', invalid='ignore'):
+            range_ratio = np.where(default_arr != 0, span / np.abs(default_arr), np.inf)
+            center_position = np.where(span != 0, (default_arr - min_arr) / span, 0.5)
+
+        # 범위가 너무 넓은 경우 (기본값 대비 범위가 10배 이상)
+        wide_mask = valid & (range_ratio > 10)
+        # 기본값이 범위의 중앙에서 너무 치우친 경우
+        skew_mask = valid & (span != 0) & ((center_position < 0.1) | (center_position > 0.9))
+
+        # 설명 문자열은 해당 행의 값만 리스트로 꺼내 한 번에 생성
+        wide_idx = np.flatnonzero(wide_mask)
+        wide_descriptions = dict(zip(wide_idx.tolist(), [
+            f"사양 범위가 기본값 대비 너무 넓습니다 (범위: {min_val}~{max_val}, 기본값: {default_val})"
+            for min_val, max_val, default_val in zip(
+                min_arr[wide_idx].tolist(), max_arr[wide_idx].tolist(), default_arr[wide_idx].tolist()
+            )
+        ]))
+        skew_descriptions = {
+            True: "기본값이 사양 범위의 하한에 치우쳐 있습니다",
+            False: "기본값이 사양 범위의 상한에 치우쳐 있습니다"
+        }
+        lower_skew = (center_position < 0.1).tolist()
+
+        # 해당 행만 결과 생성 (행 순서와 행 내 검사 순서 유지)
+        for i in np.flatnonzero(wide_mask | skew_mask).tolist():
+            wide_description = wide_descriptions.get(i)
+            if wide_description is not None:
+                results.append({
+                    "parameter": param_names[i],
+                    "issue_type": "범위 과도",
+                    "description": wide_description,
+                    "severity": SEV_LOW,
+                    "category": "accuracy",
+                    "recommendation": "사양 범위가 적절한지 검토하세요."
+                })
+
+            if skew_mask[i]:
+                results.append({
+                    "parameter": param_names[i],
+                    "issue_type": "기본값 위치 부적절",
+                    "description": skew_descriptions[lower_skew[i]],
+                    "severity": SEV_LOW,
+                    "category": "accuracy",
+                    "recommendation": "기본값을 범위의 중앙 근처로 조정하는 것을 고려하세요."
+                })
+
         return results
 
     @staticmethod
@@ -368,7 +563,7 @@ class EnhancedQCValidator:
                     "pass_fail": "FAIL",
                     "issue_type": "파일 누락",
                     "description": "Check list 검수 모드에서는 비교할 파일이 필요합니다.",
-                    "severity": "높음",
+                    "severity": SEV_HIGH,
                     "category": "system_error",
                     "recommendation": "📁 파일 선택 버튼을 사용하여 검수할 파일을 선택해주세요."
                 }]
@@ -397,14 +592,13 @@ class EnhancedQCValidator:
             
             enhanced_results.extend(all_results)
             
-            # 전체 검수 모드: 모든 향상된 검사 수행
-            enhanced_results.extend(EnhancedQCValidator.check_checklist_parameters(df, equipment_type))
-            enhanced_results.extend(EnhancedQCValidator.check_data_trends(df, equipment_type))
-
-        # 심각도 순으로 정렬
-        enhanced_results.sort(key=lambda x: EnhancedQCValidator.SEVERITY_LEVELS.get(x["severity"], 0), reverse=True)
+            # 전체 검수 모드: 모든 향상된 검사 수행 (컬럼 목록과 파생 배열은 한 번만 계산)
+            context = _get_qc_context(df)
+            enhanced_results.extend(EnhancedQCValidator.check_checklist_parameters(df, equipment_type, context=context))
+            enhanced_results.extend(EnhancedQCValidator.check_data_trends(df, equipment_type, context.columns))
 
-        return enhanced_results
+        # 심각도 순으로 정렬 (심각도 등급이 3개뿐이므로 버킷으로 나눠 한 번에 정렬)
+        return QCValidator.sort_by_severity(enhanced_results, EnhancedQCValidator.SEVERITY_LEVELS)
 
     @staticmethod
     def generate_qc_summary(results):
@@ -412,37 +606,33 @@ class EnhancedQCValidator:
         if not results:
             return {
                 "total_issues": 0,
-                "severity_breakdown": {"높음": 0, "중간": 0, "낮음": 0},
+                "severity_breakdown": {SEV_HIGH: 0, SEV_MEDIUM: 0, SEV_LOW: 0},
                 "category_breakdown": {},
                 "recommendations": [],
                 "overall_score": 100
             }
         
-        # 심각도별 분류
-        severity_breakdown = {"높음": 0, "중간": 0, "낮음": 0}
-        for result in results:
-            severity = result.get("severity", "낮음")
-            severity_breakdown[severity] += 1
+        # 심각도별/카테고리별 분류 - 집계는 Counter의 C 구현에 맡김
+        severity_breakdown = Counter({SEV_HIGH: 0, SEV_MEDIUM: 0, SEV_LOW: 0})
+        severity_breakdown.update(result.get("severity", SEV_LOW) for result in results)
         
-        # 카테고리별 분류
-        category_breakdown = {}
-        for result in results:
-            category = result.get("category", "data_quality")
-            category_name = EnhancedQCValidator.ISSUE_TYPES.get(category, category)
-            category_breakdown[category_name] = category_breakdown.get(category_name, 0) + 1
+        # 카테고리는 원래 값으로 센 뒤 표시명으로 변환 (종류가 적으므로 변환 비용 미미)
+        issue_types = EnhancedQCValidator.ISSUE_TYPES
+        category_breakdown = Counter()
+        for category, count in Counter(result.get("category", "data_quality") for result in results).items():
+            category_breakdown[issue_types.get(category, category)] += count
         
-        # 주요 권장사항 수집
-        recommendations = []
-        for result in results:
-            if result.get("severity") == "높음" and result.get("recommendation"):
-                recommendations.append(result["recommendation"])
-        recommendations = list(set(recommendations))[:5]  # 중복 제거 후 최대 5개
+        # 주요 권장사항 수집 (중복 제거, 처음 나온 순서 유지, 최대 5개)
+        recommendations = list(dict.fromkeys(
+            result["recommendation"] for result in results
+            if result.get("severity", SEV_LOW) == SEV_HIGH and result.get("recommendation")
+        ))[:5]
         
         # 전체 점수 계산 (100점 만점)
         total_issues = len(results)
-        high_weight = severity_breakdown["높음"] * 10
-        medium_weight = severity_breakdown["중간"] * 5
-        low_weight = severity_breakdown["낮음"] * 2
+        high_weight = severity_breakdown[SEV_HIGH] * 10
+        medium_weight = severity_breakdown[SEV_MEDIUM] * 5
+        low_weight = severity_breakdown[SEV_LOW] * 2
         
         penalty = min(high_weight + medium_weight + low_weight, 100)
         overall_score = max(0, 100 - penalty)
@@ -516,7 +706,11 @@ def add_enhanced_qc_functions_to_class(cls):
             self.update_log(f"❌ {error_msg}")
 
     def perform_enhanced_qc_check(self):
-        """향상된 QC 검수 실행 (Check list 모드 지원) - 개선된 버전"""
+        """향상된 QC 검수 실행 (Check list 모드 지원) - 조회/검사는 QC 스레드에서 실행하고 완료되면 after 콜백으로 이어서 진행"""
+        # 이전 검수가 끝나기 전에는 다시 시작하지 않음
+        if getattr(self, '_qc_run_active', False):
+            return
+        
         selected_type = self.qc_type_var.get()
         qc_mode = getattr(self, 'qc_mode_var', None)
         
@@ -540,150 +734,136 @@ def add_enhanced_qc_functions_to_class(cls):
             self.qc_status_label.config(text="❗ 요구사항 미충족", foreground='red')
             return
 
-        try:
-            # 메모리 사용량 체크
-            try:
-                import psutil
-                memory_percent = psutil.virtual_memory().percent
-                if memory_percent > 85:
-                    if not messagebox.askyesno(
-                        "메모리 사용량 높음", 
-                        f"현재 시스템 메모리 사용률이 {memory_percent:.1f}%입니다.\n"
-                        "QC 검수 중 메모리 부족이 발생할 수 있습니다.\n"
-                        "계속하시겠습니까?"
-                    ):
-                        return
-            except ImportError:
-                pass  # psutil이 없어도 계속 진행
-            
-            # 로딩 대화상자 표시
-            loading_dialog = LoadingDialog(self.window)
-            self.window.update_idletasks()
-            
-            # 상태 업데이트
-            mode_text = "Check list 중점" if is_checklist_mode else "전체 검수"
-            self.qc_status_label.config(text=f"🔄 QC 검수 진행 중... ({mode_text})", foreground='orange')
-            self.qc_progress.config(value=10)
+        loading_dialog = None
 
-            # 트리뷰 초기화
-            for item in self.qc_result_tree.get_children():
-                self.qc_result_tree.delete(item)
-
-            # 통계 및 차트 프레임 초기화
-            for widget in self.stats_summary_frame.winfo_children():
-                widget.destroy()
-            for widget in self.chart_container.winfo_children():
-                widget.destroy()
-
-            # 선택된 장비 유형의 데이터 로드
-            equipment_type_id = getattr(self, 'equipment_types_for_qc', {}).get(selected_type)
-            if not equipment_type_id:
+        def finish_run():
+            """검수 종료 처리 - 로딩 대화상자를 닫고 실행 버튼을 다시 활성화"""
+            if loading_dialog is not None and loading_dialog.top.winfo_exists():
                 loading_dialog.close()
-                messagebox.showwarning("경고", f"장비 유형 '{selected_type}'의 ID를 찾을 수 없습니다.")
-                return
+            self._set_qc_run_active(False)
+
+        def fail(e):
+            finish_run()
             
-            # Check list 모드는 앞에서 이미 설정됨 - 중복 설정 제거
+            error_msg = f"QC 검수 중 오류 발생: {str(e)}"
+            messagebox.showerror("오류", error_msg)
+            self.update_log(f"❌ Enhanced QC 오류: {error_msg}")
             
-            # DB 스키마 인스턴스를 통해 데이터 로드
-            if hasattr(self, 'db_schema') and self.db_schema:
-                data = self.db_schema.get_default_values(equipment_type_id, checklist_only=is_checklist_mode)
-            else:
-                from .schema import DBSchema
-                db_schema = DBSchema()
-                data = db_schema.get_default_values(equipment_type_id, checklist_only=is_checklist_mode)
+            # 상태 초기화
+            self.qc_status_label.config(text="❌ QC 검수 실패", foreground='red')
+            self.qc_progress.config(value=0)
 
-            if not data:
-                loading_dialog.close()
-                mode_text = "Check list 항목" if is_checklist_mode else "전체 항목"
-                messagebox.showinfo("알림", f"장비 유형 '{selected_type}'에 대한 {mode_text} 검수할 데이터가 없습니다.")
-                self.qc_status_label.config(text="📋 QC 검수 대기 중...", foreground='blue')
-                self.qc_progress.config(value=0)
-                return
+        def on_data_loaded(future):
+            try:
+                df = future.result()
 
-            # 데이터프레임 생성
-            loading_dialog.update_progress(30, "데이터 분석 중...")
-            self.qc_progress.config(value=30)
-            
-            # 안전한 데이터프레임 생성
-            from .qc_utils import QCDataProcessor, QC_COLUMN_MAPPINGS
-            
-            df, df_error = QCDataProcessor.create_safe_dataframe(data, QC_COLUMN_MAPPINGS['DEFAULT_DB_COLUMNS'])
-            
-            if df is None:
-                loading_dialog.close()
-                messagebox.showerror("데이터 처리 오류", df_error)
-                self.update_log(f"❌ DataFrame 생성 오류: {df_error}")
-                return
-            
-            self.update_log(f"[DEBUG] 로드된 데이터: {len(df)}행, 컬럼: {list(df.columns)}")
+                if df.empty:
+                    finish_run()
+                    mode_text = "Check list 항목" if is_checklist_mode else "전체 항목"
+                    messagebox.showinfo("알림", f"장비 유형 '{selected_type}'에 대한 {mode_text} 검수할 데이터가 없습니다.")
+                    self.qc_status_label.config(text="📋 QC 검수 대기 중...", foreground='blue')
+                    self.qc_progress.config(value=0)
+                    return
 
-            # 향상된 QC 검사 실행
-            loading_dialog.update_progress(50, "향상된 QC 검사 실행 중...")
-            self.qc_progress.config(value=50)
-            
-            # Check list 모드일 때 파일 데이터 준비
-            file_df = None
-            if is_checklist_mode:
-                file_df, file_error = QCDataProcessor.extract_file_data(selected_files)
+                loading_dialog.update_progress(30, "데이터 분석 중...")
+                self.qc_progress.config(value=30)
+                
+                self.update_log(f"[DEBUG] 로드된 데이터: {len(df)}행, 컬럼: {list(df.columns)}")
+
+                # 향상된 QC 검사 실행
+                loading_dialog.update_progress(50, "향상된 QC 검사 실행 중...")
+                self.qc_progress.config(value=50)
+                
+                # Check list 모드일 때 파일 데이터 준비
+                if file_future is not None:
+                    self._when_qc_future_done(file_future, lambda f: on_file_ready(df, f))
+                else:
+                    run_checks(df, None)
+            except Exception as e:
+                fail(e)
+
+        def on_file_ready(df, future):
+            try:
+                file_df, file_error = future.result()
                 if file_df is None:
                     self.update_log(f"[DEBUG] 파일 데이터 추출 실패: {file_error}")
                 else:
                     self.update_log(f"[DEBUG] 파일 데이터 준비 완료: {len(file_df)}행, 컬럼: {list(file_df.columns)}")
-            
-            # QC 검사 실행
+                run_checks(df, file_df)
+            except Exception as e:
+                fail(e)
+
+        def run_checks(df, file_df):
+            self.update_log(f"[DEBUG] QC 검사 시작 - Check list 모드: {is_checklist_mode}, 파일 데이터: {'있음' if file_df is not None else '없음'}")
+            
+            # 검사도 QC 스레드에서 실행하고 완료되면 결과 표시로 이어짐
+            check_future = executor.submit(
+                EnhancedQCValidator.run_enhanced_checks,
+                df, selected_type, 
+                is_checklist_mode=is_checklist_mode, 
+                file_df=file_df
+            )
+            self._when_qc_future_done(check_future, on_checks_done)
+
+        def on_checks_done(future):
+            # QC 검사 실행 결과
             try:
-                self.update_log(f"[DEBUG] QC 검사 시작 - Check list 모드: {is_checklist_mode}, 파일 데이터: {'있음' if file_df is not None else '없음'}")
-                
-                results = EnhancedQCValidator.run_enhanced_checks(
-                    df, selected_type, 
-                    is_checklist_mode=is_checklist_mode, 
-                    file_df=file_df
-                )
-                
-                self.update_log(f"[DEBUG] QC 검사 완료 - 결과: {len(results)}개")
-                
+                results = future.result()
             except Exception as qc_error:
-                loading_dialog.close()
+                finish_run()
                 error_msg = f"QC 검사 실행 오류: {str(qc_error)}"
                 messagebox.showerror("QC 검사 오류", error_msg)
                 self.update_log(f"❌ QC 검사 오류: {error_msg}")
                 return
+            
+            try:
+                self.update_log(f"[DEBUG] QC 검사 완료 - 결과: {len(results)}개")
+                show_results(results)
+            except Exception as e:
+                fail(e)
 
+        def show_results(results):
             # 결과 트리뷰에 표시 (대량 데이터 처리 개선)
             loading_dialog.update_progress(75, "결과 업데이트 중...")
             self.qc_progress.config(value=75)
             
-            # 대량 데이터인 경우 배치 처리
-            batch_size = 50  # 한 번에 50개씩 처리
+            # 대량 데이터인 경우 배치 처리 (배치 단위로 한 번에 삽입 후 화면 갱신)
+            batch_size = 200  # 한 번에 200개씩 처리
             total_results = len(results)
             
+            # 태그 문자열은 세 가지뿐이므로 행마다 포맷하지 않고 미리 매핑
+            status_tags = {"PASS": "status_pass", "FAIL": "status_fail", "CHECK": "status_check"}
+            
             try:
-                for i in range(0, total_results, batch_size):
-                    batch = results[i:i+batch_size]
-                    
-                    for result in batch:
+                # 삽입하는 동안 트리뷰를 화면에서 내려 두어 배치마다 다시 그리지 않도록 함
+                result_tree = self.qc_result_tree
+                # 태그 색상은 위젯에 유지되므로 트리뷰마다 한 번만 설정
+                if getattr(self, '_qc_status_tags_tree', None) is not result_tree:
+                    for tag, (background, foreground) in _STATUS_TAG_STYLES.items():
+                        result_tree.tag_configure(tag, background=background, foreground=foreground)
+                    self._qc_status_tags_tree = result_tree
+                with detached_widget(result_tree):
+                    status_tag = status_tags.get
+                    for i in range(0, total_results, batch_size):
+                        batch = results[i:i+batch_size]
                         # Pass/Fail에 따른 색상 태그 설정
-                        pass_fail = result.get("pass_fail", "CHECK")
-                        tag = f"status_{pass_fail.lower()}"
-                        
-                        self.qc_result_tree.insert(
-                            "", "end", 
-                            values=(
-                                result.get("parameter", ""),
-                                result.get("default_value", "N/A"),
-                                result.get("file_value", "N/A"),
-                                pass_fail,
-                                result.get("issue_type", ""),
-                                result.get("description", "")
-                            ),
-                            tags=(tag,)
-                        )
+                        pass_fails = [result.get("pass_fail", "CHECK") for result in batch]
+                        tags = [status_tag(pass_fail) or "status_" + pass_fail.lower() for pass_fail in pass_fails]
+                        rows = [(
+                            result.get("parameter", ""),
+                            result.get("default_value", "N/A"),
+                            result.get("file_value", "N/A"),
+                            pass_fail,
+                            result.get("issue_type", ""),
+                            result.get("description", "")
+                        ) for result, pass_fail in zip(batch, pass_fails)]
+                        insert_treeview_rows(result_tree, rows, tags)
                     
-                    # 배치 처리 후 UI 업데이트
-                    if total_results > batch_size:
-                        self.window.update_idletasks()
-                        progress = 75 + (i / total_results) * 15  # 75~90% 사이
-                        self.qc_progress.config(value=progress)
+                        # 배치 처리 후 UI 업데이트
+                        if total_results > batch_size:
+                            self.window.update_idletasks()
+                            progress = 75 + (i / total_results) * 15  # 75~90% 사이
+                            self.qc_progress.config(value=progress)
                         
             except Exception as display_error:
                 # 표시 중 오류 발생 시에도 일부 결과는 보여줌
@@ -695,10 +875,8 @@ def add_enhanced_qc_functions_to_class(cls):
                     f"전체 결과: {total_results}개"
                 )
 
-            # 트리뷰 태그 색상 설정 - Pass/Fail 기준
-            self.qc_result_tree.tag_configure("status_pass", background="#e8f5e8", foreground="#2e7d32")  # 녹색
-            self.qc_result_tree.tag_configure("status_fail", background="#ffebee", foreground="#c62828")  # 빨간색
-            self.qc_result_tree.tag_configure("status_check", background="#fff3e0", foreground="#ef6c00")  # 주황색
+            # 내보내기 시 트리뷰를 다시 읽지 않도록 표시한 결과 보관
+            self._last_qc_results = results
 
             # 통계 정보 표시
             loading_dialog.update_progress(90, "통계 정보 생성 중...")
@@ -708,7 +886,7 @@ def add_enhanced_qc_functions_to_class(cls):
 
             # 완료
             loading_dialog.update_progress(100, "완료")
-            loading_dialog.close()
+            finish_run()
             
             # 상태 업데이트
             mode_text = "Check list 중점" if is_checklist_mode else "전체"
@@ -721,17 +899,59 @@ def add_enhanced_qc_functions_to_class(cls):
             # 로그 업데이트
             self.update_log(f"[Enhanced QC] 장비 유형 '{selected_type}' ({mode_text})에 대한 향상된 QC 검수가 완료되었습니다. 총 {len(results)}개의 이슈 발견.")
 
-        except Exception as e:
-            if 'loading_dialog' in locals():
-                loading_dialog.close()
+        try:
+            # 메모리 사용량 체크
+            try:
+                import psutil
+                memory_percent = psutil.virtual_memory().percent
+                if memory_percent > 85:
+                    if not messagebox.askyesno(
+                        "메모리 사용량 높음", 
+                        f"현재 시스템 메모리 사용률이 {memory_percent:.1f}%입니다.\n"
+                        "QC 검수 중 메모리 부족이 발생할 수 있습니다.\n"
+                        "계속하시겠습니까?"
+                    ):
+                        return
+            except ImportError:
+                pass  # psutil이 없어도 계속 진행
             
-            error_msg = f"QC 검수 중 오류 발생: {str(e)}"
-            messagebox.showerror("오류", error_msg)
-            self.update_log(f"❌ Enhanced QC 오류: {error_msg}")
+            # 로딩 대화상자 표시
+            loading_dialog = LoadingDialog(self.window)
+            self.window.update_idletasks()
             
-            # 상태 초기화
-            self.qc_status_label.config(text="❌ QC 검수 실패", foreground='red')
-            self.qc_progress.config(value=0)
+            # 상태 업데이트
+            mode_text = "Check list 중점" if is_checklist_mode else "전체 검수"
+            self.qc_status_label.config(text=f"🔄 QC 검수 진행 중... ({mode_text})", foreground='orange')
+            self.qc_progress.config(value=10)
+
+            # 트리뷰 초기화 (항목 전체를 한 번의 delete 호출로 제거)
+            self.qc_result_tree.delete(*self.qc_result_tree.get_children())
+            self._last_qc_results = None
+
+            # 통계 및 차트 프레임 초기화 (요약 카드는 숨기기만 함)
+            self._hide_qc_stats_cards()
+            self._clear_chart_container()
+
+            # 선택된 장비 유형의 데이터 로드
+            equipment_type_id = getattr(self, 'equipment_types_for_qc', {}).get(selected_type)
+            if not equipment_type_id:
+                finish_run()
+                messagebox.showwarning("경고", f"장비 유형 '{selected_type}'의 ID를 찾을 수 없습니다.")
+                return
+            
+            # Check list 모드는 앞에서 이미 설정됨 - 중복 설정 제거
+            
+            # DB 조회/DataFrame 생성과 Check list 파일 로드는 대화형 QC 전용 스레드에서 동시에 진행
+            # (DB 변경이 없으면 이전 조회 결과 재사용) - 끝나면 on_data_loaded부터 이어서 진행
+            self._set_qc_run_active(True)
+            executor = self._get_interactive_qc_executor()
+            data_future = executor.submit(self._load_qc_default_data, equipment_type_id, is_checklist_mode)
+            file_future = (executor.submit(QCDataProcessor.extract_file_data, selected_files)
+                           if is_checklist_mode else None)
+            self._when_qc_future_done(data_future, on_data_loaded)
+
+        except Exception as e:
+            fail(e)
 
     def export_qc_results_simple(self):
         """간단한 QC 결과 내보내기 - 공통 유틸리티 사용"""
@@ -743,20 +963,34 @@ def add_enhanced_qc_functions_to_class(cls):
                 messagebox.showinfo("알림", "내보낼 QC 결과가 없습니다.")
                 return
             
-            # 트리뷰에서 결과 데이터 수집
-            results = []
-            for item in self.qc_result_tree.get_children():
-                values = self.qc_result_tree.item(item)['values']
-                results.append({
-                    'parameter': values[0],        # itemname
-                    'default_value': values[1],    # default_value
-                    'file_value': values[2],       # file_value
-                    'pass_fail': values[3],        # pass_fail
-                    'issue_type': values[4],       # issue_type
-                    'description': values[5],      # description
-                    'severity': 'N/A',             # 트리뷰에는 없지만 내보내기용
-                    'recommendation': 'N/A'        # 트리뷰에는 없지만 내보내기용
-                })
+            last_results = getattr(self, '_last_qc_results', None)
+            if last_results is not None:
+                # 마지막 검수 결과에서 바로 구성 (트리뷰 항목마다 Tk 호출을 하지 않음, 기본값은 표시와 동일)
+                results = [{
+                    'parameter': result.get("parameter", ""),
+                    'default_value': result.get("default_value", "N/A"),
+                    'file_value': result.get("file_value", "N/A"),
+                    'pass_fail': result.get("pass_fail", "CHECK"),
+                    'issue_type': result.get("issue_type", ""),
+                    'description': result.get("description", ""),
+                    'severity': result.get("severity", "N/A"),
+                    'recommendation': result.get("recommendation", "N/A")
+                } for result in last_results]
+            else:
+                # 트리뷰에서 결과 데이터 수집
+                results = []
+                for item in self.qc_result_tree.get_children():
+                    values = self.qc_result_tree.item(item)['values']
+                    results.append({
+                        'parameter': values[0],        # itemname
+                        'default_value': values[1],    # default_value
+                        'file_value': values[2],       # file_value
+                        'pass_fail': values[3],        # pass_fail
+                        'issue_type': values[4],       # issue_type
+                        'description': values[5],      # description
+                        'severity': 'N/A',             # 트리뷰에는 없지만 내보내기용
+                        'recommendation': 'N/A'        # 트리뷰에는 없지만 내보내기용
+                    })
             
             # 공통 내보내기 함수 사용
             if QCResultExporter.export_results_to_file(results, "qc_enhanced_results"):
@@ -767,51 +1001,145 @@ def add_enhanced_qc_functions_to_class(cls):
             error_msg = QCErrorHandler.handle_file_error(e, "QC 검수 결과")
             self.update_log(f"❌ {error_msg}")
 
-    def show_enhanced_qc_statistics(self, results, is_checklist_mode=False):
-        """향상된 QC 통계 정보 표시"""
-        # 통계 요약 생성
-        summary = EnhancedQCValidator.generate_qc_summary(results)
+    def get_qc_db_schema(self):
+        """QC용 DBSchema 인스턴스 - 공용 인스턴스가 없으면 한 번만 생성하여 재사용"""
+        db_schema = getattr(self, 'db_schema', None)
+        if db_schema:
+            return db_schema
+        if getattr(self, '_db_schema', None) is None:
+            self._db_schema = DBSchema()
+        return self._db_schema
+
+    def load_qc_default_data(self, equipment_type_id, checklist_only):
+        """Default DB 값 DataFrame 조회 - DB 데이터가 변경되기 전까지 캐시 사용"""
+        db_schema = self._get_qc_db_schema()
+        stamp = db_schema.get_data_stamp()
+        cached = getattr(self, '_qc_data_cache', None)
+        if cached is None or cached[0] != stamp:
+            cached = self._qc_data_cache = (stamp, {})
         
-        # 기존 위젯 제거
-        for widget in self.stats_summary_frame.winfo_children():
-            widget.destroy()
-        for widget in self.chart_container.winfo_children():
-            widget.destroy()
+        key = (equipment_type_id, bool(checklist_only))
+        df = cached[1].get(key)
+        if df is not None:
+            return df
+        
+        # 조회 결과를 튜플 목록으로 보관하지 않고 바로 DataFrame으로 생성
+        df = db_schema.get_default_values_df(equipment_type_id, checklist_only=checklist_only)
+        if not df.empty:
+            # 캐시된 DataFrame은 여러 번 검사되므로 분류용 컬럼은 조회 시 한 번만 변환 (조회 결과는 그대로 두고 복사본을 변환한 뒤 캐시에 등록)
+            df = _categorize_columns(df.copy())
+            cached[1][key] = df
+        return df
+
+    def get_qc_summary(self, results):
+        """QC 요약 정보 - 같은 결과 객체에 대해서는 한 번만 계산"""
+        cached = getattr(self, '_qc_summary_cache', None)
+        if cached is not None and cached[0] is results:
+            return cached[1]
+        
+        summary = EnhancedQCValidator.generate_qc_summary(results)
+        self._qc_summary_cache = (results, summary)
+        return summary
+
+    def get_qc_stats_cards(self):
+        """통계 요약 카드 위젯 - 최초 1회(또는 프레임이 새로 만들어졌을 때)만 생성"""
+        cards = getattr(self, '_qc_stats_cards', None)
+        if (cards is not None and cards.frame is self.stats_summary_frame
+                and cards.score_frame.winfo_exists()):
+            return cards
 
+        frame = self.stats_summary_frame
         # 🎨 요약 카드 스타일 프레임들
         # 전체 점수 카드
-        score_frame = ttk.LabelFrame(self.stats_summary_frame, text="🏆 전체 QC 점수", padding=15)
-        score_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 10))
-        
-        score_color = "green" if summary["overall_score"] >= 80 else "orange" if summary["overall_score"] >= 60 else "red"
-        score_label = ttk.Label(score_frame, text=f"{summary['overall_score']:.0f}점", 
-                               font=('Arial', 24, 'bold'), foreground=score_color)
+        score_frame = ttk.LabelFrame(frame, text="🏆 전체 QC 점수", padding=15)
+        score_label = ttk.Label(score_frame, font=('Arial', 24, 'bold'))
         score_label.pack()
-        
-        score_desc = "우수" if summary["overall_score"] >= 80 else "보통" if summary["overall_score"] >= 60 else "개선 필요"
-        ttk.Label(score_frame, text=f"({score_desc})", font=('Arial', 12)).pack()
+        score_desc_label = ttk.Label(score_frame, font=('Arial', 12))
+        score_desc_label.pack()
 
         # 이슈 요약 카드
-        issues_frame = ttk.LabelFrame(self.stats_summary_frame, text="📊 이슈 요약", padding=15)
-        issues_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 10))
+        issues_frame = ttk.LabelFrame(frame, text="📊 이슈 요약", padding=15)
+        total_label = ttk.Label(issues_frame, font=('Arial', 12, 'bold'))
+        total_label.pack(anchor='w')
         
-        ttk.Label(issues_frame, text=f"총 이슈: {summary['total_issues']}개", 
-                 font=('Arial', 12, 'bold')).pack(anchor='w')
-        
-        for severity, count in summary['severity_breakdown'].items():
-            if count > 0:
-                color = "#c62828" if severity == "높음" else "#ef6c00" if severity == "중간" else "#7b1fa2"
-                label = ttk.Label(issues_frame, text=f"• {severity}: {count}개", 
-                                 font=('Arial', 10), foreground=color)
-                label.pack(anchor='w')
+        # 심각도별 건수는 색상 태그를 가진 Text 위젯 하나로 표시 (항목별 Label 생성 제거)
+        background = ttk.Style().lookup('TLabelframe', 'background') or issues_frame.winfo_toplevel().cget('background')
+        severity_text = tk.Text(issues_frame, height=1, width=20, font=('Arial', 10),
+                                relief='flat', borderwidth=0, highlightthickness=0, background=background)
+        for severity, text_color, _ in _SEVERITY_ORDER:
+            severity_text.tag_configure(severity, foreground=text_color)
 
         # 카테고리 분석 카드
-        category_frame = ttk.LabelFrame(self.stats_summary_frame, text="📋 카테고리별 분석", padding=15)
-        category_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        category_frame = ttk.LabelFrame(frame, text="📋 카테고리별 분석", padding=15)
+        category_label = ttk.Label(category_frame, font=('Arial', 10), justify='left')
+
+        # 권장사항 (하단)
+        recommendations_frame = ttk.LabelFrame(frame, text="💡 주요 권장사항", padding=10)
+        recommendations_label = ttk.Label(recommendations_frame, font=('Arial', 9),
+                                          wraplength=400, justify='left')
+        recommendations_label.pack(anchor='w', pady=2)
+
+        cards = self._qc_stats_cards = _QCStatsCards(
+            frame, score_frame, score_label, score_desc_label,
+            issues_frame, total_label, severity_text,
+            category_frame, category_label,
+            recommendations_frame, recommendations_label
+        )
+        return cards
+
+    def hide_qc_stats_cards(self):
+        """통계 요약 카드 숨기기 (위젯은 다음 검수에서 재사용)"""
+        cards = getattr(self, '_qc_stats_cards', None)
+        if cards is None or not cards.score_frame.winfo_exists():
+            # 카드가 아직 없으면 이전 방식으로 남은 위젯만 정리
+            for widget in self.stats_summary_frame.winfo_children():
+                widget.destroy()
+            return
+        for card in (cards.score_frame, cards.issues_frame, cards.category_frame, cards.recommendations_frame):
+            card.pack_forget()
+
+    def show_enhanced_qc_statistics(self, results, is_checklist_mode=False):
+        """향상된 QC 통계 정보 표시 - 요약 카드는 재사용하고 내용만 갱신"""
+        # 통계 요약 생성 (동일 결과 재표시 시 캐시 사용)
+        summary = self._get_qc_summary(results)
+        
+        # 기존 카드 숨기기 (파괴하지 않음)
+        self._hide_qc_stats_cards()
+        self._clear_chart_container()
+        cards = self._get_qc_stats_cards()
+
+        # 전체 점수 카드
+        score_color, score_desc = _score_grade(summary["overall_score"])
+        cards.score_label.config(text=f"{summary['overall_score']:.0f}점", foreground=score_color)
+        cards.score_desc_label.config(text=f"({score_desc})")
+        cards.score_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 10))
+
+        # 이슈 요약 카드
+        cards.total_label.config(text=f"총 이슈: {summary['total_issues']}개")
         
-        for category, count in summary['category_breakdown'].items():
-            ttk.Label(category_frame, text=f"• {category}: {count}개", 
-                     font=('Arial', 10)).pack(anchor='w')
+        severity_lines = [(severity, count) for severity, count in summary['severity_breakdown'].items() if count > 0]
+        severity_text = cards.severity_text
+        if severity_lines:
+            severity_text.config(state=tk.NORMAL, height=len(severity_lines))
+            severity_text.delete("1.0", tk.END)
+            for severity, count in severity_lines:
+                tag = severity if severity in (SEV_HIGH, SEV_MEDIUM) else SEV_LOW
+                severity_text.insert(tk.END, f"• {severity}: {count}개\n", tag)
+            severity_text.delete("end-2c")  # 마지막 줄바꿈 제거
+            severity_text.config(state=tk.DISABLED)
+            severity_text.pack(anchor='w')
+        else:
+            severity_text.pack_forget()
+        cards.issues_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 10))
+
+        # 카테고리 분석 카드
+        category_text = "\n".join(f"• {category}: {count}개" for category, count in summary['category_breakdown'].items())
+        if category_text:
+            cards.category_label.config(text=category_text)
+            cards.category_label.pack(anchor='w')
+        else:
+            cards.category_label.pack_forget()
+        cards.category_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
         # 🎨 시각화 차트들
         if results:
@@ -819,107 +1147,219 @@ def add_enhanced_qc_functions_to_class(cls):
 
         # 권장사항 표시 (하단)
         if summary['recommendations']:
-            recommendations_frame = ttk.LabelFrame(self.stats_summary_frame, text="💡 주요 권장사항", padding=10)
-            recommendations_frame.pack(fill=tk.X, pady=(10, 0))
-            
-            for i, rec in enumerate(summary['recommendations'][:3], 1):
-                ttk.Label(recommendations_frame, text=f"{i}. {rec}", 
-                         font=('Arial', 9), wraplength=400).pack(anchor='w', pady=2)
+            recommendations_text = "\n".join(f"{i}. {rec}" for i, rec in enumerate(summary['recommendations'][:3], 1))
+            cards.recommendations_label.config(text=recommendations_text)
+            cards.recommendations_frame.pack(fill=tk.X, pady=(10, 0))
+
+    def clear_chart_container(self):
+        """차트 컨테이너 정리 - 재사용할 차트 이미지 라벨은 숨기기만 함"""
+        chart_label = getattr(self, '_qc_chart_label', None)
+        for widget in self.chart_container.winfo_children():
+            if widget is chart_label:
+                widget.pack_forget()
+            else:
+                widget.destroy()
+
+    def on_chart_container_visible(self, event=None):
+        """시각화 영역이 화면에 표시될 때 보류된 차트 그리기"""
+        pending = getattr(self, '_pending_chart', None)
+        if pending is not None:
+            self.create_enhanced_charts(*pending)
+
+    def on_chart_container_resized(self, event=None):
+        """시각화 영역 크기가 바뀌면 잠시 후 현재 크기로 차트를 다시 그림"""
+        last_chart = getattr(self, '_qc_last_chart', None)
+        if last_chart is None:
+            return
+        resize_job = getattr(self, '_chart_resize_job', None)
+        if resize_job is not None:
+            self.window.after_cancel(resize_job)
+        
+        def redraw():
+            self._chart_resize_job = None
+            self.create_enhanced_charts(*last_chart)
+        
+        self._chart_resize_job = self.window.after(_CHART_RESIZE_DELAY_MS, redraw)
 
     def create_enhanced_charts(self, summary, is_checklist_mode=False):
-        """향상된 차트 생성"""
+        """향상된 차트 생성 - 독립 Agg Figure를 QC 스레드 풀에서 그리고 완성된 이미지만 Tk에 표시"""
+        # 이슈가 없으면 그릴 내용이 없음
+        if not summary['total_issues']:
+            self._pending_chart = None
+            self._qc_last_chart = None
+            return
+        
+        # 영역이 표시될 때 보류된 차트를, 크기가 바뀌면 새 크기의 차트를 그리도록 한 번만 연결
+        if not getattr(self, '_chart_visibility_bound', False):
+            self.chart_container.bind('<Visibility>', self._on_chart_container_visible, add='+')
+            self.chart_container.bind('<Configure>', self._on_chart_container_resized, add='+')
+            self._chart_visibility_bound = True
+        
+        # 시각화 영역이 보이지 않거나 이전 차트를 그리는 중이면 나중에 그리도록 보류
+        chart_busy = getattr(self, '_qc_chart_future', None) is not None
+        if chart_busy or not self.chart_container.winfo_viewable():
+            self._pending_chart = (summary, is_checklist_mode)
+            return
+        self._pending_chart = None
+        self._qc_last_chart = (summary, is_checklist_mode)
+        
         try:
-            # matplotlib 한글 폰트 설정
-            plt.rcParams['font.family'] = ['Malgun Gothic', 'DejaVu Sans']
-            plt.rcParams['axes.unicode_minus'] = False
-            
-            # 차트 컨테이너 프레임
-            chart_frame = ttk.Frame(self.chart_container)
-            chart_frame.pack(fill=tk.BOTH, expand=True)
-            
-            # Figure 생성 (2x2 서브플롯)
-            fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 8))
-            fig.suptitle('QC 검수 결과 분석', fontsize=16, fontweight='bold')
-            
-            # 1. 심각도별 파이차트
-            severity_data = summary['severity_breakdown']
-            if any(severity_data.values()):
-                colors1 = ['#f44336', '#ff9800', '#9c27b0']
-                labels1 = list(severity_data.keys())
-                sizes1 = list(severity_data.values())
-                
-                ax1.pie(sizes1, labels=labels1, colors=colors1, autopct='%1.1f%%', startangle=90)
-                ax1.set_title('심각도별 이슈 분포')
-            else:
-                ax1.text(0.5, 0.5, 'No Issues Found', ha='center', va='center', transform=ax1.transAxes)
-                ax1.set_title('심각도별 이슈 분포')
-            
-            # 2. 카테고리별 막대차트
-            category_data = summary['category_breakdown']
-            if category_data:
-                categories = list(category_data.keys())
-                counts = list(category_data.values())
-                
-                bars = ax2.bar(categories, counts, color=['#2196f3', '#4caf50', '#ff9800', '#9c27b0', '#f44336'])
-                ax2.set_title('카테고리별 이슈 분포')
-                ax2.set_ylabel('이슈 수')
-                
-                # 막대 위에 숫자 표시
-                for bar, count in zip(bars, counts):
-                    ax2.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.1, 
-                            str(count), ha='center', va='bottom')
-                
-                # x축 라벨 회전
-                plt.setp(ax2.get_xticklabels(), rotation=45, ha='right')
-            else:
-                ax2.text(0.5, 0.5, 'No Issues Found', ha='center', va='center', transform=ax2.transAxes)
-                ax2.set_title('카테고리별 이슈 분포')
-            
-            # 3. QC 점수 게이지 차트 (간단한 막대로 표현)
-            score = summary['overall_score']
-            colors = ['red' if score < 60 else 'orange' if score < 80 else 'green']
-            ax3.barh(['QC 점수'], [score], color=colors)
-            ax3.set_xlim(0, 100)
-            ax3.set_xlabel('점수')
-            ax3.set_title(f'전체 QC 점수: {score:.0f}점')
-            
-            # 점수 텍스트 표시
-            ax3.text(score/2, 0, f'{score:.0f}점', ha='center', va='center', 
-                    fontweight='bold', fontsize=12, color='white')
+            # 현재 차트 영역 크기로 래스터화 (아직 배치 전이라 크기가 없으면 기본 크기)
+            width, height = self.chart_container.winfo_width(), self.chart_container.winfo_height()
+            if width <= 1 or height <= 1:
+                width, height = _CHART_DEFAULT_SIZE
+            
+            chart_key = (tuple(summary['severity_breakdown'].items()),
+                         tuple(summary['category_breakdown'].items()),
+                         summary['overall_score'], is_checklist_mode, width, height)
+            chart_label = getattr(self, '_qc_chart_label', None)
+            if chart_label is not None and not chart_label.winfo_exists():
+                chart_label = self._qc_chart_label = None
+            if chart_label is not None and chart_key == getattr(self, '_qc_chart_key', None):
+                # 이미 같은 내용/크기로 그려져 있으면 다시 래스터화하지 않고 표시만 복원
+                chart_label.pack(fill=tk.BOTH, expand=True)
+                return
             
-            # 4. 성능 모드 정보 (텍스트)
-            mode_text = "Check list 중점 검수" if is_checklist_mode else "전체 항목 검수"
-            total_issues = summary['total_issues']
+            # 차트 구성과 래스터화는 Tk와 연결되지 않은 Figure로 작업 스레드에서 수행
+            self._qc_rendering_chart_key = chart_key
+            self._qc_chart_future = self._get_qc_executor().submit(
+                self._render_enhanced_charts, summary, is_checklist_mode, width, height
+            )
+            self.window.after(_CHART_POLL_INTERVAL_MS, self._finish_enhanced_charts)
             
-            info_text = f"""검수 모드: {mode_text}
-총 이슈 수: {total_issues}개
-높은 심각도: {severity_data.get('높음', 0)}개
-중간 심각도: {severity_data.get('중간', 0)}개
-낮은 심각도: {severity_data.get('낮음', 0)}개
+        except Exception as e:
+            self._show_chart_error(e)
 
-품질 등급: {'우수' if score >= 80 else '보통' if score >= 60 else '개선 필요'}"""
-            
-            ax4.text(0.1, 0.9, info_text, transform=ax4.transAxes, fontsize=10, 
-                    verticalalignment='top', bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.8))
-            ax4.set_xlim(0, 1)
-            ax4.set_ylim(0, 1)
-            ax4.axis('off')
-            ax4.set_title('검수 정보 요약')
-            
-            # 레이아웃 조정
-            plt.tight_layout()
-            
-            # Tkinter에 차트 삽입
-            canvas = FigureCanvasTkAgg(fig, chart_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-            
+    def render_enhanced_charts(self, summary, is_checklist_mode, width, height):
+        """
+        차트 내용 구성 및 Agg 래스터화 (작업 스레드에서 실행 - Tk 호출 없음)
+        
+        Returns:
+            bytes: width x height 크기의 PPM(RGB) 이미지 데이터
+        """
+        # matplotlib은 시각화 탭에서 처음 사용할 때 import (앱 시작 시간 단축)
+        # Figure/Axes는 Tk 캔버스에 붙이지 않은 독립 Agg Figure로 한 번 만들고 재사용
+        Figure, FigureCanvasAgg = _get_mpl()
+        fig = getattr(self, '_qc_fig', None)
+        if fig is None:
+            # 레이아웃은 그리기 과정에서 함께 계산 (tight_layout의 별도 계산 단계 생략)
+            fig = Figure(dpi=_CHART_DPI, constrained_layout=True)
+            FigureCanvasAgg(fig)
+            self._qc_fig = fig
+            self._qc_axes = fig.subplots(2, 2)
+        fig.set_size_inches(width / _CHART_DPI, height / _CHART_DPI)
+        for ax in self._qc_axes.flat:
+            ax.clear()
+        (ax1, ax2), (ax3, ax4) = self._qc_axes
+        fig.suptitle('QC 검수 결과 분석', fontsize=16, fontweight='bold')
+        
+        # 1. 심각도별 파이차트
+        severity_data = summary['severity_breakdown']
+        if any(severity_data.values()):
+            labels1 = list(severity_data.keys())
+            sizes1 = list(severity_data.values())
+            
+            ax1.pie(sizes1, labels=labels1, colors=_SEVERITY_COLORS, autopct='%1.1f%%', startangle=90)
+            ax1.set_title('심각도별 이슈 분포')
+        else:
+            ax1.text(0.5, 0.5, 'No Issues Found', ha='center', va='center', transform=ax1.transAxes)
+            ax1.set_title('심각도별 이슈 분포')
+        
+        # 2. 카테고리별 막대차트
+        category_data = summary['category_breakdown']
+        if category_data:
+            categories = list(category_data.keys())
+            counts = list(category_data.values())
+            
+            bars = ax2.bar(categories, counts, color=_BAR_PALETTE)
+            ax2.set_title('카테고리별 이슈 분포')
+            ax2.set_ylabel('이슈 수')
+            
+            # 막대 위에 숫자 표시
+            for bar, count in zip(bars, counts):
+                ax2.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.1, 
+                        str(count), ha='center', va='bottom')
+            
+            # x축 라벨 회전
+            for tick_label in ax2.get_xticklabels():
+                tick_label.set_rotation(45)
+                tick_label.set_horizontalalignment('right')
+        else:
+            ax2.text(0.5, 0.5, 'No Issues Found', ha='center', va='center', transform=ax2.transAxes)
+            ax2.set_title('카테고리별 이슈 분포')
+        
+        # 3. QC 점수 게이지 차트 (간단한 막대로 표현)
+        score = summary['overall_score']
+        score_color, score_grade = _score_grade(score)
+        ax3.barh(['QC 점수'], [score], color=[score_color])
+        ax3.set_xlim(0, 100)
+        ax3.set_xlabel('점수')
+        ax3.set_title(f'전체 QC 점수: {score:.0f}점')
+        
+        # 점수 텍스트 표시
+        ax3.text(score/2, 0, f'{score:.0f}점', ha='center', va='center', 
+                fontweight='bold', fontsize=12, color='white')
+        
+        # 4. 성능 모드 정보 (텍스트)
+        mode_text = "Check list 중점 검수" if is_checklist_mode else "전체 항목 검수"
+        total_issues = summary['total_issues']
+        
+        high, medium, low = (severity_data.get(severity, 0) for severity, _, _ in _SEVERITY_ORDER)
+        
+        info_text = _INFO_TEXT_TEMPLATE.format(
+            mode=mode_text,
+            total=total_issues,
+            high=high,
+            medium=medium,
+            low=low,
+            grade=score_grade
+        )
+        
+        ax4.text(0.1, 0.9, info_text, transform=ax4.transAxes, fontsize=10, 
+                verticalalignment='top', bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.8))
+        ax4.set_xlim(0, 1)
+        ax4.set_ylim(0, 1)
+        ax4.axis('off')
+        ax4.set_title('검수 정보 요약')
+        
+        # Agg 버퍼에 그린 뒤 Tk PhotoImage가 바로 읽을 수 있는 PPM으로 변환
+        fig.canvas.draw()
+        rgba = np.asarray(fig.canvas.buffer_rgba())
+        header = b'P6 %d %d 255\n' % (rgba.shape[1], rgba.shape[0])
+        return header + rgba[:, :, :3].tobytes()
+
+    def finish_enhanced_charts(self):
+        """작업 스레드의 차트 렌더링이 끝나면 완성된 이미지를 Tk 라벨에 표시"""
+        future = self._qc_chart_future
+        if not future.done():
+            self.window.after(_CHART_POLL_INTERVAL_MS, self._finish_enhanced_charts)
+            return
+        self._qc_chart_future = None
+        
+        try:
+            image = tk.PhotoImage(master=self.chart_container, data=future.result())
+            chart_label = getattr(self, '_qc_chart_label', None)
+            if chart_label is None:
+                # 테두리/여백이 없어야 이미지 크기가 차트 영역 크기와 같아 크기 변경이 반복되지 않음
+                chart_label = tk.Label(self.chart_container, bd=0, padx=0, pady=0, highlightthickness=0)
+                self._qc_chart_label = chart_label
+            chart_label.config(image=image)
+            # PhotoImage는 참조가 없으면 사라지므로 표시 중인 이미지 보관
+            self._qc_chart_image = image
+            chart_label.pack(fill=tk.BOTH, expand=True)
+            self._qc_chart_key = self._qc_rendering_chart_key
         except Exception as e:
-            # 차트 생성 실패 시 텍스트로 대체
-            error_label = ttk.Label(self.chart_container, 
-                                  text=f"차트 생성 중 오류 발생: {str(e)}\n\n기본 통계 정보는 '통계 요약' 탭에서 확인하세요.",
-                                  font=('Arial', 10), foreground='red')
-            error_label.pack(pady=20)
+            self._show_chart_error(e)
+        
+        # 그리는 동안 들어온 차트 요청 처리
+        self._on_chart_container_visible()
+
+    def show_chart_error(self, error):
+        """차트 생성 실패 시 텍스트로 대체"""
+        error_label = ttk.Label(self.chart_container, 
+                              text=f"차트 생성 중 오류 발생: {str(error)}\n\n기본 통계 정보는 '통계 요약' 탭에서 확인하세요.",
+                              font=('Arial', 10), foreground='red')
+        error_label.pack(pady=20)
 
     def _create_new_template(self):
         """새 QC 템플릿 생성"""
@@ -933,94 +1373,108 @@ def add_enhanced_qc_functions_to_class(cls):
             dialog.transient(self.window)
             dialog.grab_set()
             
-            # 기본 정보 입력
-            info_frame = ttk.LabelFrame(dialog, text="기본 정보", padding=10)
-            info_frame.pack(fill=tk.X, padx=10, pady=5)
-            
-            ttk.Label(info_frame, text="템플릿명:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
-            name_var = tk.StringVar()
-            ttk.Entry(info_frame, textvariable=name_var, width=30).grid(row=0, column=1, padx=5, pady=5)
-            
-            ttk.Label(info_frame, text="설명:").grid(row=1, column=0, sticky="w", padx=5, pady=5)
-            desc_var = tk.StringVar()
-            ttk.Entry(info_frame, textvariable=desc_var, width=30).grid(row=1, column=1, padx=5, pady=5)
-            
-            ttk.Label(info_frame, text="타입:").grid(row=2, column=0, sticky="w", padx=5, pady=5)
-            type_var = tk.StringVar(value="custom")
-            type_combo = ttk.Combobox(info_frame, textvariable=type_var, 
-                                    values=["production", "qc", "custom"], state="readonly")
-            type_combo.grid(row=2, column=1, padx=5, pady=5)
-            
-            ttk.Label(info_frame, text="심각도 모드:").grid(row=3, column=0, sticky="w", padx=5, pady=5)
-            severity_var = tk.StringVar(value="standard")
-            severity_combo = ttk.Combobox(info_frame, textvariable=severity_var,
-                                        values=["strict", "standard", "lenient"], state="readonly")
-            severity_combo.grid(row=3, column=1, padx=5, pady=5)
-            
-            # 검수 옵션 선택
-            options_frame = ttk.LabelFrame(dialog, text="검수 옵션", padding=10)
-            options_frame.pack(fill=tk.X, padx=10, pady=5)
-            
-            option_vars = {
-                'check_checklist': tk.BooleanVar(value=True),
-                'check_naming': tk.BooleanVar(value=True),
-                'check_ranges': tk.BooleanVar(value=True),
-                'check_trends': tk.BooleanVar(value=False),
-                'check_missing_values': tk.BooleanVar(value=True),
-                'check_outliers': tk.BooleanVar(value=True),
-                'check_duplicates': tk.BooleanVar(value=True),
-                'check_consistency': tk.BooleanVar(value=True)
-            }
-            
-            option_labels = {
-                'check_checklist': 'Check list 중점 검사',
-                'check_naming': '명명 규칙 검사',
-                'check_ranges': '값 범위 분석',
-                'check_trends': '데이터 트렌드 분석',
-                'check_missing_values': '누락값 검사',
-                'check_outliers': '이상치 검사',
-                'check_duplicates': '중복 검사',
-                'check_consistency': '일관성 검사'
-            }
-            
-            for i, (key, var) in enumerate(option_vars.items()):
-                ttk.Checkbutton(options_frame, text=option_labels[key], 
-                              variable=var).grid(row=i//2, column=i%2, sticky="w", padx=5, pady=2)
-            
-            # 버튼 영역
-            button_frame = ttk.Frame(dialog)
-            button_frame.pack(fill=tk.X, padx=10, pady=10)
-            
-            def save_template():
-                if not name_var.get():
-                    messagebox.showwarning("입력 오류", "템플릿명을 입력해주세요.")
-                    return
+            # 본문 위젯은 idle 시점에 생성 (클릭 처리 후 빈 창을 먼저 표시)
+            def build_body():
+                # 기본 정보 입력
+                info_frame = ttk.LabelFrame(dialog, text="기본 정보", padding=10)
+                info_frame.pack(fill=tk.X, padx=10, pady=5)
                 
-                # 템플릿 생성
-                check_options = QCCheckOptions(**{key: var.get() for key, var in option_vars.items()})
-                template = QCTemplate(
-                    template_name=name_var.get(),
-                    template_type=type_var.get(),
-                    description=desc_var.get(),
-                    severity_mode=severity_var.get(),
-                    check_options=check_options,
-                    created_by=getattr(self, 'current_user', 'Unknown')
-                )
+                ttk.Label(info_frame, text="템플릿명:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
+                name_var = tk.StringVar()
+                ttk.Entry(info_frame, textvariable=name_var, width=30).grid(row=0, column=1, padx=5, pady=5)
                 
-                template_id = self.template_manager.create_template(template)
-                if template_id:
-                    messagebox.showinfo("성공", f"템플릿 '{name_var.get()}'이 생성되었습니다.")
-                    self._load_qc_templates()  # 템플릿 목록 새로고침
-                    dialog.destroy()
-                else:
-                    messagebox.showerror("오류", "템플릿 생성에 실패했습니다.")
+                ttk.Label(info_frame, text="설명:").grid(row=1, column=0, sticky="w", padx=5, pady=5)
+                desc_var = tk.StringVar()
+                ttk.Entry(info_frame, textvariable=desc_var, width=30).grid(row=1, column=1, padx=5, pady=5)
+                
+                ttk.Label(info_frame, text="타입:").grid(row=2, column=0, sticky="w", padx=5, pady=5)
+                type_var = tk.StringVar(value="custom")
+                type_combo = ttk.Combobox(info_frame, textvariable=type_var, 
+                                        values=["production", "qc", "custom"], state="readonly")
+                type_combo.grid(row=2, column=1, padx=5, pady=5)
+                
+                ttk.Label(info_frame, text="심각도 모드:").grid(row=3, column=0, sticky="w", padx=5, pady=5)
+                severity_var = tk.StringVar(value="standard")
+                severity_combo = ttk.Combobox(info_frame, textvariable=severity_var,
+                                            values=["strict", "standard", "lenient"], state="readonly")
+                severity_combo.grid(row=3, column=1, padx=5, pady=5)
+                
+                # 검수 옵션 선택
+                options_frame = ttk.LabelFrame(dialog, text="검수 옵션", padding=10)
+                options_frame.pack(fill=tk.X, padx=10, pady=5)
+                
+                option_vars = {
+                    'check_checklist': tk.BooleanVar(value=True),
+                    'check_naming': tk.BooleanVar(value=True),
+                    'check_ranges': tk.BooleanVar(value=True),
+                    'check_trends': tk.BooleanVar(value=False),
+                    'check_missing_values': tk.BooleanVar(value=True),
+                    'check_outliers': tk.BooleanVar(value=True),
+                    'check_duplicates': tk.BooleanVar(value=True),
+                    'check_consistency': tk.BooleanVar(value=True)
+                }
+                
+                option_labels = {
+                    'check_checklist': 'Check list 중점 검사',
+                    'check_naming': '명명 규칙 검사',
+                    'check_ranges': '값 범위 분석',
+                    'check_trends': '데이터 트렌드 분석',
+                    'check_missing_values': '누락값 검사',
+                    'check_outliers': '이상치 검사',
+                    'check_duplicates': '중복 검사',
+                    'check_consistency': '일관성 검사'
+                }
+                
+                for i, (key, var) in enumerate(option_vars.items()):
+                    ttk.Checkbutton(options_frame, text=option_labels[key], 
+                                  variable=var).grid(row=i//2, column=i%2, sticky="w", padx=5, pady=2)
+                
+                # 버튼 영역
+                button_frame = ttk.Frame(dialog)
+                button_frame.pack(fill=tk.X, padx=10, pady=10)
+                
+                def save_template():
+                    if not name_var.get():
+                        messagebox.showwarning("입력 오류", "템플릿명을 입력해주세요.")
+                        return
+                    
+                    # 템플릿 생성
+                    check_options = QCCheckOptions(**{key: var.get() for key, var in option_vars.items()})
+                    template = QCTemplate(
+                        template_name=name_var.get(),
+                        template_type=type_var.get(),
+                        description=desc_var.get(),
+                        severity_mode=severity_var.get(),
+                        check_options=check_options,
+                        created_by=getattr(self, 'current_user', 'Unknown')
+                    )
+                    
+                    template_id = self.template_manager.create_template(template)
+                    if template_id:
+                        messagebox.showinfo("성공", f"템플릿 '{name_var.get()}'이 생성되었습니다.")
+                        self._load_qc_templates()  # 템플릿 목록 새로고침
+                        dialog.destroy()
+                    else:
+                        messagebox.showerror("오류", "템플릿 생성에 실패했습니다.")
+                
+                ttk.Button(button_frame, text="취소", command=dialog.destroy).pack(side=tk.RIGHT, padx=5)
+                ttk.Button(button_frame, text="저장", command=save_template).pack(side=tk.RIGHT)
             
-            ttk.Button(button_frame, text="취소", command=dialog.destroy).pack(side=tk.RIGHT, padx=5)
-            ttk.Button(button_frame, text="저장", command=save_template).pack(side=tk.RIGHT)
+            self._defer_dialog_body(dialog, build_body, "템플릿 생성 다이얼로그 오류")
             
         except Exception as e:
             messagebox.showerror("오류", f"템플릿 생성 다이얼로그 오류: {str(e)}")
     
+    def defer_dialog_body(self, dialog, build_body, error_msg):
+        """다이얼로그 본문 생성을 after_idle로 지연"""
+        def run():
+            try:
+                build_body()
+            except Exception as e:
+                messagebox.showerror("오류", f"{error_msg}: {str(e)}")
+        
+        dialog.after_idle(run)
+    
     def _edit_template(self):
         """기존 템플릿 편집"""
         selected_template_name = self.qc_template_var.get()
@@ -1068,6 +1522,56 @@ def add_enhanced_qc_functions_to_class(cls):
         except Exception as e:
             messagebox.showerror("오류", f"템플릿 내보내기 오류: {str(e)}")
     
+    def get_qc_executor(self):
+        """배치 검수용 공유 스레드 풀 (최초 사용 시 생성, 종료 시 정리)"""
+        executor = getattr(self, '_qc_executor', None)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix='qc')
+            atexit.register(executor.shutdown, wait=False)
+            self._qc_executor = executor
+        return executor
+
+    def get_interactive_qc_executor(self):
+        """
+        대화형 QC 검수 전용 스레드 풀 (최초 사용 시 생성, 종료 시 정리)
+        배치 검수/차트 렌더링이 공유 풀을 차지하고 있어도 검수 실행이 뒤에서 기다리지 않도록 분리
+        """
+        executor = getattr(self, '_interactive_qc_executor', None)
+        if executor is None:
+            # 기본 데이터 조회와 Check list 파일 로드를 동시에 진행할 두 개의 스레드
+            executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='qc-run')
+            atexit.register(executor.shutdown, wait=False)
+            self._interactive_qc_executor = executor
+        return executor
+
+    def when_qc_future_done(self, future, callback):
+        """
+        백그라운드 QC 작업이 끝나면 Tk 스레드에서 callback(future) 호출
+        (after로 완료 여부만 확인하므로 이벤트 루프를 중첩해서 돌리지 않음)
+        """
+        if future.done():
+            callback(future)
+        else:
+            self.window.after(_QC_POLL_INTERVAL_MS, self._when_qc_future_done, future, callback)
+
+    def set_qc_run_active(self, active):
+        """QC 검수 진행 상태 설정 - 진행 중에는 실행 버튼을 비활성화해 중복 실행 방지"""
+        self._qc_run_active = active
+        run_button = getattr(getattr(self, 'qc_tab_controller', None), 'qc_run_btn', None)
+        if run_button is not None and run_button.winfo_exists():
+            run_button.config(state="disabled" if active else "normal")
+
+    def update_batch_qc_progress(self, progress, message):
+        """배치 검수 진행 상황 표시 - 값은 항상 최신으로 갱신하고 강제 재그리기 빈도만 제한"""
+        self.qc_progress['value'] = progress
+        # 라벨은 매번 갱신해 진행 막대와 같은 최신 메시지를 유지 (건너뛴 재그리기는 다음 유휴 시점에 반영)
+        self.qc_status_label.config(text=message)
+        now = time.monotonic()
+        if now - getattr(self, '_last_batch_ui_update', 0.0) < _UI_UPDATE_INTERVAL:
+            return
+        self._last_batch_ui_update = now
+        self.window.update_idletasks()
+
     def perform_batch_qc_check(self):
         """배치 QC 검수 실행"""
         try:
@@ -1085,60 +1589,61 @@ def add_enhanced_qc_functions_to_class(cls):
             dialog.transient(self.window)
             dialog.grab_set()
             
-            # 세션 정보 입력
-            ttk.Label(dialog, text="세션명:").pack(pady=5)
-            session_name_var = tk.StringVar(value=f"Batch_QC_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
-            ttk.Entry(dialog, textvariable=session_name_var, width=40).pack(pady=5)
-            
-            ttk.Label(dialog, text="검수자:").pack(pady=5)
-            inspector_var = tk.StringVar(value=getattr(self, 'current_user', 'Unknown'))
-            ttk.Entry(dialog, textvariable=inspector_var, width=40).pack(pady=5)
-            
-            ttk.Label(dialog, text=f"선택된 파일: {len(self.selected_qc_files)}개").pack(pady=10)
-            
-            # 배치 검수 실행
-            def start_batch():
-                try:
-                    manager = BatchQCManager(self.db_schema)
-                    session = manager.create_session(
-                        session_name_var.get(),
-                        inspector_var.get(),
-                        description="Enhanced QC에서 시작된 배치 검수"
-                    )
-                    
-                    # 파일들을 세션에 추가
-                    for filename, filepath in self.selected_qc_files.items():
-                        # 장비 타입 결정 (임시로 선택된 타입 사용)
-                        equipment_type_id = getattr(self, 'equipment_types_for_qc', {}).get(
-                            self.qc_type_var.get(), 1
+            # 본문 위젯은 idle 시점에 생성 (클릭 처리 후 빈 창을 먼저 표시)
+            def build_body():
+                # 세션 정보 입력
+                ttk.Label(dialog, text="세션명:").pack(pady=5)
+                session_name_var = tk.StringVar(value=f"Batch_QC_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+                ttk.Entry(dialog, textvariable=session_name_var, width=40).pack(pady=5)
+                
+                ttk.Label(dialog, text="검수자:").pack(pady=5)
+                inspector_var = tk.StringVar(value=getattr(self, 'current_user', 'Unknown'))
+                ttk.Entry(dialog, textvariable=inspector_var, width=40).pack(pady=5)
+                
+                ttk.Label(dialog, text=f"선택된 파일: {len(self.selected_qc_files)}개").pack(pady=10)
+                
+                # 배치 검수 실행
+                def start_batch():
+                    try:
+                        manager = BatchQCManager(self.db_schema)
+                        session = manager.create_session(
+                            session_name_var.get(),
+                            inspector_var.get(),
+                            description="Enhanced QC에서 시작된 배치 검수"
                         )
-                        session.add_item(filename, equipment_type_id, filepath)
-                    
-                    # 진행 상황 콜백 설정
-                    def progress_callback(progress, message):
-                        self.qc_progress.config(value=progress)
-                        self.qc_status_label.config(text=message)
-                        self.window.update_idletasks()
-                    
-                    def completion_callback(summary):
-                        self.qc_status_label.config(text=f"✅ 배치 검수 완료 - {summary['success_rate']:.1f}% 성공")
-                        self.qc_progress.config(value=100)
-                        messagebox.showinfo("완료", f"배치 검수가 완료되었습니다.\n성공률: {summary['success_rate']:.1f}%")
-                    
-                    session.set_callbacks(progress_callback, completion_callback)
-                    
-                    dialog.destroy()
-                    
-                    # 배치 검수 시작 (별도 스레드에서)
-                    import threading
-                    threading.Thread(target=lambda: session.start_batch_inspection(max_workers=3), 
-                                   daemon=True).start()
+                        
+                        # 파일들을 세션에 추가
+                        for filename, filepath in self.selected_qc_files.items():
+                            # 장비 타입 결정 (임시로 선택된 타입 사용)
+                            equipment_type_id = getattr(self, 'equipment_types_for_qc', {}).get(
+                                self.qc_type_var.get(), 1
+                            )
+                            session.add_item(filename, equipment_type_id, filepath)
+                        
+                        # 진행 상황 콜백 설정
+                        def progress_callback(progress, message):
+                            self._update_batch_qc_progress(progress, message)
+                        
+                        def completion_callback(summary):
+                            self.qc_status_label.config(text=f"✅ 배치 검수 완료 - {summary['success_rate']:.1f}% 성공")
+                            self.qc_progress.config(value=100)
+                            self.window.update_idletasks()
+                            messagebox.showinfo("완료", f"배치 검수가 완료되었습니다.\n성공률: {summary['success_rate']:.1f}%")
+                        
+                        session.set_callbacks(progress_callback, completion_callback)
+                        
+                        dialog.destroy()
+                        
+                        # 배치 검수 시작 (공유 스레드 풀에서)
+                        self._get_qc_executor().submit(session.start_batch_inspection, max_workers=3)
                     
-                except Exception as e:
-                    messagebox.showerror("오류", f"배치 검수 시작 오류: {str(e)}")
+                    except Exception as e:
+                        messagebox.showerror("오류", f"배치 검수 시작 오류: {str(e)}")
+                
+                ttk.Button(dialog, text="시작", command=start_batch).pack(pady=10)
+                ttk.Button(dialog, text="취소", command=dialog.destroy).pack()
             
-            ttk.Button(dialog, text="시작", command=start_batch).pack(pady=10)
-            ttk.Button(dialog, text="취소", command=dialog.destroy).pack()
+            self._defer_dialog_body(dialog, build_body, "배치 검수 오류")
             
         except Exception as e:
             messagebox.showerror("오류", f"배치 검수 오류: {str(e)}")
@@ -1161,46 +1666,50 @@ def add_enhanced_qc_functions_to_class(cls):
             dialog.transient(self.window)
             dialog.grab_set()
             
-            ttk.Label(dialog, text="보고서 유형:").pack(pady=5)
-            template_var = tk.StringVar(value="standard")
-            ttk.Combobox(dialog, textvariable=template_var, 
-                        values=["standard", "detailed", "summary", "customer"],
-                        state="readonly").pack(pady=5)
-            
-            ttk.Label(dialog, text="출력 형식:").pack(pady=5)
-            format_var = tk.StringVar(value="pdf")
-            ttk.Combobox(dialog, textvariable=format_var,
-                        values=["pdf", "docx", "html", "excel"],
-                        state="readonly").pack(pady=5)
-            
-            def generate_report():
-                try:
-                    file_path = filedialog.asksaveasfilename(
-                        title="보고서 저장",
-                        defaultextension=f".{format_var.get()}",
-                        filetypes=[(f"{format_var.get().upper()} 파일", f"*.{format_var.get()}")]
-                    )
-                    
-                    if file_path:
-                        generator = QCReportGenerator()
-                        result_path = generator.generate_report(
-                            self.last_qc_results,
-                            template_var.get(),
-                            format_var.get(),
-                            file_path
+            # 본문 위젯은 idle 시점에 생성 (클릭 처리 후 빈 창을 먼저 표시)
+            def build_body():
+                ttk.Label(dialog, text="보고서 유형:").pack(pady=5)
+                template_var = tk.StringVar(value="standard")
+                ttk.Combobox(dialog, textvariable=template_var, 
+                            values=["standard", "detailed", "summary", "customer"],
+                            state="readonly").pack(pady=5)
+                
+                ttk.Label(dialog, text="출력 형식:").pack(pady=5)
+                format_var = tk.StringVar(value="pdf")
+                ttk.Combobox(dialog, textvariable=format_var,
+                            values=["pdf", "docx", "html", "excel"],
+                            state="readonly").pack(pady=5)
+                
+                def generate_report():
+                    try:
+                        file_path = filedialog.asksaveasfilename(
+                            title="보고서 저장",
+                            defaultextension=f".{format_var.get()}",
+                            filetypes=[(f"{format_var.get().upper()} 파일", f"*.{format_var.get()}")]
                         )
                         
-                        if result_path:
-                            messagebox.showinfo("성공", f"보고서가 생성되었습니다.\n{result_path}")
-                            dialog.destroy()
-                        else:
-                            messagebox.showerror("오류", "보고서 생성에 실패했습니다.")
+                        if file_path:
+                            generator = QCReportGenerator()
+                            result_path = generator.generate_report(
+                                self.last_qc_results,
+                                template_var.get(),
+                                format_var.get(),
+                                file_path
+                            )
+                            
+                            if result_path:
+                                messagebox.showinfo("성공", f"보고서가 생성되었습니다.\n{result_path}")
+                                dialog.destroy()
+                            else:
+                                messagebox.showerror("오류", "보고서 생성에 실패했습니다.")
+                    
+                    except Exception as e:
+                        messagebox.showerror("오류", f"보고서 생성 오류: {str(e)}")
                 
-                except Exception as e:
-                    messagebox.showerror("오류", f"보고서 생성 오류: {str(e)}")
+                ttk.Button(dialog, text="생성", command=generate_report).pack(pady=10)
+                ttk.Button(dialog, text="취소", command=dialog.destroy).pack()
             
-            ttk.Button(dialog, text="생성", command=generate_report).pack(pady=10)
-            ttk.Button(dialog, text="취소", command=dialog.destroy).pack()
+            self._defer_dialog_body(dialog, build_body, "보고서 생성 오류")
             
         except Exception as e:
             messagebox.showerror("오류", f"보고서 생성 오류: {str(e)}")
@@ -1217,63 +1726,63 @@ def add_enhanced_qc_functions_to_class(cls):
             dialog.transient(self.window)
             dialog.grab_set()
             
-            ttk.Label(dialog, text="세션 이름:").pack(pady=5)
-            session_name_var = tk.StringVar(value=f"Batch_QC_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
-            ttk.Entry(dialog, textvariable=session_name_var).pack(pady=5)
-            
-            ttk.Label(dialog, text="검수자명:").pack(pady=5)
-            inspector_var = tk.StringVar(value="QC Engineer")
-            ttk.Entry(dialog, textvariable=inspector_var).pack(pady=5)
-            
-            def start_batch():
-                try:
-                    if not hasattr(self, 'selected_qc_files') or not self.selected_qc_files:
-                        messagebox.showwarning("알림", "먼저 파일을 선택해주세요.")
-                        return
-                    
-                    from .batch_qc import BatchQCSession
-                    from .schema import DBSchema
-                    
-                    db_schema = getattr(self, 'db_schema', None) or DBSchema()
-                    session = BatchQCSession(
-                        session_name_var.get(),
-                        inspector_var.get(),
-                        template_id=None,
-                        db_schema=db_schema
-                    )
-                    
-                    # 선택된 파일들을 세션에 추가
-                    selected_type = self.qc_type_var.get()
-                    equipment_type_id = getattr(self, 'equipment_types_for_qc', {}).get(selected_type)
-                    
-                    for filename, filepath in self.selected_qc_files.items():
-                        session.add_item(filename, equipment_type_id, filepath)
-                    
-                    # 진행 상황 콜백 설정
-                    def progress_callback(progress, message):
-                        self.qc_progress.config(value=progress)
-                        self.qc_status_label.config(text=message)
-                        self.window.update_idletasks()
-                    
-                    def completion_callback(summary):
-                        self.qc_status_label.config(text=f"✅ 배치 검수 완료 - {summary['success_rate']:.1f}% 성공")
-                        self.qc_progress.config(value=100)
-                        messagebox.showinfo("완료", f"배치 검수가 완료되었습니다.\n성공률: {summary['success_rate']:.1f}%")
-                    
-                    session.set_callbacks(progress_callback, completion_callback)
-                    
-                    dialog.destroy()
-                    
-                    # 배치 검수 시작 (별도 스레드에서)
-                    import threading
-                    threading.Thread(target=lambda: session.start_batch_inspection(max_workers=3), 
-                                   daemon=True).start()
+            # 본문 위젯은 idle 시점에 생성 (클릭 처리 후 빈 창을 먼저 표시)
+            def build_body():
+                ttk.Label(dialog, text="세션 이름:").pack(pady=5)
+                session_name_var = tk.StringVar(value=f"Batch_QC_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+                ttk.Entry(dialog, textvariable=session_name_var).pack(pady=5)
+                
+                ttk.Label(dialog, text="검수자명:").pack(pady=5)
+                inspector_var = tk.StringVar(value="QC Engineer")
+                ttk.Entry(dialog, textvariable=inspector_var).pack(pady=5)
+                
+                def start_batch():
+                    try:
+                        if not hasattr(self, 'selected_qc_files') or not self.selected_qc_files:
+                            messagebox.showwarning("알림", "먼저 파일을 선택해주세요.")
+                            return
+                        
+                        from .batch_qc import BatchQCSession
+                        
+                        db_schema = self._get_qc_db_schema()
+                        session = BatchQCSession(
+                            session_name_var.get(),
+                            inspector_var.get(),
+                            template_id=None,
+                            db_schema=db_schema
+                        )
+                        
+                        # 선택된 파일들을 세션에 추가
+                        selected_type = self.qc_type_var.get()
+                        equipment_type_id = getattr(self, 'equipment_types_for_qc', {}).get(selected_type)
+                        
+                        for filename, filepath in self.selected_qc_files.items():
+                            session.add_item(filename, equipment_type_id, filepath)
+                        
+                        # 진행 상황 콜백 설정
+                        def progress_callback(progress, message):
+                            self._update_batch_qc_progress(progress, message)
+                        
+                        def completion_callback(summary):
+                            self.qc_status_label.config(text=f"✅ 배치 검수 완료 - {summary['success_rate']:.1f}% 성공")
+                            self.qc_progress.config(value=100)
+                            self.window.update_idletasks()
+                            messagebox.showinfo("완료", f"배치 검수가 완료되었습니다.\n성공률: {summary['success_rate']:.1f}%")
+                        
+                        session.set_callbacks(progress_callback, completion_callback)
+                        
+                        dialog.destroy()
+                        
+                        # 배치 검수 시작 (공유 스레드 풀에서)
+                        self._get_qc_executor().submit(session.start_batch_inspection, max_workers=3)
                     
-                except Exception as e:
-                    messagebox.showerror("오류", f"배치 검수 시작 오류: {str(e)}")
+                    except Exception as e:
+                        messagebox.showerror("오류", f"배치 검수 시작 오류: {str(e)}")
+                
+                ttk.Button(dialog, text="시작", command=start_batch).pack(pady=10)
+                ttk.Button(dialog, text="취소", command=dialog.destroy).pack()
             
-            ttk.Button(dialog, text="시작", command=start_batch).pack(pady=10)
-            ttk.Button(dialog, text="취소", command=dialog.destroy).pack()
+            self._defer_dialog_body(dialog, build_body, "배치 검수 오류")
             
         except Exception as e:
             messagebox.showerror("오류", f"배치 검수 오류: {str(e)}")
@@ -1283,5 +1792,22 @@ def add_enhanced_qc_functions_to_class(cls):
     cls.select_qc_files = select_qc_files
     cls.perform_enhanced_qc_check = perform_enhanced_qc_check
     cls.show_enhanced_qc_statistics = show_enhanced_qc_statistics
+    cls._get_qc_db_schema = get_qc_db_schema
+    cls._load_qc_default_data = load_qc_default_data
+    cls._get_qc_summary = get_qc_summary
     cls.create_enhanced_charts = create_enhanced_charts
+    cls._render_enhanced_charts = render_enhanced_charts
+    cls._finish_enhanced_charts = finish_enhanced_charts
+    cls._show_chart_error = show_chart_error
+    cls._get_qc_stats_cards = get_qc_stats_cards
+    cls._hide_qc_stats_cards = hide_qc_stats_cards
+    cls._clear_chart_container = clear_chart_container
+    cls._on_chart_container_visible = on_chart_container_visible
+    cls._on_chart_container_resized = on_chart_container_resized
+    cls._update_batch_qc_progress = update_batch_qc_progress
+    cls._get_qc_executor = get_qc_executor
+    cls._get_interactive_qc_executor = get_interactive_qc_executor
+    cls._when_qc_future_done = when_qc_future_done
+    cls._set_qc_run_active = set_qc_run_active
+    cls._defer_dialog_body = defer_dialog_body
     cls.export_qc_results_simple = export_qc_results_simple 
\ No newline at end of file
@@ -51,6 +51,23 @@ def export_dataframe_to_file(df, default_filename="export", title="데이터 내
         return None
 
 
+def write_dataframe_file(df, file_path):
+    """
+    DataFrame을 확장자에 맞춰 CSV 또는 Excel 파일로 저장
+    
+    대화상자나 위젯에 접근하지 않으므로 작업 스레드에서 호출할 수 있습니다.
+    
+    Args:
+        df: 저장할 DataFrame
+        file_path: 저장 경로 (.csv가 아니면 Excel로 저장)
+    """
+    if file_path.endswith(".csv"):
+        # 청크 단위로 기록해 변환 버퍼 메모리를 제한
+        df.to_csv(file_path, index=False, encoding="utf-8-sig", chunksize=50000)
+    else:
+        df.to_excel(file_path, index=False)
+
+
 def export_tree_data_to_file(tree_widget, columns, file_names=None, title="보고서 내보내기"):
     """
     TreeView 데이터를 파일로 내보내기
@@ -74,10 +91,14 @@ def export_tree_data_to_file(tree_widget, columns, file_names=None, title="보
         if not file_path:
             return None
             
-        # TreeView에서 데이터 추출
-        data = []
-        for item in tree_widget.get_children():
-            data.append(tree_widget.item(item)["values"])
+        # TreeView에서 데이터 추출 (VirtualTreeview는 화면 밖 행까지 보관한 목록 사용)
+        virtual_rows = getattr(tree_widget, 'virtual_rows', None)
+        if virtual_rows is not None:
+            data = list(virtual_rows)
+        else:
+            data = []
+            for item in tree_widget.get_children():
+                data.append(tree_widget.item(item)["values"])
         
         # 컬럼 이름 설정
         if file_names:
@@ -88,10 +109,7 @@ def export_tree_data_to_file(tree_widget, columns, file_names=None, title="보
         df = pd.DataFrame(data, columns=all_columns)
         
         # 파일 저장
-        if file_path.endswith(".csv"):
-            df.to_csv(file_path, index=False, encoding="utf-8-sig")
-        else:
-            df.to_excel(file_path, index=False)
+        write_dataframe_file(df, file_path)
             
         messagebox.showinfo("완료", "보고서가 성공적으로 저장되었습니다.")
         return file_path
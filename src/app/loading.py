@@ -81,17 +81,28 @@ class LoadingDialog:
         self.percentage_label = ttk.Label(self.top, text="0%")
         self.percentage_label.pack(pady=5)
         
+        # 마지막으로 표시한 진행률/상태 (변화가 없으면 다시 그리지 않음)
+        self._last_pct = 0
+        self._last_status = None
+        
         # 창 닫기 버튼 비활성화
         self.top.protocol("WM_DELETE_WINDOW", lambda: None)
         
         # 부모 창 중앙에 배치
         center_dialog_on_parent(self.top, parent)
     def update_progress(self, value, status_text=None):
+        pct = int(value)
+        status_changed = bool(status_text) and status_text != self._last_status
+        if pct == self._last_pct and not status_changed:
+            return
+        self._last_pct = pct
         self.progress_var.set(value)
-        self.percentage_label.config(text=f"{int(value)}%")
-        if status_text:
+        self.percentage_label.config(text=f"{pct}%")
+        if status_changed:
+            self._last_status = status_text
             self.status_label.config(text=status_text)
-        self.top.update()
+        # 화면 갱신만 처리 (사용자 입력 이벤트는 처리하지 않아 작업 중 재진입 방지)
+        self.top.update_idletasks()
     def close(self):
         self.top.grab_release()
         self.top.destroy()
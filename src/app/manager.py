@@ -3,16 +3,18 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, filedialog
 import sys, os
+import time
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from app.schema import DBSchema
 from app.loading import LoadingDialog
 from app.qc import add_qc_check_functions_to_class
 from app.enhanced_qc import add_enhanced_qc_functions_to_class
 # Default DB 기능 제거됨 - 리팩토링으로 중복 코드 정리
-from app.utils import create_treeview_with_scrollbar, create_label_entry_pair, format_num_value
-from app.data_utils import numeric_sort_key, calculate_string_similarity
+from app.utils import create_treeview_with_scrollbar, create_label_entry_pair, format_num_value, detached_widget, VirtualTreeview
+from app.data_utils import numeric_sort_key, calculate_string_similarity, pivot_item_values, item_value_diff_mask, ITEM_KEY_COLUMNS
 from app.config_manager import ConfigManager
-from app.file_service import FileService, export_dataframe_to_file, export_tree_data_to_file
+from app.file_service import FileService, export_dataframe_to_file, export_tree_data_to_file, write_dataframe_file
 from app.dialog_helpers import create_parameter_dialog, center_dialog, validate_numeric_range, handle_error
 
 # 🆕 새로운 설정 시스템 (선택적 사용)
@@ -36,7 +38,86 @@ except ImportError:
 
 # 첫 번째 DBManager 클래스 제거됨 - 중복 코드 정리
 
+# 비교 파일에서 사용하는 컬럼 (나머지 컬럼은 파싱 단계에서 버림)
+_DB_FILE_COLUMNS = ('Module', 'Part', 'ItemName', 'ItemType', 'ItemValue', 'ItemDescription')
+_DB_FILE_READ_OPTIONS = {
+    'dtype': str,
+    'usecols': lambda col: col in _DB_FILE_COLUMNS,
+    'engine': 'c',
+    'low_memory': False,
+    # 파일을 메모리에 매핑해 파서가 페이지를 직접 읽도록 함 (중간 버퍼 복사 생략)
+    'memory_map': True
+}
+
+# 보고서 파일 저장 완료 확인 간격 (밀리초)
+_EXPORT_POLL_INTERVAL_MS = 50
+
+def _read_db_file(file):
+    """
+    비교용 DB 파일(.txt/.csv/.db) 하나를 DataFrame으로 읽습니다.
+    작업 스레드에서 호출되므로 Tk 위젯에 접근하지 않으며, SQLite 연결도 호출한 스레드에서 만듭니다.
+    """
+    import pandas as pd
+    import sqlite3
+    
+    ext = os.path.splitext(file)[1].lower()
+    if ext == '.txt':
+        # 표준 텍스트 파일 형식: 필요한 컬럼만 읽어 ItemType 정보 보존
+        df = pd.read_csv(file, delimiter="\t", **_DB_FILE_READ_OPTIONS)
+        # 호환성을 위한 fallback: 누락된 컬럼에 기본값 추가
+        if 'ItemType' not in df.columns:
+            df['ItemType'] = 'double'  # 기본값
+        if 'ItemDescription' not in df.columns:
+            df['ItemDescription'] = ''
+    elif ext == '.csv':
+        df = pd.read_csv(file, **_DB_FILE_READ_OPTIONS)
+        # CSV 파일에서도 ItemType 보존 시도
+        if 'ItemType' not in df.columns:
+            df['ItemType'] = 'double'  # 기본값
+    elif ext == '.db':
+        # 읽기 전용으로 열어 저널 준비를 생략하고, 사용하는 컬럼만 커서로 바로 가져옴
+        from pathlib import Path
+        conn = sqlite3.connect(Path(file).resolve().as_uri() + "?mode=ro", uri=True)
+        try:
+            table_columns = [row[1] for row in conn.execute("PRAGMA table_info(main_table)")]
+            columns = [col for col in table_columns if col in _DB_FILE_COLUMNS]
+            if not columns:
+                raise ValueError("main_table에 비교할 컬럼이 없습니다.")
+            select_list = ", ".join(f'"{col}"' for col in columns)
+            rows = conn.execute(f"SELECT {select_list} FROM main_table").fetchall()
+        finally:
+            conn.close()
+        df = pd.DataFrame.from_records(rows, columns=columns, coerce_float=False)
+        # DB 파일에서도 ItemType 보존 시도
+        if 'ItemType' not in df.columns:
+            df['ItemType'] = 'double'  # 기본값
+    else:
+        raise ValueError(f"지원하지 않는 파일 형식입니다: {ext}")
+    return df
+
+
 class DBManager:
+    # 비교 트리뷰의 고정 키 컬럼 (나머지는 파일별 값 컬럼)
+    _KEY_COLUMNS = ("Module", "Part", "ItemName")
+
+    # 격자뷰 계층별 스타일 태그 - 트리뷰 생성 시 한 번만 설정
+    _GRID_TAGS = {
+        # 모듈 레벨 - 가장 크고 굵게 (기본 파란색)
+        "module": {"font": ("Arial", 11, "bold"), "background": "#F5F5F5", "foreground": "#1565C0"},
+        # 모듈 레벨 - 차이 있음 (빨간색 강조)
+        "module_diff": {"font": ("Arial", 11, "bold"), "background": "#F5F5F5", "foreground": "#D32F2F"},
+        # 파트 레벨 - 중간 크기, 볼드
+        "part": {"font": ("Arial", 10, "bold"), "background": "#FAFAFA", "foreground": "#424242"},
+        # 파트 레벨 - 모든 값 동일 (초록색)
+        "part_clean": {"font": ("Arial", 10, "bold"), "background": "#FAFAFA", "foreground": "#2E7D32"},
+        # 파트 레벨 - 차이 있음 (빨간색 강조)
+        "part_diff": {"font": ("Arial", 10, "bold"), "background": "#FAFAFA", "foreground": "#D32F2F"},
+        # 파라미터 레벨 - 기본 크기
+        "parameter_same": {"font": ("Arial", 9), "background": "white", "foreground": "black"},
+        # 차이점이 있는 파라미터 - 전체 목록 탭과 동일한 색상
+        "parameter_different": {"font": ("Arial", 9), "background": "#FFECB3", "foreground": "#E65100"},
+    }
+
     def __init__(self):
         # 🆕 새로운 설정 시스템 사용 (기존 코드 유지)
         if USE_NEW_CONFIG:
@@ -49,6 +130,7 @@ class DBManager:
         self.file_names = []
         self.folder_path = ""
         self.merged_df = None
+        self._pivot_cache = None
         self.context_menu = None
         
         # QC 엔지니어용 탭 프레임들을 저장할 변수들
@@ -149,6 +231,7 @@ class DBManager:
         self.main_notebook.pack(expand=True, fill=tk.BOTH)
         self.comparison_notebook = ttk.Notebook(self.main_notebook)
         self.main_notebook.add(self.comparison_notebook, text="DB 비교")
+        self.comparison_notebook.bind("<<NotebookTabChanged>>", self._ensure_tab_built)
         self.log_text = tk.Text(self.window, height=5, state=tk.DISABLED)
         self.log_text.pack(side=tk.BOTTOM, fill=tk.X, padx=5, pady=5)
         log_scrollbar = ttk.Scrollbar(self.log_text, orient="vertical", command=self.log_text.yview)
@@ -546,10 +629,25 @@ class DBManager:
         self.window.config(menu=menubar)
 
     def update_log(self, message):
-        """로그 표시 영역에 메시지를 추가합니다."""
+        """로그 표시 영역에 메시지를 추가합니다 (연속된 로그는 모아서 한 번에 표시)."""
+        t = time.localtime()
+        line = "[%04d-%02d-%02d %02d:%02d:%02d] %s\n" % (
+            t.tm_year, t.tm_mon, t.tm_mday, t.tm_hour, t.tm_min, t.tm_sec, message)
+        pending = getattr(self, '_pending_log_lines', None)
+        if pending is None:
+            pending = self._pending_log_lines = []
+            # 유휴 시점에 한 번만 Text 위젯을 갱신 (update_idletasks 중에도 처리됨)
+            self.log_text.after_idle(self._flush_log)
+        pending.append(line)
+
+    def _flush_log(self):
+        """모아 둔 로그를 Text 위젯에 한 번에 추가"""
+        lines = self._pending_log_lines
+        self._pending_log_lines = None
+        if not lines:
+            return
         self.log_text.configure(state=tk.NORMAL)
-        from datetime import datetime
-        self.log_text.insert(tk.END, f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {message}\n")
+        self.log_text.insert(tk.END, "".join(lines))
         self.log_text.see(tk.END)
         self.log_text.configure(state=tk.DISABLED)
 
@@ -602,14 +700,11 @@ class DBManager:
         try:
             self.maint_mode = True
             self.update_log("🚀 유지보수 모드 활성화 시작...")
-            
-            # QC 검수 탭 생성 (Enhanced QC 사용)
             self.update_log("📋 Enhanced QC 검수 탭 생성 중...")
-            self.create_qc_tabs_with_advanced_features()
-            
-            # Default DB 관리 탭 생성 (동기적 실행)
             self.update_log("🔧 Default DB 관리 탭 생성 중...")
-            self.create_default_db_tab()
+            
+            # QC 검수 탭 (Enhanced QC 사용) 및 Default DB 관리 탭을 한 번에 생성
+            self._create_maint_tabs()
             
             # 상태 업데이트
             self.update_log("✅ QC 엔지니어 모드가 활성화되었습니다.")
@@ -628,11 +723,23 @@ class DBManager:
             import traceback
             traceback.print_exc()
 
+    def _create_maint_tabs(self):
+        """유지보수 모드 탭 생성 - 노트북을 잠시 내려 두어 레이아웃 계산을 마지막에 한 번만 수행"""
+        self.main_notebook.pack_forget()
+        try:
+            self.create_qc_tabs_with_advanced_features()
+            self.create_default_db_tab()
+        finally:
+            # 로그 창보다 앞에 다시 배치해 원래 패킹 순서 유지
+            self.main_notebook.pack(expand=True, fill=tk.BOTH, before=self.log_text)
+
     def create_comparison_tabs(self):
         """비교 관련 탭 생성 - 기본 기능만"""
         self.create_grid_view_tab()
         self.create_comparison_tab()
         self.create_diff_only_tab()
+        # 탭 구성(체크박스 열 등)은 모드에 따라 다르므로 생성 시 모드 기록
+        self._comparison_tabs_maint_mode = self.maint_mode
         # 보고서, 간단 비교, 고급 분석은 QC 탭으로 이동
 
     def create_qc_tabs_with_advanced_features(self):
@@ -755,47 +862,86 @@ class DBManager:
         export_btn.pack(side=tk.RIGHT, padx=10)
         
         columns = ["Module", "Part", "ItemName"] + (self.file_names if self.file_names else [])
-        self.qc_report_tree = ttk.Treeview(report_tab, columns=columns, show="headings", selectmode="browse")
+        _, self.qc_report_tree = self._build_report_tree(report_tab, columns)
+        
+        self.update_qc_report_view()
+
+    def _build_report_tree(self, parent, columns, width_map=None, selectmode="browse", default_width=120):
+        """
+        보고서형 트리뷰(헤딩만 표시)와 스크롤바를 만들어 parent에 배치
+        
+        행이 많으므로 화면에 보이는 행만 항목으로 만드는 VirtualTreeview를 사용하며,
+        컬럼 너비는 width_map에 없으면 default_width를 사용합니다.
         
+        Returns:
+            tuple: (frame, tree)
+        """
+        frame = ttk.Frame(parent)
+        tree = VirtualTreeview(frame, columns=columns, show="headings", selectmode=selectmode)
+        width_map = width_map or {}
         for col in columns:
-            self.qc_report_tree.heading(col, text=col)
-            self.qc_report_tree.column(col, width=120)
+            tree.heading(col, text=col)
+            tree.column(col, width=width_map.get(col, default_width))
         
-        v_scroll = ttk.Scrollbar(report_tab, orient="vertical", command=self.qc_report_tree.yview)
-        h_scroll = ttk.Scrollbar(report_tab, orient="horizontal", command=self.qc_report_tree.xview)
-        self.qc_report_tree.configure(yscroll=v_scroll.set, xscroll=h_scroll.set)
+        v_scroll = ttk.Scrollbar(frame, orient="vertical", command=tree.yview)
+        h_scroll = ttk.Scrollbar(frame, orient="horizontal", command=tree.xview)
+        tree.configure(yscroll=v_scroll.set, xscroll=h_scroll.set)
         
         v_scroll.pack(side=tk.RIGHT, fill=tk.Y)
         h_scroll.pack(side=tk.BOTTOM, fill=tk.X)
-        self.qc_report_tree.pack(expand=True, fill=tk.BOTH)
-        
-        self.update_qc_report_view()
+        tree.pack(expand=True, fill=tk.BOTH)
+        frame.pack(expand=True, fill=tk.BOTH)
+        return frame, tree
+
+    def _get_item_value_pivot(self):
+        """
+        항목별 파일 값 pivot과 차이 여부 - 비교 뷰들이 공유하며 merged_df/파일 목록이 바뀔 때만 다시 계산
+        """
+        file_names = tuple(self.file_names)
+        cached = self._pivot_cache
+        if cached is None or cached[0] is not self.merged_df or cached[1] != file_names:
+            pivot = pivot_item_values(self.merged_df, file_names)
+            cached = self._pivot_cache = (self.merged_df, file_names, pivot, item_value_diff_mask(pivot))
+        return cached[2], cached[3]
 
     def update_qc_report_view(self):
         """QC 보고서 뷰 업데이트"""
         if not hasattr(self, 'qc_report_tree'):
             return
             
-        for item in self.qc_report_tree.get_children():
-            self.qc_report_tree.delete(item)
-            
+        rows = []
         if self.merged_df is not None:
-            grouped = self.merged_df.groupby(["Module", "Part", "ItemName"])
-            for (module, part, item_name), group in grouped:
-                values = [module, part, item_name]
-                for fname in self.file_names:
-                    model_data = group[group["Model"] == fname]
-                    if not model_data.empty:
-                        values.append(str(model_data["ItemValue"].iloc[0]))
-                    else:
-                        values.append("-")
-                self.qc_report_tree.insert("", "end", values=values)
+            # 항목별 파일 값은 공유 pivot에서 가져옴
+            pivot, _ = self._get_item_value_pivot()
+            rows = pivot.reset_index().itertuples(index=False, name=None)
+        self.qc_report_tree.set_rows(rows)
+
+    def _add_lazy_tab(self, notebook, text, builder):
+        """빈 탭만 추가하고 내용은 처음 선택될 때 builder(tab)로 생성"""
+        tab = ttk.Frame(notebook)
+        tab._builder = lambda: builder(tab)
+        notebook.add(tab, text=text)
+        return tab
+
+    def _ensure_tab_built(self, event=None):
+        """<<NotebookTabChanged>> 처리 - 선택된 탭이 아직 비어 있으면 내용 생성"""
+        notebook = event.widget if event is not None else self.comparison_notebook
+        try:
+            tab = notebook.nametowidget(notebook.select())
+        except (KeyError, tk.TclError):
+            return
+        builder = getattr(tab, '_builder', None)
+        if builder:
+            tab._builder = None
+            builder()
 
     def create_diff_only_tab(self):
-        """차이만 보기 탭 생성"""
-        diff_tab = ttk.Frame(self.comparison_notebook)
-        self.comparison_notebook.add(diff_tab, text="🔍 차이점 분석")
-        
+        """차이만 보기 탭 생성 - 트리뷰는 탭을 처음 열 때 생성"""
+        self.diff_only_tree = None
+        self._add_lazy_tab(self.comparison_notebook, "🔍 차이점 분석", self._build_diff_only_tab)
+
+    def _build_diff_only_tab(self, diff_tab):
+        """차이만 보기 탭 내용 생성"""
         # 상단 정보 패널
         control_frame = ttk.Frame(diff_tab)
         control_frame.pack(fill=tk.X, padx=5, pady=5)
@@ -809,71 +955,47 @@ class DBManager:
         else:
             columns = ["Module", "Part", "ItemName"]
             
-        self.diff_only_tree = ttk.Treeview(diff_tab, columns=columns, show="headings", selectmode="extended")
-        
-        # 헤딩 설정
-        for col in columns:
-            self.diff_only_tree.heading(col, text=col)
-            if col in ["Module", "Part", "ItemName"]:
-                self.diff_only_tree.column(col, width=120)
-            else:
-                self.diff_only_tree.column(col, width=150)
-        
-        # 스크롤바 추가
-        v_scroll = ttk.Scrollbar(diff_tab, orient="vertical", command=self.diff_only_tree.yview)
-        h_scroll = ttk.Scrollbar(diff_tab, orient="horizontal", command=self.diff_only_tree.xview)
-        self.diff_only_tree.configure(yscroll=v_scroll.set, xscroll=h_scroll.set)
-        
-        # 위젯 배치
-        v_scroll.pack(side=tk.RIGHT, fill=tk.Y)
-        h_scroll.pack(side=tk.BOTTOM, fill=tk.X)
-        self.diff_only_tree.pack(expand=True, fill=tk.BOTH)
+        # 키 컬럼은 120, 파일별 값 컬럼은 150 너비
+        _, self.diff_only_tree = self._build_report_tree(
+            diff_tab, columns, dict.fromkeys(self._KEY_COLUMNS, 120),
+            selectmode="extended", default_width=150)
         
         # 차이점 데이터 업데이트
         self.update_diff_only_view()
 
+    def _configure_diff_only_columns(self, columns):
+        """차이점 트리뷰 헤딩/너비 설정 - 키 컬럼과 파일 컬럼을 나눠 한 번씩만 분기"""
+        key_count = len(self._KEY_COLUMNS)
+        for col in columns[:key_count]:
+            self.diff_only_tree.heading(col, text=col)
+            self.diff_only_tree.column(col, width=120)
+        for col in columns[key_count:]:
+            self.diff_only_tree.heading(col, text=col)
+            self.diff_only_tree.column(col, width=150)
+
     def update_diff_only_view(self):
         """차이점만 보기 탭 업데이트 - 하이라이트 제거"""
-        if not hasattr(self, 'diff_only_tree'):
+        if getattr(self, 'diff_only_tree', None) is None:
+            # 아직 열지 않은 탭은 처음 열 때 최신 데이터로 채워짐
             return
             
-        for item in self.diff_only_tree.get_children():
-            self.diff_only_tree.delete(item)
-        
+        diff_rows = ()
         diff_count = 0
         if self.merged_df is not None:
             # 컬럼 업데이트
             columns = ["Module", "Part", "ItemName"] + self.file_names
             self.diff_only_tree["columns"] = columns
+            self._configure_diff_only_columns(columns)
             
-            for col in columns:
-                self.diff_only_tree.heading(col, text=col)
-                if col in ["Module", "Part", "ItemName"]:
-                    self.diff_only_tree.column(col, width=120)
-                else:
-                    self.diff_only_tree.column(col, width=150)
+            # 각 파일별 값(공유 pivot)에서 차이점이 있는 항목만 선택
+            pivot, diff_mask = self._get_item_value_pivot()
+            diff_rows = pivot[diff_mask].reset_index()
             
-            grouped = self.merged_df.groupby(["Module", "Part", "ItemName"])
-            
-            for (module, part, item_name), group in grouped:
-                # 각 파일별 값 추출
-                file_values = {}
-                for model in self.file_names:
-                    model_data = group[group["Model"] == model]
-                    if not model_data.empty:
-                        file_values[model] = str(model_data["ItemValue"].iloc[0])
-                    else:
-                        file_values[model] = "-"
-                
-                # 차이점이 있는지 확인
-                unique_values = set(v for v in file_values.values() if v != "-")
-                if len(unique_values) > 1:
-                    # 차이점이 있는 항목만 추가 (하이라이트 없이)
-                    row_values = [module, part, item_name]
-                    row_values.extend([file_values.get(model, "-") for model in self.file_names])
-                    
-                    self.diff_only_tree.insert("", "end", values=row_values)
-                    diff_count += 1
+            diff_count = len(diff_rows)
+            diff_rows = diff_rows.itertuples(index=False, name=None)
+        
+        # 차이점이 있는 항목만 표시 (하이라이트 없이) - 화면에 보이는 행만 트리뷰 항목으로 생성
+        self.diff_only_tree.set_rows(diff_rows)
         
         # 차이점 카운트 업데이트
         if hasattr(self, 'diff_only_count_label'):
@@ -887,38 +1009,71 @@ class DBManager:
         export_btn = ttk.Button(control_frame, text="보고서 내보내기", command=self.export_report)
         export_btn.pack(side=tk.RIGHT, padx=10)
         columns = ["Module", "Part", "ItemName"] + self.file_names
-        self.report_tree = ttk.Treeview(report_tab, columns=columns, show="headings", selectmode="browse")
-        for col in columns:
-            self.report_tree.heading(col, text=col)
-            self.report_tree.column(col, width=120)
-        v_scroll = ttk.Scrollbar(report_tab, orient="vertical", command=self.report_tree.yview)
-        h_scroll = ttk.Scrollbar(report_tab, orient="horizontal", command=self.report_tree.xview)
-        self.report_tree.configure(yscroll=v_scroll.set, xscroll=h_scroll.set)
-        v_scroll.pack(side=tk.RIGHT, fill=tk.Y)
-        h_scroll.pack(side=tk.BOTTOM, fill=tk.X)
-        self.report_tree.pack(expand=True, fill=tk.BOTH)
+        _, self.report_tree = self._build_report_tree(report_tab, columns)
         self.update_report_view()
 
     def update_report_view(self):
-        for item in self.report_tree.get_children():
-            self.report_tree.delete(item)
+        rows = []
         if self.merged_df is not None:
-            grouped = self.merged_df.groupby(["Module", "Part", "ItemName"])
-            for (module, part, item_name), group in grouped:
-                values = [module, part, item_name]
-                for fname in self.file_names:
-                    values.append(group[fname].iloc[0] if fname in group else "")
-                self.report_tree.insert("", "end", values=values)
+            pivot, _ = self._get_item_value_pivot()
+            rows = pivot.reset_index().itertuples(index=False, name=None)
+        self.report_tree.set_rows(rows)
 
     def export_report(self):
-        """보고서 내보내기 기능"""
+        """보고서 내보내기 기능 - 파일 쓰기(Excel은 셀 단위 기록)는 작업 스레드에서 수행해 화면이 멈추지 않게 함"""
+        if self.merged_df is None:
+            messagebox.showinfo("정보", "내보낼 데이터가 없습니다.")
+            return None
         try:
-            columns = ["Module", "Part", "ItemName"]
-            return self.file_service.export_tree_data(
-                self.report_tree, columns, self.file_names, "보고서 내보내기"
+            file_path = filedialog.asksaveasfilename(
+                defaultextension=".xlsx",
+                filetypes=[("Excel 파일", "*.xlsx"), ("CSV 파일", "*.csv"), ("모든 파일", "*.*")],
+                title="보고서 내보내기"
             )
+            if not file_path:
+                return None
+            
+            # 트리뷰를 다시 읽지 않고 보고서 뷰와 같은 공유 pivot에서 바로 생성
+            # (Module, Part, ItemName + 파일별 값 컬럼)
+            pivot, _ = self._get_item_value_pivot()
+            df = pivot.reset_index()
         except Exception as e:
             messagebox.showerror("오류", f"보고서 내보내기 중 오류 발생: {str(e)}")
+            return None
+        
+        loading_dialog = LoadingDialog(self.window)
+        loading_dialog.update_progress(0, "보고서 저장 중...")
+        
+        future = self._get_export_executor().submit(write_dataframe_file, df, file_path)
+        self._when_report_export_done(future, loading_dialog, file_path)
+        return None
+
+    def _get_export_executor(self):
+        """
+        보고서 파일 저장용 스레드 풀 (최초 사용 시 생성)
+        작업 스레드는 데몬이 아니므로 저장 중에 앱을 종료해도 파일을 끝까지 쓴 뒤 프로세스가 끝남
+        """
+        executor = getattr(self, '_export_executor', None)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='report-export')
+            self._export_executor = executor
+        return executor
+
+    def _when_report_export_done(self, future, loading_dialog, file_path):
+        """보고서 저장 완료 여부를 Tk 스레드에서 after로 확인 (작업 스레드는 Tk를 호출하지 않음)"""
+        if future.done():
+            self._finish_report_export(loading_dialog, file_path, future.exception())
+        else:
+            self.window.after(_EXPORT_POLL_INTERVAL_MS, self._when_report_export_done, future, loading_dialog, file_path)
+
+    def _finish_report_export(self, loading_dialog, file_path, error):
+        """보고서 내보내기 저장 완료 처리"""
+        loading_dialog.close()
+        if error is not None:
+            messagebox.showerror("오류", f"보고서 내보내기 중 오류 발생: {str(error)}")
+            return
+        self.file_service.last_export_path = os.path.dirname(file_path)
+        messagebox.showinfo("완료", "보고서가 성공적으로 저장되었습니다.")
 
 
     def load_folder(self, event=None):
@@ -942,63 +1097,76 @@ class DBManager:
         try:
             import pandas as pd
             import os
-            import sqlite3
             df_list = []
             self.file_names = []
             # 🆕 QC 파일 선택을 위한 uploaded_files 딕셔너리 생성
             self.uploaded_files = {}
             total_files = len(files)
             loading_dialog.update_progress(0, "파일 로딩 준비 중...")
-            for idx, file in enumerate(files, 1):
+            
+            # 파일 파싱은 스레드 풀에서 동시에 수행 (pandas 파서는 GIL을 풀고 동작)
+            # 큰 파일부터 시작해 마지막 파일이 늦게 끝나는 것을 줄이고, 결과는 선택한 순서대로 사용
+            parsed = [None] * total_files
+            errors = {}
+            if total_files == 1:
+                loading_dialog.update_progress(0, "파일 로딩 중... (1/1)")
                 try:
-                    progress = (idx / total_files) * 70
-                    loading_dialog.update_progress(
-                        progress,
-                        f"파일 로딩 중... ({idx}/{total_files})"
-                    )
-                    file_name = os.path.basename(file)
-                    base_name = os.path.splitext(file_name)[0]
-                    ext = os.path.splitext(file_name)[1].lower()
-                    if ext == '.txt':
-                        df = pd.read_csv(file, delimiter="\t", dtype=str)
-                        # 텍스트 파일의 필수 컬럼 확인 및 추가
-                        required_columns = ['Module', 'Part', 'ItemName', 'ItemType', 'ItemValue', 'ItemDescription']
-                        if all(col in df.columns for col in required_columns):
-                            # 표준 텍스트 파일 형식: ItemType 정보 보존
-                            df = df[required_columns].copy()
-                        else:
-                            # 호환성을 위한 fallback: 기본 컬럼명 추가
-                            if 'ItemType' not in df.columns:
-                                df['ItemType'] = 'double'  # 기본값
-                            if 'ItemDescription' not in df.columns:
-                                df['ItemDescription'] = ''
-                    elif ext == '.csv':
-                        df = pd.read_csv(file, dtype=str)
-                        # CSV 파일에서도 ItemType 보존 시도
-                        if 'ItemType' not in df.columns:
-                            df['ItemType'] = 'double'  # 기본값
-                    elif ext == '.db':
-                        conn = sqlite3.connect(file)
-                        df = pd.read_sql("SELECT * FROM main_table", conn)
-                        conn.close()
-                        # DB 파일에서도 ItemType 보존 시도
-                        if 'ItemType' not in df.columns:
-                            df['ItemType'] = 'double'  # 기본값
-                    
-                    df["Model"] = base_name
-                    df_list.append(df)
-                    self.file_names.append(base_name)
-                    # 🆕 QC 파일 선택을 위해 파일 정보 저장
-                    self.uploaded_files[file_name] = file
+                    parsed[0] = _read_db_file(files[0])
                 except Exception as e:
+                    errors[0] = e
+            else:
+                def file_size(path):
+                    try:
+                        return os.path.getsize(path)
+                    except OSError:
+                        return 0
+                
+                order = sorted(range(total_files), key=lambda i: file_size(files[i]), reverse=True)
+                with ThreadPoolExecutor(max_workers=min(8, total_files)) as pool:
+                    futures = {pool.submit(_read_db_file, files[i]): i for i in order}
+                    for done, future in enumerate(as_completed(futures), 1):
+                        idx = futures[future]
+                        try:
+                            parsed[idx] = future.result()
+                        except Exception as e:
+                            errors[idx] = e
+                        loading_dialog.update_progress(
+                            (done / total_files) * 70,
+                            f"파일 로딩 중... ({done}/{total_files})"
+                        )
+            
+            for idx, file in enumerate(files):
+                file_name = os.path.basename(file)
+                if idx in errors:
                     messagebox.showwarning(
                         "경고", 
-                        f"'{file_name}' 파일 로드 중 오류 발생:\n{str(e)}"
+                        f"'{file_name}' 파일 로드 중 오류 발생:\n{str(errors[idx])}"
                     )
+                    continue
+                base_name = os.path.splitext(file_name)[0]
+                df_list.append(parsed[idx])
+                self.file_names.append(base_name)
+                # 🆕 QC 파일 선택을 위해 파일 정보 저장
+                self.uploaded_files[file_name] = file
             if df_list:
                 self.folder_path = os.path.dirname(files[0])
                 loading_dialog.update_progress(75, "데이터 병합 중...")
-                self.merged_df = pd.concat(df_list, ignore_index=True)
+                file_count = len(df_list)
+                row_counts = [len(df) for df in df_list]
+                # 파일이 하나면 병합 없이 그대로 사용하고, 병합 후에는 원본 DataFrame을 바로 해제
+                merged_df = df_list[0] if file_count == 1 else pd.concat(df_list, ignore_index=True)
+                df_list.clear()
+                parsed.clear()
+                # Model은 행마다 문자열을 두지 않고 파일 순서 코드로 저장 (범주형)
+                import numpy as np
+                categories = list(dict.fromkeys(self.file_names))
+                codes = np.repeat([categories.index(name) for name in self.file_names], row_counts)
+                merged_df["Model"] = pd.Categorical.from_codes(codes, categories=categories)
+                # 항목 키도 범주형으로 저장해 pivot/그룹화가 문자열 대신 정수 코드로 동작하게 함
+                for col in ITEM_KEY_COLUMNS:
+                    merged_df[col] = merged_df[col].astype("category")
+                self.merged_df = merged_df
+                self._pivot_cache = None
                 loading_dialog.update_progress(85, "화면 업데이트 중...")
                 self.update_all_tabs()
                 loading_dialog.update_progress(100, "완료!")
@@ -1009,13 +1177,13 @@ class DBManager:
                 
                 messagebox.showinfo(
                     "로드 완료",
-                    f"총 {len(df_list)}개의 DB 파일을 성공적으로 로드했습니다.\n"
+                    f"총 {file_count}개의 DB 파일을 성공적으로 로드했습니다.\n"
                     f"• 폴더: {self.folder_path}\n"
                     f"• 파일: {', '.join(self.file_names)}\n"
                     f"• QC 검수 파일 선택 가능: {len(self.uploaded_files)}개"
                 )
                 self.status_bar.config(
-                    text=f"총 {len(df_list)}개의 DB 파일이 로드되었습니다. "
+                    text=f"총 {file_count}개의 DB 파일이 로드되었습니다. "
                          f"(폴더: {os.path.basename(self.folder_path)})"
                 )
             else:
@@ -1027,11 +1195,22 @@ class DBManager:
             messagebox.showerror("오류", f"예기치 않은 오류가 발생했습니다:\n{str(e)}")
 
     def update_all_tabs(self):
-        # 기존 탭 제거
-        for tab in self.comparison_notebook.winfo_children():
-            tab.destroy()
-        # 탭 다시 생성
-        self.create_comparison_tabs()
+        comparison_tree = getattr(self, 'comparison_tree', None)
+        if (getattr(self, '_comparison_tabs_maint_mode', None) == self.maint_mode
+                and comparison_tree is not None and comparison_tree.winfo_exists()):
+            # 같은 모드로 만든 탭이 있으면 위젯은 재사용하고 컬럼과 행만 갱신
+            self._reconfigure_comparison_columns()
+            self.item_checkboxes = {}
+            if self.maint_mode and hasattr(self, 'select_all_var'):
+                self.select_all_var.set(False)
+            # 새로 만든 탭과 같이 검색/필터를 초기화한 상태로 전체 목록 표시
+            self._reset_comparison_filters()
+        else:
+            # 기존 탭 제거
+            for tab in self.comparison_notebook.winfo_children():
+                tab.destroy()
+            # 탭 다시 생성
+            self.create_comparison_tabs()
         
         # 격자뷰와 차이점뷰 업데이트
         if hasattr(self, 'update_grid_view'):
@@ -1043,6 +1222,27 @@ class DBManager:
         if self.maint_mode and hasattr(self, 'update_qc_report_view'):
             self.update_qc_report_view()
 
+    def _reconfigure_comparison_columns(self):
+        """전체 목록 트리뷰의 컬럼을 현재 파일 목록에 맞게 다시 설정 (변경된 경우에만)"""
+        if self.maint_mode:
+            columns = ["Checkbox", "Module", "Part", "ItemName"] + self.file_names
+        else:
+            columns = ["Module", "Part", "ItemName"] + self.file_names
+        if list(self.comparison_tree["columns"]) == columns:
+            return
+        
+        # 컬럼 목록이 바뀌면 각 컬럼 설정이 초기화되므로 헤딩/너비를 다시 지정
+        self.comparison_tree["columns"] = columns
+        if self.maint_mode:
+            self.comparison_tree.heading("Checkbox", text="선택")
+            self.comparison_tree.column("Checkbox", width=50, anchor="center")
+        for col in ["Module", "Part", "ItemName"]:
+            self.comparison_tree.heading(col, text=col, anchor="w")
+            self.comparison_tree.column(col, width=100)
+        for model in self.file_names:
+            self.comparison_tree.heading(model, text=model, anchor="w")
+            self.comparison_tree.column(model, width=150)
+
     def create_grid_view_tab(self):
         """격자뷰 탭 생성 - 트리뷰 구조"""
         grid_frame = ttk.Frame(self.comparison_notebook)
@@ -1088,6 +1288,9 @@ class DBManager:
             self.grid_tree.heading(col, text=col, anchor="center")
             self.grid_tree.column(col, width=150, anchor="center")
         
+        # 계층별 스타일 태그 설정 (갱신 때마다 반복하지 않도록 생성 시 한 번만)
+        self._configure_grid_tags(self.grid_tree)
+        
         # 스크롤바 추가
         v_scroll = ttk.Scrollbar(grid_frame, orient="vertical", command=self.grid_tree.yview)
         h_scroll = ttk.Scrollbar(grid_frame, orient="horizontal", command=self.grid_tree.xview)
@@ -1101,14 +1304,18 @@ class DBManager:
         # 격자뷰 데이터 업데이트
         self.update_grid_view()
 
+    def _configure_grid_tags(self, tree):
+        """격자뷰 스타일 태그를 트리뷰에 한 번 설정"""
+        for name, options in self._GRID_TAGS.items():
+            tree.tag_configure(name, **options)
+
     def update_grid_view(self):
         """격자뷰 데이터 업데이트 - 트리뷰 구조"""
         if not hasattr(self, 'grid_tree'):
             return
             
-        # 기존 데이터 삭제
-        for item in self.grid_tree.get_children():
-            self.grid_tree.delete(item)
+        # 기존 데이터 삭제 (한 번의 delete 호출)
+        self.grid_tree.delete(*self.grid_tree.get_children())
         
         if self.merged_df is None or self.merged_df.empty:
             # 통계 정보 초기화
@@ -1127,77 +1334,21 @@ class DBManager:
             self.grid_tree.heading(col, text=col, anchor="center")
             self.grid_tree.column(col, width=150, anchor="center")
         
-        # 계층별 스타일 태그 설정
-        # 모듈 레벨 - 가장 크고 굵게 (기본 파란색)
-        self.grid_tree.tag_configure("module", 
-                                    font=("Arial", 11, "bold"), 
-                                    background="#F5F5F5", 
-                                    foreground="#1565C0")
-        
-        # 모듈 레벨 - 차이 있음 (빨간색 강조)
-        self.grid_tree.tag_configure("module_diff", 
-                                    font=("Arial", 11, "bold"), 
-                                    background="#F5F5F5", 
-                                    foreground="#D32F2F")
-        
-        # 파트 레벨 - 중간 크기, 볼드
-        self.grid_tree.tag_configure("part", 
-                                    font=("Arial", 10, "bold"), 
-                                    background="#FAFAFA", 
-                                    foreground="#424242")
-        
-        # 파트 레벨 - 모든 값 동일 (초록색)
-        self.grid_tree.tag_configure("part_clean", 
-                                    font=("Arial", 10, "bold"), 
-                                    background="#FAFAFA", 
-                                    foreground="#2E7D32")
-        
-        # 파트 레벨 - 차이 있음 (빨간색 강조)
-        self.grid_tree.tag_configure("part_diff", 
-                                    font=("Arial", 10, "bold"), 
-                                    background="#FAFAFA", 
-                                    foreground="#D32F2F")
-        
-
-        
-        # 파라미터 레벨 - 기본 크기
-        self.grid_tree.tag_configure("parameter_same", 
-                                    font=("Arial", 9), 
-                                    background="white", 
-                                    foreground="black")
-        
-        # 차이점이 있는 파라미터 - 전체 목록 탭과 동일한 색상
-        self.grid_tree.tag_configure("parameter_different", 
-                                    font=("Arial", 9), 
-                                    background="#FFECB3", 
-                                    foreground="#E65100")
-        
         # 계층 구조 데이터 구성
         modules_data = {}
         total_params = 0
         diff_count = 0
         
-        grouped = self.merged_df.groupby(["Module", "Part", "ItemName"])
+        # 각 파일별 값과 차이 여부(빈 값 제외)는 공유 pivot에서 가져옴
+        pivot, diff_mask = self._get_item_value_pivot()
         
-        for (module, part, item_name), group in grouped:
+        for (module, part, item_name), values, has_difference in zip(
+                pivot.index, pivot.itertuples(index=False, name=None), diff_mask.tolist()):
             if module not in modules_data:
                 modules_data[module] = {}
             if part not in modules_data[module]:
                 modules_data[module][part] = {}
             
-            # 각 파일별 값 수집
-            values = []
-            for model in self.file_names:
-                model_data = group[group["Model"] == model]
-                if not model_data.empty:
-                    values.append(str(model_data["ItemValue"].iloc[0]))
-                else:
-                    values.append("-")
-            
-            # 값 차이 확인 (빈 값 제외)
-            non_empty_values = [v for v in values if v != "-"]
-            has_difference = len(set(non_empty_values)) > 1 if len(non_empty_values) > 1 else False
-            
             modules_data[module][part][item_name] = {
                 "values": values,
                 "has_difference": has_difference
@@ -1206,62 +1357,61 @@ class DBManager:
             if has_difference:
                 diff_count += 1
         
-        # 트리뷰에 계층 구조로 데이터 추가
-        for module_name in sorted(modules_data.keys()):
-            # 모듈 레벨 통계 계산
-            module_total = sum(len(modules_data[module_name][part]) for part in modules_data[module_name])
-            module_diff = sum(1 for part in modules_data[module_name] 
-                            for item in modules_data[module_name][part] 
-                            if modules_data[module_name][part][item]["has_difference"])
-            
-            # 모듈 표시 - 파란색 통일
-            if module_diff == 0:
-                module_text = f"📁 {module_name} ({module_total})"
-            else:
-                module_text = f"📁 {module_name} ({module_total}) Diff: {module_diff}"
-            module_tag = "module"
-            
-            # 모듈 노드 추가
-            module_node = self.grid_tree.insert("", "end", 
-                                               text=module_text, 
-                                               values=[""] * len(columns), 
-                                               open=True,
-                                               tags=(module_tag,))
-            
-            for part_name in sorted(modules_data[module_name].keys()):
-                # 파트 레벨 통계 계산
-                part_total = len(modules_data[module_name][part_name])
-                part_diff = sum(1 for item in modules_data[module_name][part_name] 
-                              if modules_data[module_name][part_name][item]["has_difference"])
-                
-                # 파트 표시 - 차이가 없으면 초록색, 있으면 회색
-                if part_diff == 0:
-                    part_text = f"📂 {part_name} ({part_total})"
-                    part_tag = "part_clean"
+        # 트리뷰에 계층 구조로 데이터 추가 - 삽입하는 동안 트리뷰를 내려 두어 한 번만 다시 그림
+        item_tags = {True: ("parameter_different",), False: ("parameter_same",)}
+        with detached_widget(self.grid_tree):
+            for module_name in sorted(modules_data.keys()):
+                # 모듈 레벨 통계 계산
+                module_total = sum(len(modules_data[module_name][part]) for part in modules_data[module_name])
+                module_diff = sum(1 for part in modules_data[module_name] 
+                                for item in modules_data[module_name][part] 
+                                if modules_data[module_name][part][item]["has_difference"])
+            
+                # 모듈 표시 - 파란색 통일
+                if module_diff == 0:
+                    module_text = f"📁 {module_name} ({module_total})"
                 else:
-                    part_text = f"📂 {part_name} ({part_total}) Diff: {part_diff}"
-                    part_tag = "part_diff"
+                    module_text = f"📁 {module_name} ({module_total}) Diff: {module_diff}"
+                module_tag = "module"
+            
+                # 모듈 노드 추가
+                module_node = self.grid_tree.insert("", "end", 
+                                                   text=module_text, 
+                                                   values=[""] * len(columns), 
+                                                   open=True,
+                                                   tags=(module_tag,))
+            
+                for part_name in sorted(modules_data[module_name].keys()):
+                    # 파트 레벨 통계 계산
+                    part_total = len(modules_data[module_name][part_name])
+                    part_diff = sum(1 for item in modules_data[module_name][part_name] 
+                                  if modules_data[module_name][part_name][item]["has_difference"])
                 
-                # 파트 노드 추가
-                part_node = self.grid_tree.insert(module_node, "end", 
-                                                 text=part_text, 
-                                                 values=[""] * len(columns), 
-                                                 open=True,
-                                                 tags=(part_tag,))
+                    # 파트 표시 - 차이가 없으면 초록색, 있으면 회색
+                    if part_diff == 0:
+                        part_text = f"📂 {part_name} ({part_total})"
+                        part_tag = "part_clean"
+                    else:
+                        part_text = f"📂 {part_name} ({part_total}) Diff: {part_diff}"
+                        part_tag = "part_diff"
                 
-                for item_name in sorted(modules_data[module_name][part_name].keys()):
-                    # 파라미터 노드 추가 - 기본 크기, 차이점에 따라 색상 구분
-                    item_data = modules_data[module_name][part_name][item_name]
-                    values = item_data["values"]
-                    has_difference = item_data["has_difference"]
-                    
-                    # 태그 선택
-                    tag = "parameter_different" if has_difference else "parameter_same"
+                    # 파트 노드 추가
+                    part_node = self.grid_tree.insert(module_node, "end", 
+                                                     text=part_text, 
+                                                     values=[""] * len(columns), 
+                                                     open=True,
+                                                     tags=(part_tag,))
+                
+                    for item_name in sorted(modules_data[module_name][part_name].keys()):
+                        # 파라미터 노드 추가 - 기본 크기, 차이점에 따라 색상 구분
+                        item_data = modules_data[module_name][part_name][item_name]
+                        values = item_data["values"]
+                        has_difference = item_data["has_difference"]
                     
-                    self.grid_tree.insert(part_node, "end", 
-                                        text=item_name, 
-                                        values=values, 
-                                        tags=(tag,))
+                        self.grid_tree.insert(part_node, "end", 
+                                            text=item_name, 
+                                            values=values, 
+                                            tags=item_tags[has_difference])
         
         # 통계 정보 업데이트
         if hasattr(self, 'grid_total_label'):
@@ -2105,10 +2255,11 @@ class DBManager:
         filtered_items = 0
         
         if self.merged_df is not None:
-            # 파라미터별로 그룹화하여 비교
-            grouped = self.merged_df.groupby(["Module", "Part", "ItemName"])
+            # 파라미터별 파일 값과 차이 여부는 공유 pivot에서 가져옴 (검색할 때마다 다시 그룹화하지 않음)
+            pivot, diff_mask = self._get_item_value_pivot()
             
-            for (module, part, item_name), group in grouped:
+            for (module, part, item_name), file_values, has_difference in zip(
+                    pivot.index, pivot.itertuples(index=False, name=None), diff_mask.tolist()):
                 total_items += 1
                 
                 # 검색 필터링 적용
@@ -2140,23 +2291,8 @@ class DBManager:
                     values.append(checkbox_state)
                 
                 values.extend([module, part, item_name])
-                
-                # 각 파일별 값 추출 및 비교
-                file_values = []
-                for model in self.file_names:
-                    model_data = group[group["Model"] == model]
-                    if not model_data.empty:
-                        value = model_data["ItemValue"].iloc[0]
-                        file_values.append(str(value))
-                    else:
-                        file_values.append("-")
-                
                 values.extend(file_values)
                 
-                # 차이점 검사 - 모든 값이 동일한지 확인
-                unique_values = set(v for v in file_values if v != "-")
-                has_difference = len(unique_values) > 1
-                
                 tags = []
                 if has_difference:
                     tags.append("different")
@@ -1,15 +1,53 @@
 # QC(품질검수) 관련 함수 및 탭 생성 로직을 src/qc_check_helpers.py에서 이관. add_qc_check_functions_to_class, create_qc_check_tab, perform_qc_check 등 포함. 한글 주석 및 기존 UI 구조 유지.
 
 import os
+import math
 import tkinter as tk
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import ttk, messagebox, filedialog
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from datetime import datetime
 from app.loading import LoadingDialog
-from app.utils import create_treeview_with_scrollbar
+from app.utils import create_treeview_with_scrollbar, insert_treeview_rows
+from app.qc_utils import QC_EXCEL_ENGINE
+
+# 파이 차트 색상 (Professional color scheme for engineering applications)
+_PIE_COLORS = ('#0078d4', '#107c10', '#ff8c00', '#d13438', '#605e5c', '#8764b8')
+
+
+def _draw_pie(canvas, cx, cy, radius, sizes, colors, labels):
+    """tk.Canvas에 파이 차트 그리기 (12시 방향에서 시작해 반시계 방향, 조각마다 비율 표시)"""
+    total = float(sum(sizes))
+    start = 90.0
+    for size, color, label in zip(sizes, colors, labels):
+        extent = size / total * 360.0
+        if extent >= 360.0:
+            # 조각이 하나뿐이면 arc 대신 원으로 표시 (extent 360은 Tk에서 그려지지 않을 수 있음)
+            canvas.create_oval(cx - radius, cy - radius, cx + radius, cy + radius,
+                               fill=color, outline='white')
+        else:
+            canvas.create_arc(cx - radius, cy - radius, cx + radius, cy + radius,
+                              start=start, extent=extent, fill=color, outline='white', style=tk.PIESLICE)
+
+        # 조각 중앙 각도에 비율(안쪽)과 라벨(바깥쪽) 표시
+        middle = math.radians(start + extent / 2)
+        dx, dy = math.cos(middle), -math.sin(middle)
+        canvas.create_text(cx + dx * radius * 0.6, cy + dy * radius * 0.6,
+                           text=f"{size / total * 100:.1f}%", fill='white', font=("Segoe UI", 9, "bold"))
+        canvas.create_text(cx + dx * radius * 1.15, cy + dy * radius * 1.15, text=str(label),
+                           anchor='w' if dx > 0.1 else 'e' if dx < -0.1 else 'center', font=("Segoe UI", 9))
+        start += extent
+
+
+# 결과 트리뷰에 표시할 이슈 유형 이름 (행마다 dict를 새로 만들지 않도록 모듈 상수로 유지)
+_ISSUE_TYPE_DISPLAY_NAMES = {
+    "누락값": "Missing Data",
+    "이상치": "Spec Out",
+    "중복": "Duplicate Entry",
+    "일관성": "Inconsistency"
+}
 
 class QCValidator:
     """QC 검증을 수행하는 클래스"""
@@ -20,6 +58,22 @@ class QCValidator:
         "낮음": 1
     }
 
+    @staticmethod
+    def sort_by_severity(results, severity_levels=None):
+        """심각도 높은 순으로 결과 정렬 (심각도별 버킷에 나눠 담는 안정 정렬)"""
+        severity_levels = severity_levels or QCValidator.SEVERITY_LEVELS
+        buckets = {rank: [] for rank in sorted(set(severity_levels.values()), reverse=True)}
+        unranked = []  # 알 수 없는 심각도는 맨 뒤
+        get_bucket = {severity: buckets[rank] for severity, rank in severity_levels.items()}.get
+        for result in results:
+            get_bucket(result["severity"], unranked).append(result)
+
+        sorted_results = []
+        for bucket in buckets.values():
+            sorted_results.extend(bucket)
+        sorted_results.extend(unranked)
+        return sorted_results
+
     @staticmethod
     def check_missing_values(df, equipment_type):
         """누락된 값 검사 - Default DB 구조에 맞게 수정"""
@@ -53,6 +107,13 @@ class QCValidator:
         
         return results
 
+    @staticmethod
+    def _column_values(df, column, idx):
+        """지정한 행들의 컬럼 값 목록 (컬럼이 없으면 'N/A')"""
+        if column in df.columns:
+            return df[column].to_numpy()[idx].tolist()
+        return ['N/A'] * len(idx)
+
     @staticmethod
     def check_outliers(df, equipment_type):
         """이상치 검사 - 신뢰도 및 발생횟수 기준"""
@@ -61,21 +122,27 @@ class QCValidator:
         # 신뢰도가 낮은 파라미터 확인
         if 'confidence_score' in df.columns:
             try:
-                # confidence_score를 안전하게 숫자로 변환
-                df_copy = df.copy()
-                df_copy['confidence_score_numeric'] = pd.to_numeric(df_copy['confidence_score'], errors='coerce')
-                low_confidence = df_copy[df_copy['confidence_score_numeric'] < 0.5]
+                # confidence_score를 안전하게 숫자로 변환 (NaN은 비교 결과가 False이므로 자동 제외)
+                confidence = pd.to_numeric(df['confidence_score'], errors='coerce').to_numpy(
+                    dtype=np.float64, na_value=np.nan
+                )
+                low_idx = np.flatnonzero(confidence < 0.5)
                 
-                if len(low_confidence) > 0:
-                    for _, row in low_confidence.iterrows():
-                        confidence_val = row.get('confidence_score_numeric', 0)
-                        if pd.notna(confidence_val):
-                            results.append({
-                                "parameter": row['parameter_name'],
-                                "issue_type": "낮은 신뢰도",
-                                "description": f"신뢰도가 {confidence_val*100:.1f}%로 낮습니다 (발생횟수: {row.get('occurrence_count', 'N/A')}/{row.get('total_files', 'N/A')})",
-                                "severity": "중간" if confidence_val < 0.3 else "낮음"
-                            })
+                if len(low_idx) > 0:
+                    # 결과에 쓰는 컬럼만 해당 행 기준으로 꺼내 한 번에 생성
+                    occurrences = QCValidator._column_values(df, 'occurrence_count', low_idx)
+                    totals = QCValidator._column_values(df, 'total_files', low_idx)
+                    results.extend({
+                        "parameter": parameter,
+                        "issue_type": "낮은 신뢰도",
+                        "description": f"신뢰도가 {confidence_val*100:.1f}%로 낮습니다 (발생횟수: {occurrence}/{total})",
+                        "severity": "중간" if confidence_val < 0.3 else "낮음"
+                    } for parameter, confidence_val, occurrence, total in zip(
+                        df['parameter_name'].to_numpy()[low_idx].tolist(),
+                        confidence[low_idx].tolist(),
+                        occurrences,
+                        totals
+                    ))
             except Exception as e:
                 print(f"신뢰도 검사 중 오류: {e}")
         
@@ -83,18 +150,20 @@ class QCValidator:
         if 'occurrence_count' in df.columns and 'total_files' in df.columns:
             try:
                 # occurrence_count를 안전하게 숫자로 변환
-                df_copy = df.copy()
-                df_copy['occurrence_count_numeric'] = pd.to_numeric(df_copy['occurrence_count'], errors='coerce')
-                single_source = df_copy[df_copy['occurrence_count_numeric'] == 1]
+                single_idx = np.flatnonzero(
+                    (pd.to_numeric(df['occurrence_count'], errors='coerce') == 1).to_numpy()
+                )
                 
-                if len(single_source) > 0:
-                    for _, row in single_source.iterrows():
-                        results.append({
-                            "parameter": row['parameter_name'],
-                            "issue_type": "단일 소스",
-                            "description": f"단일 파일에서만 발견된 파라미터입니다 (1/{row.get('total_files', 'N/A')} 파일)",
-                            "severity": "낮음"
-                        })
+                if len(single_idx) > 0:
+                    results.extend({
+                        "parameter": parameter,
+                        "issue_type": "단일 소스",
+                        "description": f"단일 파일에서만 발견된 파라미터입니다 (1/{total} 파일)",
+                        "severity": "낮음"
+                    } for parameter, total in zip(
+                        df['parameter_name'].to_numpy()[single_idx].tolist(),
+                        df['total_files'].to_numpy()[single_idx].tolist()
+                    ))
             except Exception as e:
                 print(f"발생횟수 검사 중 오류: {e}")
         
@@ -106,15 +175,17 @@ class QCValidator:
         results = []
         
         if 'parameter_name' in df.columns:
-            duplicated_params = df['parameter_name'].duplicated()
-            dup_count = duplicated_params.sum()
+            # 전체 행을 복사하지 않고 파라미터명 컬럼에서 설명에 쓸 앞의 3개만 조회
+            param_names = df['parameter_name']
+            dup_idx = np.flatnonzero(param_names.duplicated().to_numpy())
+            dup_count = len(dup_idx)
             
             if dup_count > 0:
-                dup_names = df[duplicated_params]['parameter_name'].tolist()
+                dup_names = param_names.to_numpy()[dup_idx[:3]].tolist()
                 results.append({
                     "parameter": "전체",
                     "issue_type": "중복 파라미터",
-                    "description": f"{dup_count}개의 중복 파라미터명이 있습니다: {', '.join(dup_names[:3])}{'...' if len(dup_names) > 3 else ''}",
+                    "description": f"{dup_count}개의 중복 파라미터명이 있습니다: {', '.join(dup_names)}{'...' if dup_count > 3 else ''}",
                     "severity": "높음"
                 })
         
@@ -127,30 +198,34 @@ class QCValidator:
         
         # min_spec과 max_spec이 모두 있는 경우 범위 검사
         if all(col in df.columns for col in ['min_spec', 'max_spec', 'default_value']):
-            for _, row in df.iterrows():
-                try:
-                    if pd.notna(row['min_spec']) and pd.notna(row['max_spec']) and pd.notna(row['default_value']):
-                        min_val = float(row['min_spec'])
-                        max_val = float(row['max_spec'])
-                        default_val = float(row['default_value'])
-                        
-                        if min_val > max_val:
-                            results.append({
-                                "parameter": row['parameter_name'],
-                                "issue_type": "사양 오류",
-                                "description": f"최소값({min_val})이 최대값({max_val})보다 큽니다.",
-                                "severity": "높음"
-                            })
-                        elif not (min_val <= default_val <= max_val):
-                            results.append({
-                                "parameter": row['parameter_name'],
-                                "issue_type": "범위 초과",
-                                "description": f"설정값({default_val})이 사양 범위({min_val}~{max_val})를 벗어납니다.",
-                                "severity": "중간"
-                            })
-                except (ValueError, TypeError):
-                    # 숫자가 아닌 값은 무시
-                    continue
+            # 숫자가 아닌 값은 NaN으로 변환되어 검사에서 제외 (행마다 예외 처리하지 않음)
+            min_arr = pd.to_numeric(df['min_spec'], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+            max_arr = pd.to_numeric(df['max_spec'], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+            default_arr = pd.to_numeric(df['default_value'], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+            valid = ~(np.isnan(min_arr) | np.isnan(max_arr) | np.isnan(default_arr))
+            
+            spec_error = valid & (min_arr > max_arr)
+            out_of_range = valid & ~spec_error & ((default_arr < min_arr) | (default_arr > max_arr))
+            param_names = df['parameter_name'].to_numpy()
+            
+            for i in np.flatnonzero(spec_error | out_of_range).tolist():
+                min_val = float(min_arr[i])
+                max_val = float(max_arr[i])
+                
+                if spec_error[i]:
+                    results.append({
+                        "parameter": param_names[i],
+                        "issue_type": "사양 오류",
+                        "description": f"최소값({min_val})이 최대값({max_val})보다 큽니다.",
+                        "severity": "높음"
+                    })
+                else:
+                    results.append({
+                        "parameter": param_names[i],
+                        "issue_type": "범위 초과",
+                        "description": f"설정값({float(default_arr[i])})이 사양 범위({min_val}~{max_val})를 벗어납니다.",
+                        "severity": "중간"
+                    })
         
         return results
 
@@ -163,10 +238,8 @@ class QCValidator:
         all_results.extend(QCValidator.check_duplicate_entries(df, equipment_type))
         all_results.extend(QCValidator.check_data_consistency(df, equipment_type))
 
-        # 심각도 순으로 정렬
-        all_results.sort(key=lambda x: QCValidator.SEVERITY_LEVELS.get(x["severity"], 0), reverse=True)
-
-        return all_results
+        # 심각도 순으로 정렬 (심각도 등급이 3개뿐이므로 버킷으로 나눠 한 번에 정렬)
+        return QCValidator.sort_by_severity(all_results)
 
 
 def add_qc_check_functions_to_class(cls):
@@ -342,15 +415,14 @@ def add_qc_check_functions_to_class(cls):
             loading_dialog = LoadingDialog(self.window)
             self.window.update_idletasks()
 
-            # 트리뷰 초기화
-            for item in self.qc_result_tree.get_children():
-                self.qc_result_tree.delete(item)
+            # 트리뷰 초기화 (Enhanced QC 내보내기용 결과 캐시도 함께 무효화)
+            self.qc_result_tree.delete(*self.qc_result_tree.get_children())
+            self._last_qc_results = None
 
             # 통계 및 차트 프레임 초기화
             for widget in self.stats_frame.winfo_children():
                 widget.destroy()
-            for widget in self.chart_frame.winfo_children():
-                widget.destroy()
+            self._clear_qc_chart_frame()
 
             # 선택된 장비 유형의 데이터 로드
             equipment_type_id = self.equipment_types_for_qc[selected_type]
@@ -385,20 +457,12 @@ def add_qc_check_functions_to_class(cls):
 
             # 결과 트리뷰에 표시 (75%)
             loading_dialog.update_progress(75, "결과 업데이트 중...")
-            for i, result in enumerate(results):
-                # 개선된 이슈 유형 매핑
-                issue_type_mapping = {
-                    "누락값": "Missing Data",
-                    "이상치": "Spec Out", 
-                    "중복": "Duplicate Entry",
-                    "일관성": "Inconsistency"
-                }
-                mapped_issue_type = issue_type_mapping.get(result["issue_type"], result["issue_type"])
-                
-                self.qc_result_tree.insert(
-                    "", "end", 
-                    values=(result["parameter"], mapped_issue_type, result["description"])
-                )
+            # 개선된 이슈 유형 매핑 (dict.get을 미리 바인딩하고 한 번에 삽입)
+            display_name = _ISSUE_TYPE_DISPLAY_NAMES.get
+            insert_treeview_rows(self.qc_result_tree, [
+                (result["parameter"], display_name(result["issue_type"], result["issue_type"]), result["description"])
+                for result in results
+            ])
 
             # 통계 정보 표시 (90%)
             loading_dialog.update_progress(90, "통계 정보 생성 중...")
@@ -426,10 +490,7 @@ def add_qc_check_functions_to_class(cls):
             return
 
         # 이슈 유형별 카운트
-        issue_counts = {}
-        for result in results:
-            issue_type = result["issue_type"]
-            issue_counts[issue_type] = issue_counts.get(issue_type, 0) + 1
+        issue_counts = Counter(result["issue_type"] for result in results)
 
         # Professional Statistics Display
         stats_title = ttk.Label(self.stats_frame, text=f"Total Issues Found: {len(results)}", 
@@ -451,43 +512,70 @@ def add_qc_check_functions_to_class(cls):
         # Create Issue Type Distribution Chart
         self.create_pie_chart(issue_counts, "Issue Type Distribution")
 
-    def create_pie_chart(self, data, title):
-        """Professional Engineering Style Pie Chart"""
-        fig, ax = plt.subplots(figsize=(6, 4))
-
-        # 데이터가 있는 항목만 포함
-        labels = []
-        sizes = []
-        # Professional color scheme for engineering applications
-        professional_colors = ['#0078d4', '#107c10', '#ff8c00', '#d13438', '#605e5c', '#8764b8']
-        chart_colors = []
-
-        for i, (label, value) in enumerate(data.items()):
-            if value > 0:
-                labels.append(label)
-                sizes.append(value)
-                chart_colors.append(professional_colors[i % len(professional_colors)])
-
-        if not sizes:  # 데이터가 없는 경우
-            ax.text(0.5, 0.5, "No Data Available", ha='center', va='center', 
-                   fontsize=12, color='gray')
-            ax.axis('off')
-        else:
-            wedges, texts, autotexts = ax.pie(sizes, labels=labels, autopct='%1.1f%%', 
-                                            colors=chart_colors, startangle=90)
-            ax.axis('equal')  # 원형 파이 차트
-            
-            # Professional styling
-            for autotext in autotexts:
-                autotext.set_color('white')
-                autotext.set_fontweight('bold')
+    def clear_qc_chart_frame(self):
+        """차트 프레임 정리 - 재사용할 차트 캔버스는 숨기기만 함"""
+        canvas = getattr(self, '_qc_pie_canvas', None)
+        for widget in self.chart_frame.winfo_children():
+            if widget is canvas:
+                widget.pack_forget()
+            else:
+                widget.destroy()
 
-        ax.set_title(title, fontsize=12, fontweight='bold', pad=20)
+    def on_qc_chart_frame_visible(self, event=None):
+        """차트 프레임이 화면에 표시될 때 보류된 차트 그리기"""
+        pending = getattr(self, '_pending_pie_chart', None)
+        if pending is not None:
+            self.create_pie_chart(*pending)
 
-        # tkinter 캔버스에 matplotlib 차트 표시
-        canvas = FigureCanvasTkAgg(fig, master=self.chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+    def create_pie_chart(self, data, title):
+        """Professional Engineering Style Pie Chart - Canvas는 한 번 만들고 재사용"""
+        # 차트 프레임이 보이지 않으면 표시될 때까지 렌더링 보류
+        if not self.chart_frame.winfo_viewable():
+            self._pending_pie_chart = (data, title)
+            if not getattr(self, '_pie_visibility_bound', False):
+                self.chart_frame.bind('<Visibility>', self._on_qc_chart_frame_visible, add='+')
+                self._pie_visibility_bound = True
+            return
+        self._pending_pie_chart = None
+
+        canvas = getattr(self, '_qc_pie_canvas', None)
+        if canvas is None or not canvas.winfo_exists():
+            # 정적인 파이 차트 하나뿐이므로 matplotlib 대신 tk.Canvas에 직접 그림
+            canvas = tk.Canvas(self.chart_frame, width=600, height=400, background='white',
+                               highlightthickness=0)
+            canvas.bind('<Configure>', self._draw_qc_pie_chart)
+            self._qc_pie_canvas = canvas
+        self._qc_pie_chart = (data, title)
+
+        # 기존 캔버스를 다시 표시하고 현재 크기에 맞춰 그리기
+        canvas.pack(fill=tk.BOTH, expand=True)
+        self._draw_qc_pie_chart()
+
+    def draw_qc_pie_chart(self, event=None):
+        """파이 차트 캔버스 다시 그리기 (크기 변경 시에도 호출)"""
+        canvas = self._qc_pie_canvas
+        data, title = self._qc_pie_chart
+        canvas.delete('all')
+        width = event.width if event is not None else canvas.winfo_width()
+        height = event.height if event is not None else canvas.winfo_height()
+        if width <= 1 or height <= 1:
+            # 아직 배치되지 않았으면 생성 시 지정한 크기 사용
+            width, height = int(canvas['width']), int(canvas['height'])
+
+        canvas.create_text(width / 2, 20, text=title, font=("Segoe UI", 12, "bold"))
+
+        # 데이터가 있는 항목만 포함 (색상은 원래 항목 순서 기준)
+        slices = [(label, value, _PIE_COLORS[i % len(_PIE_COLORS)])
+                  for i, (label, value) in enumerate(data.items()) if value > 0]
+
+        if not slices:  # 데이터가 없는 경우
+            canvas.create_text(width / 2, height / 2, text="No Data Available",
+                               font=("Segoe UI", 12), fill='gray')
+            return
+
+        labels, sizes, colors = zip(*slices)
+        radius = max(min(width, height - 40) / 2 * 0.65, 10)
+        _draw_pie(canvas, width / 2, (height + 40) / 2, radius, sizes, colors, labels)
 
     def export_qc_results(self):
         """QC 검수 결과 내보내기"""
@@ -527,7 +615,7 @@ def add_qc_check_functions_to_class(cls):
             summary_df = pd.DataFrame(summary_data)
 
             # Excel 파일로 저장 (여러 시트)
-            with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
+            with pd.ExcelWriter(file_path, engine=QC_EXCEL_ENGINE) as writer:
                 df.to_excel(writer, sheet_name="QC 검수 결과", index=False)
                 summary_df.to_excel(writer, sheet_name="검수 정보", index=False)
 
@@ -537,6 +625,27 @@ def add_qc_check_functions_to_class(cls):
         except Exception as e:
             messagebox.showerror("오류", f"파일 저장 중 오류 발생: {str(e)}")
 
+    def get_qc_file_sizes(self, file_paths):
+        """파일 크기 표시 문자열 조회 - 경로별로 캐시하고, 처음 보는 파일만 스레드 풀에서 병렬 stat"""
+        size_cache = getattr(self, '_qc_file_size_cache', None)
+        if size_cache is None:
+            size_cache = self._qc_file_size_cache = {}
+
+        missing_paths = [path for path in dict.fromkeys(file_paths) if path not in size_cache]
+        if missing_paths:
+            def format_file_size(path):
+                try:
+                    return f"{os.path.getsize(path):,} bytes"
+                except (OSError, TypeError):
+                    return ""
+
+            if len(missing_paths) == 1:
+                size_cache[missing_paths[0]] = format_file_size(missing_paths[0])
+            else:
+                with ThreadPoolExecutor(max_workers=min(8, len(missing_paths))) as pool:
+                    size_cache.update(zip(missing_paths, pool.map(format_file_size, missing_paths)))
+        return size_cache
+
     def select_qc_files(self):
         """QC 검수를 위한 파일 선택 (업로드된 파일 중에서 선택)"""
         try:
@@ -576,7 +685,7 @@ def add_qc_check_functions_to_class(cls):
             
             desc_label = ttk.Label(
                 info_frame, 
-                text=f"업로드된 {len(self.uploaded_files)}개 파일 중에서 QC 검수를 수행할 파일을 선택하세요 (최대 6개)",
+                text=f"업로드된 {len(self.uploaded_files)}개 파일 중에서 QC 검수를 수행할 파일을 선택하세요 (최대 6개, Ctrl/Shift로 다중 선택)",
                 font=('Arial', 9),
                 foreground='gray'
             )
@@ -586,75 +695,23 @@ def add_qc_check_functions_to_class(cls):
             files_frame = ttk.LabelFrame(main_frame, text="📄 파일 목록", padding=10)
             files_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
             
-            # 스크롤바가 있는 캔버스
-            canvas = tk.Canvas(files_frame, bg='white')
-            scrollbar = ttk.Scrollbar(files_frame, orient="vertical", command=canvas.yview)
-            scrollable_frame = ttk.Frame(canvas)
-            
-            scrollable_frame.bind(
-                "<Configure>",
-                lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            # 파일 목록 - 파일마다 체크박스 위젯을 만들지 않고 트리뷰 하나에서 다중 선택
+            file_columns = ("filename", "size", "path")
+            file_headings = {"filename": "파일명", "size": "크기", "path": "경로"}
+            file_column_widths = {"filename": 180, "size": 100, "path": 260}
+            file_list_frame, file_tree = create_treeview_with_scrollbar(
+                files_frame, file_columns, file_headings, file_column_widths, height=12
             )
+            file_tree.configure(selectmode="extended")
+            file_list_frame.pack(fill=tk.BOTH, expand=True)
             
-            canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-            canvas.configure(yscrollcommand=scrollbar.set)
-            
-            # 체크박스 변수들
-            self.qc_file_vars = {}
-            
-            # 업로드된 파일들에 대한 체크박스 생성
-            for i, (filename, filepath) in enumerate(self.uploaded_files.items()):
-                var = tk.BooleanVar()
-                self.qc_file_vars[filename] = var
-                
-                # 파일 정보 프레임
-                file_frame = ttk.Frame(scrollable_frame)
-                file_frame.pack(fill=tk.X, pady=2, padx=5)
-                
-                # 체크박스
-                checkbox = ttk.Checkbutton(
-                    file_frame, 
-                    text="", 
-                    variable=var
-                )
-                checkbox.pack(side=tk.LEFT, padx=(0, 10))
-                
-                # 파일 정보 레이블
-                file_info_frame = ttk.Frame(file_frame)
-                file_info_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
-                
-                # 파일명 (굵게)
-                filename_label = ttk.Label(
-                    file_info_frame, 
-                    text=filename,
-                    font=('Arial', 9, 'bold')
-                )
-                filename_label.pack(anchor='w')
-                
-                # 파일 경로 (작게)
-                try:
-                    import os
-                    file_size = os.path.getsize(filepath)
-                    file_size_str = f"{file_size:,} bytes"
-                    
-                    path_label = ttk.Label(
-                        file_info_frame,
-                        text=f"📁 {filepath} ({file_size_str})",
-                        font=('Arial', 8),
-                        foreground='gray'
-                    )
-                    path_label.pack(anchor='w')
-                except:
-                    path_label = ttk.Label(
-                        file_info_frame,
-                        text=f"📁 {filepath}",
-                        font=('Arial', 8),
-                        foreground='gray'
-                    )
-                    path_label.pack(anchor='w')
-            
-            canvas.pack(side="left", fill="both", expand=True)
-            scrollbar.pack(side="right", fill="y")
+            # 업로드된 파일들을 한 번에 삽입 (행 순서 = 파일 순서, 파일 크기는 캐시에서 조회)
+            file_names = list(self.uploaded_files)
+            file_sizes = self._get_qc_file_sizes(self.uploaded_files.values())
+            file_rows = [(filename, file_sizes[filepath], filepath)
+                         for filename, filepath in self.uploaded_files.items()]
+            insert_treeview_rows(file_tree, file_rows)
+            file_items = file_tree.get_children()
             
             # 하단 버튼 프레임
             button_frame = ttk.Frame(main_frame)
@@ -669,23 +726,24 @@ def add_qc_check_functions_to_class(cls):
             )
             selection_stats_label.pack(side=tk.LEFT)
             
-            def update_selection_stats():
+            def get_selected_files():
+                """선택된 파일명 목록 (목록 순서 유지)"""
+                selected_items = set(file_tree.selection())
+                return [name for name, item in zip(file_names, file_items) if item in selected_items]
+            
+            def update_selection_stats(event=None):
                 """선택 통계 업데이트"""
-                selected_count = sum(1 for var in self.qc_file_vars.values() if var.get())
+                selected_count = len(file_tree.selection())
                 selection_stats_label.config(
                     text=f"선택된 파일: {selected_count}개",
                     foreground='blue' if selected_count <= 6 else 'red'
                 )
             
-            # 체크박스 변경 시 통계 업데이트
-            for var in self.qc_file_vars.values():
-                var.trace('w', lambda *args: update_selection_stats())
+            # 선택 변경 시 통계 업데이트
+            file_tree.bind("<<TreeviewSelect>>", update_selection_stats)
             
             def apply_selection():
-                selected_files = []
-                for filename, var in self.qc_file_vars.items():
-                    if var.get():
-                        selected_files.append(filename)
+                selected_files = get_selected_files()
                 
                 if not selected_files:
                     messagebox.showwarning("선택 필요", "최소 1개의 파일을 선택해주세요.")
@@ -713,23 +771,16 @@ def add_qc_check_functions_to_class(cls):
                 file_selection_window.destroy()
             
             def select_all():
-                for var in self.qc_file_vars.values():
-                    var.set(True)
+                file_tree.selection_set(file_items)
                 update_selection_stats()
             
             def deselect_all():
-                for var in self.qc_file_vars.values():
-                    var.set(False)
+                file_tree.selection_set(())
                 update_selection_stats()
             
             def select_first_n(n):
                 """처음 n개 파일 선택"""
-                deselect_all()
-                for i, var in enumerate(self.qc_file_vars.values()):
-                    if i < n:
-                        var.set(True)
-                    else:
-                        break
+                file_tree.selection_set(file_items[:n])
                 update_selection_stats()
             
             # 버튼들
@@ -765,15 +816,14 @@ def add_qc_check_functions_to_class(cls):
             loading_dialog = LoadingDialog(self.window)
             self.window.update_idletasks()
 
-            # 트리뷰 초기화
-            for item in self.qc_result_tree.get_children():
-                self.qc_result_tree.delete(item)
+            # 트리뷰 초기화 (Enhanced QC 내보내기용 결과 캐시도 함께 무효화)
+            self.qc_result_tree.delete(*self.qc_result_tree.get_children())
+            self._last_qc_results = None
 
             # 통계 및 차트 프레임 초기화
             for widget in self.stats_frame.winfo_children():
                 widget.destroy()
-            for widget in self.chart_frame.winfo_children():
-                widget.destroy()
+            self._clear_qc_chart_frame()
 
             # 선택된 장비 유형의 데이터 로드
             equipment_type_id = self.equipment_types_for_qc[selected_type]
@@ -810,11 +860,10 @@ def add_qc_check_functions_to_class(cls):
 
             # 결과 트리뷰에 표시 (75%)
             loading_dialog.update_progress(75, "결과 업데이트 중...")
-            for i, result in enumerate(results):
-                self.qc_result_tree.insert(
-                    "", "end", 
-                    values=(result["parameter"], result["issue_type"], result["description"], result["severity"])
-                )
+            insert_treeview_rows(self.qc_result_tree, [
+                (result["parameter"], result["issue_type"], result["description"], result["severity"])
+                for result in results
+            ])
 
             # 통계 정보 표시 (90%)
             loading_dialog.update_progress(90, "통계 정보 생성 중...")
@@ -827,7 +876,7 @@ def add_qc_check_functions_to_class(cls):
             # 검수 모드 정보 포함하여 로그 업데이트
             mode_text = "Performance 항목" if performance_only else "전체 항목"
             params_count = len(data)
-            performance_count = sum(1 for row in data if row[14]) if qc_mode == "full" else params_count  # is_performance 컬럼
+            performance_count = int(df['is_performance'].fillna(0).astype(bool).sum()) if qc_mode == "full" else params_count
             
             self.update_log(f"[QC 검수] 장비 유형 '{selected_type}' ({mode_text}: {params_count}개 파라미터)에 대한 QC 검수가 완료되었습니다. 총 {len(results)}개의 이슈 발견.")
             
@@ -850,4 +899,8 @@ def add_qc_check_functions_to_class(cls):
     cls.perform_qc_check = perform_qc_check
     cls.show_qc_statistics = show_qc_statistics
     cls.create_pie_chart = create_pie_chart
+    cls._clear_qc_chart_frame = clear_qc_chart_frame
+    cls._on_qc_chart_frame_visible = on_qc_chart_frame_visible
+    cls._draw_qc_pie_chart = draw_qc_pie_chart
+    cls._get_qc_file_sizes = get_qc_file_sizes
     cls.export_qc_results = export_qc_results
@@ -1,28 +1,44 @@
 # 간소화된 QC 검수 보고서 생성 모듈
 
+import csv
+import io
 import os
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 import pandas as pd
+from .qc_utils import QC_EXCEL_ENGINE
+
+
+# 내보내기 결과 컬럼 (헤더, 결과 dict 키)
+RESULT_COLUMNS = [
+    ('파라미터', 'parameter'),
+    ('문제 유형', 'issue_type'),
+    ('상세 설명', 'description'),
+    ('심각도', 'severity'),
+    ('카테고리', 'category'),
+    ('권장사항', 'recommendation')
+]
+
+# CSV 버퍼를 파일에 기록하는 단위 (약 1MB)
+CSV_FLUSH_SIZE = 1 << 20
+
+
+def _result_rows(qc_results: List[Dict]) -> List[List[Any]]:
+    """검수 결과 dict 목록을 내보내기용 행 목록으로 변환"""
+    keys = [key for _, key in RESULT_COLUMNS]
+    return [[result.get(key, '') for key in keys] for result in qc_results]
 
 
 def export_qc_results_to_excel(qc_results: List[Dict], equipment_name: str, 
                               equipment_type: str, file_path: str) -> bool:
     """QC 검수 결과를 Excel 파일로 내보내기"""
     try:
-        # 검수 결과 데이터프레임 생성
-        results_data = []
-        for result in qc_results:
-            results_data.append({
-                '파라미터': result.get('parameter', ''),
-                '문제 유형': result.get('issue_type', ''),
-                '상세 설명': result.get('description', ''),
-                '심각도': result.get('severity', ''),
-                '카테고리': result.get('category', ''),
-                '권장사항': result.get('recommendation', '')
-            })
+        # 검수 결과 데이터프레임 생성 (행 목록에서 한 번에 구성)
+        results_df = pd.DataFrame(_result_rows(qc_results),
+                                  columns=[header for header, _ in RESULT_COLUMNS])
         
-        results_df = pd.DataFrame(results_data)
+        # 심각도별 건수는 결과 컬럼에서 한 번에 집계
+        severity_counts = results_df['심각도'].value_counts()
         
         # 검수 요약 정보
         summary_data = {
@@ -40,15 +56,15 @@ def export_qc_results_to_excel(qc_results: List[Dict], equipment_name: str,
                 equipment_name,
                 equipment_type,
                 len(qc_results),
-                len([r for r in qc_results if r.get('severity') == '높음']),
-                len([r for r in qc_results if r.get('severity') == '중간']),
-                len([r for r in qc_results if r.get('severity') == '낮음'])
+                int(severity_counts.get('높음', 0)),
+                int(severity_counts.get('중간', 0)),
+                int(severity_counts.get('낮음', 0))
             ]
         }
         summary_df = pd.DataFrame(summary_data)
         
         # Excel 파일 생성
-        with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
+        with pd.ExcelWriter(file_path, engine=QC_EXCEL_ENGINE) as writer:
             # 검수 요약 시트
             summary_df.to_excel(writer, sheet_name='검수 요약', index=False)
             
@@ -73,22 +89,19 @@ def export_qc_results_to_csv(qc_results: List[Dict], equipment_name: str,
                             equipment_type: str, file_path: str) -> bool:
     """QC 검수 결과를 CSV 파일로 내보내기"""
     try:
-        # 검수 결과 데이터프레임 생성
-        results_data = []
-        for result in qc_results:
-            results_data.append({
-                '파라미터': result.get('parameter', ''),
-                '문제 유형': result.get('issue_type', ''),
-                '상세 설명': result.get('description', ''),
-                '심각도': result.get('severity', ''),
-                '카테고리': result.get('category', ''),
-                '권장사항': result.get('recommendation', '')
-            })
-        
-        results_df = pd.DataFrame(results_data)
+        # 메모리 버퍼에 기록한 뒤 큰 단위로 파일에 쓰기
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow([header for header, _ in RESULT_COLUMNS])
         
-        # CSV 파일 생성
-        results_df.to_csv(file_path, index=False, encoding='utf-8-sig')
+        with open(file_path, 'w', encoding='utf-8-sig', newline='') as f:
+            for row in _result_rows(qc_results):
+                writer.writerow(row)
+                if buffer.tell() >= CSV_FLUSH_SIZE:
+                    f.write(buffer.getvalue())
+                    buffer.seek(0)
+                    buffer.truncate()
+            f.write(buffer.getvalue())
         
         return True
         
@@ -1,5 +1,7 @@
 # QC 검수 공통 유틸리티 함수들
 
+import csv
+import importlib.util
 import pandas as pd
 import tkinter as tk
 from tkinter import messagebox, filedialog, ttk
@@ -13,7 +15,8 @@ class QCDataProcessor:
     def create_safe_dataframe(data, expected_columns):
         """안전한 데이터프레임 생성"""
         try:
-            df = pd.DataFrame(data, columns=expected_columns)
+            # DB 조회 결과(튜플 목록)는 레코드 형태이므로 from_records로 바로 변환
+            df = pd.DataFrame.from_records(data, columns=expected_columns, coerce_float=False)
             return df, None
         except Exception as e:
             error_msg = f"데이터프레임 생성 오류: {str(e)}\n데이터 형태: {type(data)}"
@@ -61,9 +64,12 @@ class QCDataProcessor:
 class QCFileSelector:
     """QC 검수용 파일 선택 공통 클래스"""
     
+    # 부모 창/최대 파일 수별로 재사용하는 파일 선택 대화상자 상태
+    _dialog_cache = {}
+    
     @staticmethod
     def create_file_selection_dialog(parent_window, uploaded_files, max_files=6):
-        """파일 선택 다이얼로그 생성"""
+        """파일 선택 다이얼로그 표시 - 한 번 만든 대화상자는 숨겨 두었다가 재사용"""
         if not uploaded_files:
             messagebox.showinfo(
                 "파일 선택 안내", 
@@ -72,25 +78,59 @@ class QCFileSelector:
             )
             return None
         
-        # 파일 선택 대화상자 생성
+        cache_key = (str(parent_window), max_files)
+        state = QCFileSelector._dialog_cache.get(cache_key)
+        if state is None or not state['dialog'].winfo_exists():
+            state = QCFileSelector._build_file_dialog(parent_window, max_files)
+            QCFileSelector._dialog_cache[cache_key] = state
+        
+        # 파일 목록만 새로 채움
+        file_names = list(uploaded_files)
+        file_listbox = state['listbox']
+        file_listbox.delete(0, tk.END)
+        file_listbox.insert(tk.END, *file_names)
+        state.update(uploaded_files=uploaded_files, file_names=file_names, selected_files=None)
+        
+        dialog = state['dialog']
+        dialog.deiconify()
+        dialog.lift()
+        dialog.grab_set()
+        
+        # 대화상자가 닫힐(숨겨질) 때까지 대기
+        parent_window.wait_variable(state['closed'])
+        
+        return state['selected_files']
+    
+    @staticmethod
+    def _build_file_dialog(parent_window, max_files):
+        """파일 선택 대화상자 생성 (최초 1회) - 닫을 때는 파괴하지 않고 숨김"""
         dialog = tk.Toplevel(parent_window)
         dialog.title("🔍 QC 검수 파일 선택")
         dialog.geometry("600x500")
         dialog.transient(parent_window)
-        dialog.grab_set()
         dialog.resizable(True, True)
         
-        selected_files = {}
-        file_vars = {}
-        
         # UI 구성
-        QCFileSelector._setup_file_dialog_ui(dialog, uploaded_files, file_vars, max_files)
+        file_listbox = QCFileSelector._setup_file_dialog_ui(dialog, (), max_files)
         
-        # 결과 반환을 위한 변수
-        result = {'selected_files': None}
+        state = {
+            'dialog': dialog,
+            'listbox': file_listbox,
+            'closed': tk.BooleanVar(dialog, value=False),
+            'uploaded_files': {},
+            'file_names': [],
+            'selected_files': None
+        }
+        
+        def close_dialog():
+            dialog.grab_release()
+            dialog.withdraw()
+            state['closed'].set(True)
         
         def apply_selection():
-            selected = {name: uploaded_files[name] for name, var in file_vars.items() if var.get()}
+            file_names = state['file_names']
+            uploaded_files = state['uploaded_files']
+            selected = {file_names[i]: uploaded_files[file_names[i]] for i in file_listbox.curselection()}
             
             if not selected:
                 messagebox.showwarning("선택 필요", "최소 1개의 파일을 선택해주세요.")
@@ -100,63 +140,61 @@ class QCFileSelector:
                 messagebox.showwarning("선택 제한", f"최대 {max_files}개의 파일만 선택할 수 있습니다.")
                 return
             
-            result['selected_files'] = selected
-            dialog.destroy()
-        
-        def cancel_selection():
-            dialog.destroy()
+            state['selected_files'] = selected
+            close_dialog()
         
         # 버튼 프레임
         button_frame = ttk.Frame(dialog)
         button_frame.pack(fill=tk.X, padx=10, pady=10)
         
-        ttk.Button(button_frame, text="취소", command=cancel_selection).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(button_frame, text="취소", command=close_dialog).pack(side=tk.RIGHT, padx=5)
         ttk.Button(button_frame, text="✅ 선택 완료", command=apply_selection).pack(side=tk.RIGHT, padx=5)
         
-        # 대화상자가 닫힐 때까지 대기
-        parent_window.wait_window(dialog)
+        # 창 닫기 버튼도 숨기기로 처리
+        dialog.protocol("WM_DELETE_WINDOW", close_dialog)
         
-        return result['selected_files']
+        return state
     
     @staticmethod
-    def _setup_file_dialog_ui(dialog, uploaded_files, file_vars, max_files):
-        """파일 다이얼로그 UI 설정"""
+    def _setup_file_dialog_ui(dialog, file_names, max_files):
+        """파일 다이얼로그 UI 설정 - 다중 선택 Listbox 하나로 파일 목록 표시"""
         main_frame = ttk.Frame(dialog)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         # 정보 레이블
-        info_label = ttk.Label(main_frame, text=f"QC 검수에 사용할 파일을 선택하세요 (최대 {max_files}개)")
+        info_label = ttk.Label(main_frame, text=f"QC 검수에 사용할 파일을 선택하세요 (최대 {max_files}개, Ctrl/Shift로 다중 선택)")
         info_label.pack(pady=(0, 10))
         
-        # 스크롤 가능한 파일 목록
-        canvas = tk.Canvas(main_frame)
-        scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-        
-        for filename, filepath in uploaded_files.items():
-            file_vars[filename] = tk.BooleanVar()
-            
-            file_frame = ttk.Frame(scrollable_frame)
-            file_frame.pack(fill=tk.X, pady=2)
-            
-            checkbox = ttk.Checkbutton(file_frame, text=filename, variable=file_vars[filename])
-            checkbox.pack(side=tk.LEFT)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        # 스크롤 가능한 파일 목록 (파일 수와 관계없이 위젯 하나)
+        scrollbar = ttk.Scrollbar(main_frame, orient="vertical")
+        file_listbox = tk.Listbox(
+            main_frame, selectmode=tk.EXTENDED, exportselection=False,
+            yscrollcommand=scrollbar.set
         )
+        scrollbar.config(command=file_listbox.yview)
+        if file_names:
+            file_listbox.insert(tk.END, *file_names)
         
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side="left", fill="both", expand=True)
+        file_listbox.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
+        return file_listbox
 
 
 class QCResultExporter:
     """QC 검수 결과 내보내기 공통 클래스"""
     
+    # 내보내기 컬럼명과 결과 키 (컬럼 순서대로)
+    EXPORT_COLUMNS = (
+        ('파라미터명', 'parameter'),
+        ('Default Value', 'default_value'),
+        ('File Value', 'file_value'),
+        ('Pass/Fail', 'pass_fail'),
+        ('Issue Type', 'issue_type'),
+        ('설명', 'description'),
+        ('심각도', 'severity'),
+        ('권장사항', 'recommendation')
+    )
+    
     @staticmethod
     def export_results_to_file(results, default_filename="qc_results"):
         """QC 검수 결과를 파일로 내보내기"""
@@ -175,27 +213,22 @@ class QCResultExporter:
             return False
         
         try:
-            # 결과 데이터 정리
-            export_data = []
-            for result in results:
-                export_data.append({
-                    '파라미터명': result.get('parameter', ''),
-                    'Default Value': result.get('default_value', ''),
-                    'File Value': result.get('file_value', ''),
-                    'Pass/Fail': result.get('pass_fail', ''),
-                    'Issue Type': result.get('issue_type', ''),
-                    '설명': result.get('description', ''),
-                    '심각도': result.get('severity', ''),
-                    '권장사항': result.get('recommendation', '')
-                })
+            # 결과 데이터 정리 (행마다 dict를 만들지 않고 튜플 + 컬럼명으로 구성)
+            keys = [key for _, key in QCResultExporter.EXPORT_COLUMNS]
+            export_data = [tuple(result.get(key, '') for key in keys) for result in results]
             
-            # DataFrame 생성 및 저장
-            df = pd.DataFrame(export_data)
+            column_names = [name for name, _ in QCResultExporter.EXPORT_COLUMNS]
             
             if file_path.endswith('.xlsx'):
-                df.to_excel(file_path, index=False, engine='openpyxl')
+                # Excel은 DataFrame을 거쳐 저장
+                df = pd.DataFrame(export_data, columns=column_names)
+                df.to_excel(file_path, index=False, engine=QC_EXCEL_ENGINE)
             else:
-                df.to_csv(file_path, index=False, encoding='utf-8-sig')
+                # CSV는 DataFrame 없이 행을 바로 기록 (pandas to_csv와 같은 BOM/줄바꿈)
+                with open(file_path, 'w', newline='', encoding='utf-8-sig') as f:
+                    writer = csv.writer(f, lineterminator=os.linesep)
+                    writer.writerow(column_names)
+                    writer.writerows(export_data)
             
             messagebox.showinfo("성공", f"QC 검수 결과가 저장되었습니다.\n{file_path}")
             return True
@@ -261,4 +294,7 @@ QC_ISSUE_TYPES = {
     "completeness": "완전성",
     "accuracy": "정확성",
     "pass": "통과"
-}
\ No newline at end of file
+}
+
+# Excel 저장 엔진 - xlsxwriter가 설치되어 있으면 사용 (셀 객체 모델 없이 바로 기록해 openpyxl보다 빠름)
+QC_EXCEL_ENGINE = 'xlsxwriter' if importlib.util.find_spec('xlsxwriter') else 'openpyxl'
\ No newline at end of file
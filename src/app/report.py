@@ -5,12 +5,17 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from datetime import datetime
 from app.utils import create_treeview_with_scrollbar
 from app.loading import LoadingDialog
 
+
+def _get_chart_modules():
+    """matplotlib은 차트를 그릴 때만 불러옵니다 (앱 시작 시간 단축)."""
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    return plt, FigureCanvasTkAgg
+
 def add_report_functions_to_class(cls):
     """
     DBManager 클래스에 리포트 기능을 추가합니다.
@@ -133,6 +138,7 @@ def add_report_functions_to_class(cls):
 
     def create_summary_chart(self, diff_counts):
         """요약 차트 생성"""
+        plt, FigureCanvasTkAgg = _get_chart_modules()
         fig, ax = plt.subplots(figsize=(8, 5))
 
         files = list(diff_counts.keys())
@@ -249,6 +255,7 @@ def add_report_functions_to_class(cls):
         short_labels = [f[:15] + '...' if len(f) > 15 else f for f in file_labels]
 
         # 차트 생성
+        plt, FigureCanvasTkAgg = _get_chart_modules()
         fig, ax = plt.subplots(figsize=(8, 6))
 
         width = 0.25  # 막대 너비
@@ -375,6 +382,7 @@ def add_report_functions_to_class(cls):
             return
 
         # 1행 2열 서브플롯 생성
+        plt, FigureCanvasTkAgg = _get_chart_modules()
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 5))
 
         # 첫 번째 차트: 파라미터별 Default 값 vs 평균 값
@@ -11,6 +11,10 @@ class DBSchema:
     장비 유형 및 Default DB 값 저장을 위한 테이블 구조를 생성하고 관리합니다.
     컨텍스트 매니저 패턴을 사용하여 데이터베이스 연결을 효율적으로 관리합니다.
     """
+
+    # 데이터 변경 시 증가하는 버전 번호 (조회 결과 캐시 무효화용, 모든 인스턴스 공유)
+    data_version = 0
+
     def __init__(self, db_path=None):
         if db_path is None:
             # 기존 데이터베이스 위치 사용 (프로젝트 루트/data/)
@@ -22,6 +26,26 @@ class DBSchema:
             self.db_path = db_path
         self.create_tables()
 
+    @classmethod
+    def _mark_modified(cls):
+        """데이터 변경 기록 - 캐시된 조회 결과를 무효화합니다"""
+        cls.data_version += 1
+
+    def get_data_stamp(self):
+        """
+        DB 데이터 변경 확인용 값 (조회 결과 캐시 키)
+        이 프로세스의 쓰기 버전과 DB 파일(WAL 파일 포함)의 수정 시각/크기를 조합하므로
+        다른 연결이나 외부 프로세스에서 쓴 변경도 감지됩니다.
+        """
+        stamp = [DBSchema.data_version]
+        for path in (self.db_path, self.db_path + '-wal'):
+            try:
+                stat = os.stat(path)
+                stamp.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp)
+
     @contextmanager
     def get_connection(self, conn_override=None):
         conn_provided = conn_override is not None
@@ -111,6 +135,7 @@ class DBSchema:
                 VALUES (?, ?)
                 ''', (type_name, description))
                 conn.commit()
+                self._mark_modified()
                 return cursor.lastrowid
             except sqlite3.IntegrityError:
                 return None
@@ -152,6 +177,7 @@ class DBSchema:
                 query = f"UPDATE Equipment_Types SET {', '.join(update_fields)} WHERE id = ?"
                 cursor.execute(query, params)
                 conn.commit()
+                self._mark_modified()
                 return cursor.rowcount > 0
             
             return False
@@ -174,6 +200,7 @@ class DBSchema:
                 
                 # 트랜잭션 커밋
                 conn.commit()
+                self._mark_modified()
                 
                 # 삭제된 항목이 있으면 성공
                 return deleted_types > 0
@@ -203,38 +230,40 @@ class DBSchema:
                       occurrence_count, total_files, confidence_score, source_files, description,
                       module_name, part_name, item_type, is_checklist))
                 conn.commit()
+                self._mark_modified()
                 return cursor.lastrowid
             except sqlite3.IntegrityError:
                 return None
 
-    def get_default_values(self, equipment_type_id, checklist_only=False, conn_override=None):
-        """장비 유형별 Default DB 값 조회"""
-        with self.get_connection(conn_override) as conn:
-            cursor = conn.cursor()
-            
-            if checklist_only:
-                cursor.execute('''
+    @staticmethod
+    def _default_values_query(checklist_only=False):
+        """장비 유형별 Default DB 값 조회 SQL"""
+        checklist_filter = "AND d.is_checklist = 1" if checklist_only else ""
+        return f'''
                 SELECT d.id, d.parameter_name, d.default_value, d.min_spec, d.max_spec, e.type_name,
                        d.occurrence_count, d.total_files, d.confidence_score, d.source_files, d.description,
                        d.module_name, d.part_name, d.item_type, d.is_checklist
                 FROM Default_DB_Values d
                 JOIN Equipment_Types e ON d.equipment_type_id = e.id
-                WHERE d.equipment_type_id = ? AND d.is_checklist = 1
+                WHERE d.equipment_type_id = ? {checklist_filter}
                 ORDER BY d.parameter_name
-                ''', (equipment_type_id,))
-            else:
-                cursor.execute('''
-                SELECT d.id, d.parameter_name, d.default_value, d.min_spec, d.max_spec, e.type_name,
-                       d.occurrence_count, d.total_files, d.confidence_score, d.source_files, d.description,
-                       d.module_name, d.part_name, d.item_type, d.is_checklist
-                FROM Default_DB_Values d
-                JOIN Equipment_Types e ON d.equipment_type_id = e.id
-                WHERE d.equipment_type_id = ?
-                ORDER BY d.parameter_name
-                ''', (equipment_type_id,))
-            
+                '''
+
+    def get_default_values(self, equipment_type_id, checklist_only=False, conn_override=None):
+        """장비 유형별 Default DB 값 조회"""
+        with self.get_connection(conn_override) as conn:
+            cursor = conn.cursor()
+            cursor.execute(self._default_values_query(checklist_only), (equipment_type_id,))
             return cursor.fetchall()
 
+    def get_default_values_df(self, equipment_type_id, checklist_only=False, conn_override=None):
+        """장비 유형별 Default DB 값을 DataFrame으로 조회 (튜플 목록을 거치지 않고 바로 생성)"""
+        import pandas as pd
+
+        with self.get_connection(conn_override) as conn:
+            return pd.read_sql_query(self._default_values_query(checklist_only), conn,
+                                     params=(equipment_type_id,), coerce_float=False)
+
     def update_default_value(self, value_id, **kwargs):
         """Default DB 값 업데이트"""
         with self.get_connection() as conn:
@@ -262,6 +291,7 @@ class DBSchema:
                 query = f"UPDATE Default_DB_Values SET {', '.join(update_fields)} WHERE id = ?"
                 cursor.execute(query, params)
                 conn.commit()
+                self._mark_modified()
                 return cursor.rowcount > 0
             
             return False
@@ -272,6 +302,7 @@ class DBSchema:
             cursor = conn.cursor()
             cursor.execute('DELETE FROM Default_DB_Values WHERE id = ?', (value_id,))
             conn.commit()
+            self._mark_modified()
             return cursor.rowcount > 0
 
 
@@ -342,6 +373,7 @@ class DBSchema:
             WHERE id = ?
             ''', (1 if is_performance else 0, parameter_id))
             conn.commit()
+            self._mark_modified()
             return cursor.rowcount > 0
 
     # ==================== 유틸리티 메서드 ====================
@@ -5,11 +5,16 @@
 
 import os
 import tkinter as tk
+from collections import Counter
 from tkinter import messagebox
 import pandas as pd
 import numpy as np
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional, Any
+from .utils import insert_treeview_rows, detached_widget
+
+# 이 건수를 넘는 결과는 트리뷰를 화면에서 내린 상태로 삽입
+_DETACHED_INSERT_THRESHOLD = 1000
 
 class SimplifiedQCSystem:
     """간소화된 QC 검수 시스템"""
@@ -57,8 +62,9 @@ class SimplifiedQCSystem:
             # 3. 간소화된 QC 검수 실행
             qc_results = self._run_basic_qc_checks(df, mode)
             
-            # 4. 결과 종합
-            result_summary = self._summarize_qc_results(qc_results, mode)
+            # 4. 결과 종합 (심각도/이슈 유형 집계는 결과 1회 순회로 공유)
+            counts = self._count_qc_results(qc_results)
+            result_summary = self._summarize_qc_results(qc_results, mode, counts)
             
             self.update_log(f"✅ QC 검수 완료 - 총 {len(qc_results)}개 항목 검사")
             
@@ -68,7 +74,7 @@ class SimplifiedQCSystem:
                 'mode': mode,
                 'summary': result_summary,
                 'detailed_results': qc_results,
-                'recommendations': self._generate_recommendations(qc_results, mode)
+                'recommendations': self._generate_recommendations(qc_results, mode, counts)
             }
             
         except Exception as e:
@@ -184,14 +190,22 @@ class SimplifiedQCSystem:
         
         return issues
     
-    def _summarize_qc_results(self, results: List[Dict], mode: str) -> Dict:
-        """QC 결과 요약"""
-        total_issues = len(results)
-        severity_counts = {'높음': 0, '중간': 0, '낮음': 0}
+    def _count_qc_results(self, results: List[Dict]) -> Tuple[Counter, Counter]:
+        """심각도별/이슈 유형별 건수 집계 (결과 1회 순회)"""
+        severity_counts = Counter({'높음': 0, '중간': 0, '낮음': 0})
+        issue_type_counts = Counter()
         
         for result in results:
-            severity = result.get('severity', '낮음')
-            severity_counts[severity] = severity_counts.get(severity, 0) + 1
+            severity_counts[result.get('severity', '낮음')] += 1
+            issue_type_counts[result.get('issue_type')] += 1
+        
+        return severity_counts, issue_type_counts
+    
+    def _summarize_qc_results(self, results: List[Dict], mode: str,
+                              counts: Optional[Tuple[Counter, Counter]] = None) -> Dict:
+        """QC 결과 요약"""
+        total_issues = len(results)
+        severity_counts, _ = counts or self._count_qc_results(results)
         
         # 전체 상태 판정
         if severity_counts['높음'] > 0:
@@ -210,25 +224,24 @@ class SimplifiedQCSystem:
             'mode': mode
         }
     
-    def _generate_recommendations(self, results: List[Dict], mode: str) -> List[str]:
+    def _generate_recommendations(self, results: List[Dict], mode: str,
+                                  counts: Optional[Tuple[Counter, Counter]] = None) -> List[str]:
         """개선 권장사항 생성"""
         recommendations = []
+        severity_counts, issue_type_counts = counts or self._count_qc_results(results)
         
-        high_severity_count = sum(1 for r in results if r.get('severity') == '높음')
+        high_severity_count = severity_counts['높음']
         
         if high_severity_count > 0:
             recommendations.append(f"⚠️ {high_severity_count}개의 높은 심각도 이슈가 발견되었습니다. 즉시 검토가 필요합니다.")
         
-        spec_issues = [r for r in results if r.get('issue_type') == 'Spec Out']
-        if spec_issues:
+        if issue_type_counts['Spec Out']:
             recommendations.append("🎯 스펙 범위를 벗어난 파라미터들의 기본값을 조정하세요.")
         
-        missing_data_issues = [r for r in results if r.get('issue_type') == 'Missing Data']
-        if missing_data_issues:
+        if issue_type_counts['Missing Data']:
             recommendations.append("📝 누락된 데이터를 확인하고 보완하세요.")
         
-        critical_issues = [r for r in results if r.get('issue_type') == 'Critical Parameter']
-        if critical_issues:
+        if issue_type_counts['Critical Parameter']:
             recommendations.append("⭐ 중요 파라미터의 발생 빈도를 점검하세요.")
         
         if mode == "checklist_only" and not results:
@@ -291,21 +304,23 @@ def _display_qc_results(manager_instance, result: Dict):
     if not hasattr(manager_instance, 'qc_result_tree'):
         return
     
-    # 기존 결과 지우기
-    for item in manager_instance.qc_result_tree.get_children():
-        manager_instance.qc_result_tree.delete(item)
+    # 기존 결과 지우기 (한 번의 delete 호출, Enhanced QC 내보내기용 결과 캐시도 무효화)
+    result_tree = manager_instance.qc_result_tree
+    result_tree.delete(*result_tree.get_children())
+    manager_instance._last_qc_results = None
     
-    # 새 결과 표시
-    for qc_result in result['detailed_results']:
-        manager_instance.qc_result_tree.insert(
-            "", "end",
-            values=(
-                qc_result.get('parameter', ''),
-                qc_result.get('issue_type', ''),
-                qc_result.get('description', ''),
-                qc_result.get('severity', '')
-            )
-        )
+    # 새 결과 표시 - 행 값을 먼저 만든 뒤 한 번에 삽입
+    rows = [(
+        qc_result.get('parameter', ''),
+        qc_result.get('issue_type', ''),
+        qc_result.get('description', ''),
+        qc_result.get('severity', '')
+    ) for qc_result in result['detailed_results']]
+    if len(rows) > _DETACHED_INSERT_THRESHOLD:
+        with detached_widget(result_tree):
+            insert_treeview_rows(result_tree, rows)
+    else:
+        insert_treeview_rows(result_tree, rows)
     
     # 요약 정보 표시 (stats_frame이 있는 경우)
     if hasattr(manager_instance, 'stats_frame'):
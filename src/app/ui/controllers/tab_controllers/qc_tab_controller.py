@@ -13,7 +13,10 @@ from ..base_controller import TabController
 from ...components.treeview_component import TreeViewComponent
 from ...components.toolbar_component import ToolbarComponent
 from ...components.filter_component import FilterComponent
-from app.utils import create_treeview_with_scrollbar
+from app.utils import create_treeview_with_scrollbar, insert_treeview_rows, detached_widget
+
+# 이 행 수를 넘으면 삽입하는 동안 트리뷰를 화면에서 내려 레이아웃 재계산을 한 번으로 줄임
+_DETACHED_INSERT_THRESHOLD = 1000
 
 
 class QCTabController(TabController):
@@ -471,18 +474,21 @@ class QCTabController(TabController):
 
     def _display_qc_results(self):
         """QC 결과 표시 - 단순화됨"""
-        # 기존 결과 삭제
-        for item in self.result_tree.get_children():
-            self.result_tree.delete(item)
+        # 기존 결과 삭제 (한 번의 delete 호출)
+        self.result_tree.delete(*self.result_tree.get_children())
         
         # 결과 표시
-        for result in self.qc_results:
-            self.result_tree.insert("", "end", values=(
-                result.get("parameter", ""),
-                result.get("issue_type", ""),
-                result.get("description", ""),
-                result.get("severity", "낮음")
-            ))
+        rows = [(
+            result.get("parameter", ""),
+            result.get("issue_type", ""),
+            result.get("description", ""),
+            result.get("severity", "낮음")
+        ) for result in self.qc_results]
+        if len(rows) > _DETACHED_INSERT_THRESHOLD:
+            with detached_widget(self.result_tree):
+                insert_treeview_rows(self.result_tree, rows)
+        else:
+            insert_treeview_rows(self.result_tree, rows)
 
     def _on_result_selected(self, event=None):
         """검수 결과 선택 이벤트"""
@@ -8,8 +8,13 @@ import tkinter as tk
 from tkinter import messagebox
 import pandas as pd
 import numpy as np
+from collections import Counter
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional, Any
+from .utils import insert_treeview_rows, detached_widget
+
+# 이 건수를 넘는 결과는 트리뷰를 화면에서 내린 상태로 삽입
+_DETACHED_INSERT_THRESHOLD = 1000
 
 class UnifiedQCSystem:
     """통합 QC 검수 시스템 - 단일 진입점 (간소화)"""
@@ -68,7 +73,8 @@ class UnifiedQCSystem:
                 'mode': mode,
                 'summary': result_summary,
                 'detailed_results': qc_results,
-                'recommendations': self._generate_recommendations(qc_results, mode)
+                'recommendations': self._generate_recommendations(
+                    qc_results, mode, result_summary['high_severity'])
             }
             
         except Exception as e:
@@ -188,11 +194,9 @@ class UnifiedQCSystem:
     def _summarize_qc_results(self, results: List[Dict], mode: str) -> Dict:
         """QC 결과 요약"""
         total_issues = len(results)
-        severity_counts = {'높음': 0, '중간': 0, '낮음': 0}
-        
-        for result in results:
-            severity = result.get('severity', '낮음')
-            severity_counts[severity] = severity_counts.get(severity, 0) + 1
+        # 심각도별 건수를 한 번의 순회로 집계
+        severity_counts = Counter({'높음': 0, '중간': 0, '낮음': 0})
+        severity_counts.update(result.get('severity', '낮음') for result in results)
         
         # 전체 상태 판정
         if severity_counts['높음'] > 0:
@@ -211,18 +215,19 @@ class UnifiedQCSystem:
             'mode': mode
         }
     
-    def _generate_recommendations(self, results: List[Dict], mode: str) -> List[str]:
-        """개선 권장사항 생성"""
+    def _generate_recommendations(self, results: List[Dict], mode: str,
+                                  high_severity_count: Optional[int] = None) -> List[str]:
+        """개선 권장사항 생성 (요약에서 집계한 높은 심각도 건수가 있으면 재사용)"""
         recommendations = []
         
-        high_severity_count = sum(1 for r in results if r.get('severity') == '높음')
+        if high_severity_count is None:
+            high_severity_count = sum(1 for r in results if r.get('severity') == '높음')
         
         if high_severity_count > 0:
             recommendations.append(f"⚠️ {high_severity_count}개의 높은 심각도 이슈가 발견되었습니다. 즉시 검토가 필요합니다.")
         
         
-        spec_issues = [r for r in results if r.get('issue_type') == 'Spec Out']
-        if spec_issues:
+        if any(r.get('issue_type') == 'Spec Out' for r in results):
             recommendations.append("🎯 스펙 범위를 벗어난 파라미터들의 기본값을 조정하세요.")
         
         if mode == "checklist_only" and not results:
@@ -289,21 +294,23 @@ def _display_qc_results(manager_instance, result: Dict):
     if not hasattr(manager_instance, 'qc_result_tree'):
         return
     
-    # 기존 결과 지우기
-    for item in manager_instance.qc_result_tree.get_children():
-        manager_instance.qc_result_tree.delete(item)
+    # 기존 결과 지우기 (한 번의 delete 호출, Enhanced QC 내보내기용 결과 캐시도 무효화)
+    result_tree = manager_instance.qc_result_tree
+    result_tree.delete(*result_tree.get_children())
+    manager_instance._last_qc_results = None
     
-    # 새 결과 표시
-    for qc_result in result['detailed_results']:
-        manager_instance.qc_result_tree.insert(
-            "", "end",
-            values=(
-                qc_result.get('parameter', ''),
-                qc_result.get('issue_type', ''),
-                qc_result.get('description', ''),
-                qc_result.get('severity', '')
-            )
-        )
+    # 새 결과 표시 - 행 값을 먼저 만든 뒤 한 번에 삽입
+    rows = [(
+        qc_result.get('parameter', ''),
+        qc_result.get('issue_type', ''),
+        qc_result.get('description', ''),
+        qc_result.get('severity', '')
+    ) for qc_result in result['detailed_results']]
+    if len(rows) > _DETACHED_INSERT_THRESHOLD:
+        with detached_widget(result_tree):
+            insert_treeview_rows(result_tree, rows)
+    else:
+        insert_treeview_rows(result_tree, rows)
     
     # 요약 정보 표시 (stats_frame이 있는 경우)
     if hasattr(manager_instance, 'stats_frame'):
@@ -7,6 +7,7 @@ from tkinter import ttk, filedialog, messagebox
 import pandas as pd
 import numpy as np
 import sqlite3
+from contextlib import contextmanager
 from datetime import datetime
 
 # 새로운 헬퍼 모듈들 임포트 (호환성 체크)
@@ -64,6 +65,252 @@ def create_treeview_with_scrollbar(parent, columns, headings, column_widths=None
         
         return frame, treeview
 
+def insert_treeview_rows(treeview, rows, tags=None):
+    """
+    여러 행을 트리뷰 끝에 한 번에 삽입합니다.
+    Treeview.insert의 옵션 변환을 거치지 않고 Tcl insert 명령을 직접 호출합니다.
+    """
+    call = treeview.tk.call
+    path = treeview._w
+    if tags is None:
+        for values in rows:
+            call(path, 'insert', '', 'end', '-values', values)
+    else:
+        for values, tag in zip(rows, tags):
+            call(path, 'insert', '', 'end', '-values', values, '-tags', tag)
+
+@contextmanager
+def detached_widget(widget):
+    """
+    블록 동안 위젯을 화면 배치에서 잠시 내려 두고, 끝나면 같은 배치 옵션으로 복원합니다.
+    대량 삽입 중 행마다/배치마다 발생하는 레이아웃 계산과 다시 그리기를 한 번으로 줄입니다.
+    세로 스크롤바 연결(yscrollcommand)도 블록 동안 끊어 두어 삽입마다 스크롤바가 갱신되지 않게 합니다.
+    """
+    scroll_command = None
+    if 'yscrollcommand' in widget.keys():
+        scroll_command = widget.cget('yscrollcommand')
+        if scroll_command:
+            widget.configure(yscrollcommand='')
+    manager = widget.winfo_manager()
+    pack_info = None
+    if manager == 'pack':
+        pack_info = widget.pack_info()
+        widget.pack_forget()
+    elif manager == 'grid':
+        widget.grid_remove()
+    try:
+        yield widget
+    finally:
+        if scroll_command:
+            widget.configure(yscrollcommand=scroll_command)
+        if pack_info is not None:
+            widget.pack(**pack_info)
+        elif manager == 'grid':
+            widget.grid()
+
+class VirtualTreeview(ttk.Treeview):
+    """
+    행 데이터는 Python 목록으로 보관하고 화면에 보이는 행만 Treeview 항목으로 만드는 트리뷰입니다.
+    행 수와 관계없이 Tk 항목은 화면 크기만큼만 유지됩니다.
+    계층 없는 목록 전용이며, 각 항목의 iid는 virtual_rows에서의 행 인덱스입니다.
+    선택 상태는 행 인덱스 집합으로 보관하므로 화면 밖으로 스크롤된 행도 선택이 유지됩니다.
+    """
+    # 키보드 이동 키 - Tk 기본 동작은 만들어진 항목 안에서만 움직이므로 전체 행 기준으로 직접 처리
+    _NAV_KEYS = ('<Up>', '<Down>', '<Prior>', '<Next>', '<Home>', '<End>')
+    # Shift/Control 수정 키 (event.state 비트)
+    _EXTEND_STATE_MASK = 0x0001 | 0x0004
+
+    def __init__(self, master=None, **kw):
+        self.virtual_rows = []
+        self._first = 0
+        self._selected_rows = set()
+        self._focus_row = None
+        self._extend_selection = False
+        # 실제 행 높이와 첫 행 위치(헤딩 높이)는 그려진 항목의 bbox로 측정
+        self._row_height = None
+        self._rows_top = 0
+        self._scroll_set = kw.pop('yscrollcommand', None) or kw.pop('yscroll', None)
+        super().__init__(master, **kw)
+        self._style = ttk.Style(self)
+        self.bind('<Configure>', self._on_virtual_configure, add='+')
+        self.bind('<<TreeviewSelect>>', self._on_virtual_select, add='+')
+        self.bind('<ButtonPress-1>', self._on_virtual_press, add='+')
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.bind(sequence, self._on_virtual_wheel)
+        for sequence in self._NAV_KEYS:
+            self.bind(sequence, self._on_virtual_key)
+
+    def configure(self, cnf=None, **kw):
+        # 세로 스크롤바는 Tk 항목이 아닌 전체 행 기준으로 직접 갱신
+        if isinstance(cnf, str) or (cnf is None and not kw):
+            return super().configure(cnf, **kw)
+        kw = dict(cnf or {}, **kw)
+        scroll_keys = [key for key in ('yscrollcommand', 'yscroll') if key in kw]
+        for key in scroll_keys:
+            self._scroll_set = kw.pop(key) or None
+        result = super().configure(**kw) if kw else None
+        if scroll_keys:
+            self._update_virtual_scrollbar()
+        return result
+
+    config = configure
+
+    def set_rows(self, rows):
+        """표시할 전체 행을 교체하고 맨 위부터 표시 (선택 초기화)"""
+        self.virtual_rows = list(rows)
+        self._first = 0
+        self._selected_rows = set()
+        self._focus_row = None
+        self._render_virtual_rows()
+
+    def selected_rows(self):
+        """화면 밖 행을 포함해 선택된 행 데이터 목록 (행 순서)"""
+        rows = self.virtual_rows
+        return [rows[index] for index in sorted(self._selected_rows) if index < len(rows)]
+
+    def yview(self, *args):
+        total = len(self.virtual_rows)
+        if not args:
+            if not total:
+                return (0.0, 1.0)
+            return (self._first / total, min(total, self._first + self._page_size()) / total)
+        if args[0] == 'moveto':
+            self._first = int(float(args[1]) * total)
+        elif args[0] == 'scroll':
+            step = self._page_size() if args[2].startswith('page') else 1
+            self._first += int(args[1]) * step
+        self._render_virtual_rows()
+
+    def yview_moveto(self, fraction):
+        self.yview('moveto', fraction)
+
+    def yview_scroll(self, number, what):
+        self.yview('scroll', number, what)
+
+    def see(self, item):
+        """행 인덱스(iid)가 화면에 보이도록 전체 행 기준으로 스크롤"""
+        try:
+            index = int(item)
+        except (TypeError, ValueError):
+            return super().see(item)
+        if 0 <= index < len(self.virtual_rows):
+            self._scroll_to_row(index)
+            self._render_virtual_rows()
+
+    def _page_size(self):
+        """현재 높이에 온전히 들어가는 행 수"""
+        height = self.winfo_height()
+        if height <= 1:
+            # 아직 화면에 배치되기 전이면 height 옵션(행 수) 사용
+            return max(1, int(self.cget('height') or 10))
+        if self._row_height:
+            return max(1, (height - self._rows_top) // self._row_height)
+        # 측정 전에는 스타일의 rowheight로 추정 (헤딩 한 줄 제외)
+        rowheight = self._style.lookup(self.cget('style') or 'Treeview', 'rowheight')
+        try:
+            rowheight = int(rowheight)
+        except (TypeError, ValueError):
+            rowheight = 20
+        return max(1, height // max(1, rowheight) - 1)
+
+    def _measure_virtual_rows(self, iid):
+        """그려진 항목의 bbox로 행 높이/첫 행 위치 측정 - 값이 바뀌었으면 True"""
+        bbox = self.bbox(iid)
+        if not bbox:
+            return False
+        rows_top, row_height = bbox[1], bbox[3]
+        if row_height <= 0 or (rows_top, row_height) == (self._rows_top, self._row_height):
+            return False
+        self._rows_top, self._row_height = rows_top, row_height
+        return True
+
+    def _scroll_to_row(self, index):
+        """index 행이 화면 안에 들어오도록 첫 행 위치 조정"""
+        page = self._page_size()
+        if index < self._first:
+            self._first = index
+        elif index >= self._first + page:
+            self._first = index - page + 1
+
+    def _render_virtual_rows(self, remeasure=True):
+        total = len(self.virtual_rows)
+        page = self._page_size()
+        # 마지막 행까지 온전히 보이도록 제한하고, 아래쪽 일부만 보이는 행까지 한 줄 더 만듦
+        self._first = max(0, min(self._first, total - page))
+        self.delete(*self.get_children())
+        call = self.tk.call
+        path = self._w
+        rows = self.virtual_rows
+        visible = range(self._first, min(total, self._first + page + 1))
+        for index in visible:
+            call(path, 'insert', '', 'end', '-id', index, '-values', rows[index])
+        if visible and remeasure and self._measure_virtual_rows(self._first) and self._page_size() != page:
+            # 실제 행 높이가 추정과 달라 화면에 들어가는 행 수가 바뀌면 한 번 더 그림
+            self._render_virtual_rows(remeasure=False)
+            return
+        selected = [index for index in visible if index in self._selected_rows]
+        if selected:
+            self.selection_set(selected)
+        if self._focus_row in visible:
+            self.focus(self._focus_row)
+        self._update_virtual_scrollbar()
+
+    def _update_virtual_scrollbar(self):
+        if self._scroll_set:
+            self._scroll_set(*self.yview())
+
+    def _on_virtual_configure(self, event=None):
+        self._render_virtual_rows()
+
+    def _on_virtual_press(self, event):
+        # 클릭 선택이 기존 선택에 더해지는지(Shift/Control) 기록
+        self._extend_selection = bool(event.state & self._EXTEND_STATE_MASK)
+
+    def _on_virtual_select(self, event=None):
+        """화면에서 바뀐 선택을 행 인덱스 집합에 반영 (다시 그리면서 복원한 선택은 무시)"""
+        rendered = {int(iid) for iid in self.get_children()}
+        current = {int(iid) for iid in self.selection()}
+        if current == self._selected_rows & rendered:
+            return
+        if self._extend_selection:
+            self._selected_rows = (self._selected_rows - rendered) | current
+        else:
+            self._selected_rows = current
+        focus = self.focus()
+        if focus != '':
+            self._focus_row = int(focus)
+
+    def _on_virtual_key(self, event):
+        total = len(self.virtual_rows)
+        if not total:
+            return "break"
+        current = self._focus_row if self._focus_row is not None else self._first
+        page = self._page_size()
+        target = {
+            'Up': current - 1,
+            'Down': current + 1,
+            'Prior': current - page,
+            'Next': current + page,
+            'Home': 0,
+            'End': total - 1,
+        }.get(event.keysym, current)
+        target = max(0, min(target, total - 1))
+        self._focus_row = target
+        self._selected_rows = {target}
+        self._scroll_to_row(target)
+        self._render_virtual_rows()
+        return "break"
+
+    def _on_virtual_wheel(self, event):
+        if event.num == 4:
+            units = -3
+        elif event.num == 5:
+            units = 3
+        else:
+            units = -3 if event.delta > 0 else 3
+        self.yview('scroll', units, 'units')
+        return "break"
+
 def create_label_entry_pair(parent, label_text, row=0, column=0, initial_value=""):
     """
     레이블과 입력 필드 쌍을 생성합니다.
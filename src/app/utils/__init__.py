@@ -25,6 +25,9 @@ def _import_from_utils_module():
 try:
     _utils_module = _import_from_utils_module()
     create_treeview_with_scrollbar = _utils_module.create_treeview_with_scrollbar
+    insert_treeview_rows = _utils_module.insert_treeview_rows
+    detached_widget = _utils_module.detached_widget
+    VirtualTreeview = _utils_module.VirtualTreeview
     create_label_entry_pair = _utils_module.create_label_entry_pair
     format_num_value = _utils_module.format_num_value
     verify_password = _utils_module.verify_password
@@ -33,6 +36,12 @@ except Exception as e:
     # 폴백: 기본 구현으로 대체
     def create_treeview_with_scrollbar(*args, **kwargs):
         raise ImportError(f"utils 함수를 로드할 수 없습니다: {e}")
+    def insert_treeview_rows(*args, **kwargs):
+        raise ImportError(f"utils 함수를 로드할 수 없습니다: {e}")
+    def detached_widget(*args, **kwargs):
+        raise ImportError(f"utils 함수를 로드할 수 없습니다: {e}")
+    def VirtualTreeview(*args, **kwargs):
+        raise ImportError(f"utils 함수를 로드할 수 없습니다: {e}")
     def create_label_entry_pair(*args, **kwargs):
         raise ImportError(f"utils 함수를 로드할 수 없습니다: {e}")
     def format_num_value(*args, **kwargs):
@@ -53,6 +62,9 @@ from .help_utils import (
 __all__ = [
     # 기존 utils.py 함수들
     'create_treeview_with_scrollbar',
+    'insert_treeview_rows',
+    'detached_widget',
+    'VirtualTreeview',
     'create_label_entry_pair', 
     'format_num_value',
     'verify_password',
@@ -0,0 +1,187 @@
+"""
+비교 뷰 데이터 유틸리티 테스트
+pivot_item_values / item_value_diff_mask 결과를 기존 그룹별 비교 방식과 대조
+"""
+
+import unittest
+import sys
+import os
+import time
+import random
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+# 경로 설정
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from app import data_utils
+from app.data_utils import pivot_item_values, item_value_diff_mask
+
+try:
+    import numba  # noqa: F401
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+KEY_COLUMNS = ["Module", "Part", "ItemName"]
+COLUMNS = KEY_COLUMNS + ["Model", "ItemValue"]
+
+
+def legacy_compare(merged_df, file_names):
+    """기존 방식: 항목별로 그룹화하고 파일마다 첫 번째 값을 모아 빈 값('-')을 제외하고 비교"""
+    rows = []
+    for key, group in merged_df.groupby(KEY_COLUMNS, observed=True):
+        values = []
+        for file_name in file_names:
+            model_data = group[group["Model"] == file_name]
+            values.append(str(model_data["ItemValue"].iloc[0]) if not model_data.empty else "-")
+        non_empty_values = set(v for v in values if v != "-")
+        rows.append((key, values, len(non_empty_values) > 1))
+    return rows
+
+
+def pivot_compare(merged_df, file_names, kernel=None):
+    """pivot + 차이 마스크 결과를 legacy_compare와 같은 형태로 변환"""
+    with mock.patch.object(data_utils, '_get_diff_kernel', return_value=kernel):
+        pivot = pivot_item_values(merged_df, file_names)
+        mask = item_value_diff_mask(pivot)
+    return [(key, list(values), bool(diff)) for key, values, diff in zip(
+        pivot.index.tolist(), pivot.itertuples(index=False, name=None), mask.tolist())]
+
+
+def make_df(rows, categorical=False):
+    df = pd.DataFrame(rows, columns=COLUMNS)
+    if categorical:
+        df = df.astype({col: "category" for col in KEY_COLUMNS + ["Model"]})
+    return df
+
+
+class TestPivotItemValues(unittest.TestCase):
+    """항목별 파일 값 pivot 테스트"""
+
+    def test_missing_file_value_filled(self):
+        """파일에 없는 항목은 '-'로 채움"""
+        df = make_df([
+            ("M", "P", "a", "F1", "1"),
+            ("M", "P", "a", "F2", "2"),
+            ("M", "P", "b", "F1", "3"),
+        ])
+        pivot = pivot_item_values(df, ["F1", "F2"])
+        self.assertEqual(list(pivot.columns), ["F1", "F2"])
+        self.assertEqual(pivot.loc[("M", "P", "b")].tolist(), ["3", "-"])
+
+    def test_duplicate_rows_keep_first_value(self):
+        """같은 파일에 같은 항목이 여러 번 있으면 첫 번째 값 사용"""
+        df = make_df([
+            ("M", "P", "a", "F1", "1"),
+            ("M", "P", "a", "F1", "9"),
+            ("M", "P", "a", "F2", "1"),
+        ])
+        self.assertEqual(pivot_compare(df, ["F1", "F2"]), legacy_compare(df, ["F1", "F2"]))
+        self.assertEqual(pivot_item_values(df, ["F1", "F2"]).iloc[0].tolist(), ["1", "1"])
+
+    def test_non_string_values_compared_as_text(self):
+        """숫자 값도 문자열로 변환해 비교"""
+        df = make_df([
+            ("M", "P", "a", "F1", 1.5),
+            ("M", "P", "a", "F2", "1.5"),
+        ])
+        self.assertEqual(pivot_compare(df, ["F1", "F2"]), [(("M", "P", "a"), ["1.5", "1.5"], False)])
+
+
+class TestItemValueDiffMask(unittest.TestCase):
+    """차이 여부 마스크 테스트 (NumPy 경로와 커널 경로)"""
+
+    def kernels(self):
+        """검사할 커널 목록 - NumPy 경로(None), Python 커널, 설치된 경우 numba 커널"""
+        kernels = [None, data_utils._any_value_diff]
+        if HAS_NUMBA:
+            kernels.append(data_utils._compile_diff_kernel())
+        return kernels
+
+    def test_missing_marker_ignored(self):
+        """'-' 값은 비교에서 제외"""
+        df = make_df([
+            ("M", "P", "a", "F1", "1"), ("M", "P", "a", "F2", "-"), ("M", "P", "a", "F3", "1"),
+            ("M", "P", "b", "F1", "-"), ("M", "P", "b", "F2", "2"), ("M", "P", "b", "F3", "3"),
+            ("M", "P", "c", "F1", "-"), ("M", "P", "c", "F2", "-"),
+        ])
+        for kernel in self.kernels():
+            with self.subTest(kernel=kernel):
+                result = pivot_compare(df, ["F1", "F2", "F3"], kernel)
+                self.assertEqual([diff for _, _, diff in result], [False, True, False])
+                self.assertEqual(result, legacy_compare(df, ["F1", "F2", "F3"]))
+
+    def test_single_file_has_no_difference(self):
+        """파일이 하나면 차이 없음"""
+        df = make_df([("M", "P", "a", "F1", "1"), ("M", "P", "b", "F1", "2")])
+        for kernel in self.kernels():
+            with self.subTest(kernel=kernel):
+                result = pivot_compare(df, ["F1"], kernel)
+                self.assertEqual([diff for _, _, diff in result], [False, False])
+                self.assertEqual(result, legacy_compare(df, ["F1"]))
+
+    def test_empty_pivot(self):
+        """항목이 없으면 빈 마스크"""
+        df = make_df([])
+        for kernel in self.kernels():
+            with self.subTest(kernel=kernel):
+                self.assertEqual(pivot_compare(df, ["F1", "F2"], kernel), [])
+
+    def test_matches_legacy_on_random_data(self):
+        """무작위 데이터(중복 행, 빈 값, 범주형 키 포함)에서 기존 방식과 동일"""
+        for seed in range(20):
+            rng = random.Random(seed)
+            file_names = [f"F{i}" for i in range(rng.randint(1, 5))]
+            rows = [(
+                rng.choice("ABC"), rng.choice(["p1", "p2"]), f"i{rng.randint(0, 30)}",
+                rng.choice(file_names + ["X"]), rng.choice(["1", "2", "-", None, 3.5, "a"])
+            ) for _ in range(rng.randint(0, 200))]
+            for categorical in (False, True):
+                df = make_df(rows, categorical)
+                expected = legacy_compare(df, file_names)
+                for kernel in self.kernels():
+                    with self.subTest(seed=seed, categorical=categorical, kernel=kernel):
+                        self.assertEqual(pivot_compare(df, file_names, kernel), expected)
+
+
+class TestDiffKernelLoading(unittest.TestCase):
+    """numba 커널 준비 테스트"""
+
+    def setUp(self):
+        self._saved_kernel = data_utils._diff_kernel
+        data_utils._diff_kernel = None
+
+    def tearDown(self):
+        data_utils._diff_kernel = self._saved_kernel
+
+    def test_first_call_does_not_wait_for_compile(self):
+        """첫 호출은 컴파일을 기다리지 않고 None 반환 (NumPy 경로 사용)"""
+        with mock.patch.object(data_utils, '_warm_diff_kernel'):
+            self.assertIsNone(data_utils._get_diff_kernel())
+            self.assertIsNone(data_utils._get_diff_kernel())
+
+    @unittest.skipUnless(HAS_NUMBA, "numba가 설치되어 있지 않음")
+    def test_kernel_ready_after_background_compile(self):
+        """백그라운드 컴파일이 끝나면 numba 커널 사용"""
+        data_utils._get_diff_kernel()
+        deadline = time.monotonic() + 120
+        while data_utils._get_diff_kernel() is None and time.monotonic() < deadline:
+            time.sleep(0.05)
+        kernel = data_utils._get_diff_kernel()
+        self.assertIsNotNone(kernel)
+        out = np.zeros(2, dtype=np.bool_)
+        kernel(np.array([[0, -1, 0], [-1, 1, 2]], dtype=np.int32), out)
+        self.assertEqual(out.tolist(), [False, True])
+
+    @unittest.skipIf(HAS_NUMBA, "numba가 설치되어 있음")
+    def test_without_numba_compile_returns_none(self):
+        """numba가 없으면 커널 없이 NumPy 경로 사용"""
+        self.assertIsNone(data_utils._compile_diff_kernel())
+
+
+if __name__ == '__main__':
+    unittest.main()